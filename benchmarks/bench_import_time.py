@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+# Copyright FMR LLC <opensource@fidelity.com>
+# SPDX-License-Identifier: Apache-2.0
+
+"""Measures the startup (import) time of spock in fresh interpreters
+
+Each statement is timed in a new python process so nothing is already imported. The
+pkg_resources import is timed on its own to show what spock no longer pays at import.
+The slowest imports of `import spock` are listed from `python -X importtime` and the
+run fails if any of the lazily imported dependencies are pulled in at import time
+
+Usage:
+    python benchmarks/bench_import_time.py [--repeats 10] [--top 15]
+
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import List, Tuple
+
+STATEMENTS = {
+    "import spock": "import spock",
+    "import pkg_resources": "import pkg_resources",
+    "spock.utils.get_packages()": "import spock.utils; spock.utils.get_packages()",
+}
+
+# Dependencies that should only be imported on first use
+LAZY_MODULES = (
+    "cryptography.fernet",
+    "distutils",
+    "git",
+    "pkg_resources",
+    "pytomlpp",
+)
+
+
+def time_statement(statement: str) -> float:
+    """Times a statement within a fresh interpreter
+
+    Args:
+        statement: python statement to time
+
+    Returns:
+        wall time of the statement in seconds
+
+    """
+    code = (
+        "import time, warnings; warnings.simplefilter('ignore'); t0 = time.perf_counter(); "
+        f"{statement}; print(time.perf_counter() - t0)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    )
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def slowest_imports(top: int) -> List[Tuple[int, str]]:
+    """Gets the slowest (cumulative) imports of `import spock` via -X importtime
+
+    Args:
+        top: number of imports to return
+
+    Returns:
+        list of cumulative time (us) and module name
+
+    """
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import spock"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    times = []
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times.append((int(cumulative), name.strip()))
+    return sorted(times, reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import time benchmark")
+    parser.add_argument("--repeats", type=int, default=10)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+    for name, statement in STATEMENTS.items():
+        times = [time_statement(statement) for _ in range(args.repeats)]
+        print(
+            f"{name:>28}: median {1e3 * statistics.median(times):8.2f} ms | "
+            f"min {1e3 * min(times):8.2f} ms"
+        )
+    print("\nSlowest imports of `import spock` (cumulative):")
+    for cumulative, name in slowest_imports(args.top):
+        print(f"{1e-3 * cumulative:8.2f} ms | {name}")
+    check = f"import sys, spock; print(','.join(m for m in {LAZY_MODULES} if m in sys.modules))"
+    loaded = subprocess.run(
+        [sys.executable, "-c", check], capture_output=True, check=True, text=True
+    )
+    eager = [val for val in loaded.stdout.strip().split(",") if val != ""]
+    print(f"\nLazy dependencies imported by `import spock`: {eager}")
+    if len(eager) > 0:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
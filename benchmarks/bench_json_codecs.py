@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+# Copyright FMR LLC <opensource@fidelity.com>
+# SPDX-License-Identifier: Apache-2.0
+
+"""Compares the JSONHandler codecs on large generated payloads
+
+Usage:
+    python benchmarks/bench_json_codecs.py [--n-classes 200] [--n-fields 50] [--repeats 20]
+
+"""
+
+import argparse
+import os
+import tempfile
+import timeit
+
+from spock.handlers import JSONHandler, _has_orjson
+
+
+def make_payload(n_classes: int, n_fields: int) -> dict:
+    """Makes a config style payload with a section per class"""
+    return {
+        f"Config{idx}": {
+            f"field_{jdx}": [jdx, float(jdx) / 3, f"value_{jdx}", jdx % 2 == 0]
+            for jdx in range(n_fields)
+        }
+        for idx in range(n_classes)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JSON codec benchmark")
+    parser.add_argument("--n-classes", type=int, default=200)
+    parser.add_argument("--n-fields", type=int, default=50)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+    codecs = ["json", "orjson"] if _has_orjson() else ["json"]
+    payload = make_payload(args.n_classes, args.n_fields)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "payload.json")
+        JSONHandler(codec="json")._save(payload, None, None, path)
+        print(f"Payload size: {os.path.getsize(path) / 1e6:.2f} MB")
+        outputs = {}
+        for codec in codecs:
+            handler = JSONHandler(codec=codec)
+            load_time = timeit.timeit(lambda: handler._load(path), number=args.repeats)
+            out_path = os.path.join(tmp_dir, f"{codec}.json")
+
+            def save():
+                if os.path.exists(out_path):
+                    os.remove(out_path)
+                handler._save(payload, None, None, out_path)
+
+            save_time = timeit.timeit(save, number=args.repeats)
+            with open(out_path, "rb") as fid:
+                outputs[codec] = fid.read()
+            print(
+                f"{codec:>8}: load {1e3 * load_time / args.repeats:8.2f} ms | "
+                f"save {1e3 * save_time / args.repeats:8.2f} ms"
+            )
+        same = len(set(outputs.values())) == 1
+        print(f"Saved output byte-identical across codecs: {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+# Copyright FMR LLC <opensource@fidelity.com>
+# SPDX-License-Identifier: Apache-2.0
+
+"""Measures the throughput of the resolvers on typical config values
+
+Each value is pushed through the env and crypto resolvers (as every field is during a
+build) and the var reference detection/parsing (as the variable graphs do). Values repeat
+across iterations the same way they do across builds, batches, and sweeps
+
+Usage:
+    python benchmarks/bench_resolvers.py [--n-values 1000] [--repeats 20]
+
+"""
+
+import argparse
+import os
+import timeit
+
+from spock.backend.resolvers import CryptoResolver, EnvResolver, VarResolver, _tokenize
+from spock.backend.utils import CryptoKeys
+
+
+def make_values(n_values: int) -> list:
+    """Makes a mix of plain values and env/var resolver references"""
+    values = []
+    for idx in range(n_values):
+        kind = idx % 4
+        if kind == 0:
+            values.append(f"plain_value_{idx}")
+        elif kind == 1:
+            values.append(f"${{spock.env:BENCH_ENV_{idx % 10}, {idx}}}")
+        elif kind == 2:
+            values.append(f"${{spock.var:Config{idx % 10}.field_{idx % 7}}}")
+        else:
+            values.append(
+                f"prefix_${{spock.var:Config{idx % 10}.a}}_${{spock.var:Config.b}}_suffix"
+            )
+    return values
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resolver throughput benchmark")
+    parser.add_argument("--n-values", type=int, default=1000)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+    for idx in range(10):
+        os.environ[f"BENCH_ENV_{idx}"] = str(idx)
+    values = make_values(args.n_values)
+    env_resolver = EnvResolver()
+    crypto_resolver = CryptoResolver(CryptoKeys(lambda: ("salt", b"key")))
+    var_resolver = VarResolver()
+
+    def resolve_all():
+        for val in values:
+            out, _ = env_resolver.resolve(val, str)
+            out, _ = crypto_resolver.resolve(out, str)
+            if var_resolver.detect(out, str):
+                var_resolver.get_regex_match_reference(out)
+
+    # First pass parses every unique string -- the rest hit the template cache
+    _tokenize.cache_clear()
+    cold = timeit.timeit(resolve_all, number=1)
+    warm = timeit.timeit(resolve_all, number=args.repeats) / args.repeats
+    print(f"Values per pass: {len(values)}")
+    print(f"    cold: {1e3 * cold:8.2f} ms | {len(values) / cold:12.0f} values/s")
+    print(f"    warm: {1e3 * warm:8.2f} ms | {len(values) / warm:12.0f} values/s")
+    print(f"Template cache: {_tokenize.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,7 +9,6 @@ Spock is a framework that helps manage complex parameter configurations for Pyth
 Please refer to the documentation provided in the README.md
 """
 
-from spock._version import get_versions
 from spock.backend.custom import directory, file
 from spock.backend.typed import SavePath
 from spock.builder import ConfigArgBuilder
@@ -30,5 +29,13 @@ __all__ = [
     "utils",
 ]
 
-__version__ = get_versions()["version"]
-del get_versions
+
+def __getattr__(name: str):
+    """Resolves the version on first access (versioneer may shell out to git)"""
+    if name == "__version__":
+        from spock.handlers import _get_version
+
+        version = _get_version()
+        globals()["__version__"] = version
+        return version
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -10,5 +10,14 @@ Please refer to the documentation provided in the README.md
 """
 
 from spock.addons.s3.configs import S3Config, S3DownloadConfig, S3UploadConfig
+from spock.addons.s3.uploads import S3UploadQueue
 
-__all__ = ["configs", "utils", "S3Config", "S3DownloadConfig", "S3UploadConfig"]
+__all__ = [
+    "configs",
+    "uploads",
+    "utils",
+    "S3Config",
+    "S3DownloadConfig",
+    "S3UploadConfig",
+    "S3UploadQueue",
+]
@@ -9,6 +9,7 @@ import attr
 
 try:
     import boto3
+    from boto3.s3.transfer import TransferConfig
     from botocore.client import BaseClient
     from s3transfer.manager import TransferManager
 except ImportError:
@@ -16,7 +17,9 @@ except ImportError:
         "Missing libraries to support S3 functionality. Please re-install spock with the extra s3 dependencies -- "
         "pip install spock-config[s3]"
     )
-from typing import Optional
+from typing import Dict, Optional
+
+from spock.addons.s3.uploads import S3UploadQueue
 
 # Iterate through the allowed download args for S3 and map into optional attr.ib
 download_attrs = {
@@ -62,6 +65,19 @@ class S3Config:
         temp_folder: temporary working folder to write/read spock configuration(s) (optional: defaults to /tmp)
         download_config: S3DownloadConfig for extra download configs (optional)
         upload_config: S3UploadConfig for extra upload configs (optional)
+        transfer_config: boto3 TransferConfig to tune multipart thresholds/concurrency of transfers (optional)
+        show_progress: print the transfer info and progress bar for each transfer (optional: defaults to True)
+        max_workers: max number of S3 objects to download concurrently when prefetching (optional: defaults to 8)
+        in_memory: read and write S3 objects directly from/to memory without any temp files (optional: defaults
+            to False)
+        cache_dir: local directory to cache S3 objects in keyed by bucket/object/ETag -- cached objects are only
+            downloaded again if the ETag has changed (optional)
+        cache_ttl: seconds after an ETag check within which a cached object is used without contacting S3
+            (optional: defaults to checking the ETag on every load)
+        upload_queue: S3UploadQueue to run uploads in the background -- call flush() (or use it as a context
+            manager) to wait on the queued uploads (optional: defaults to blocking uploads)
+        _prefetched: map of S3 URIs to the local temp paths (or object bytes if in_memory) of already downloaded
+            (prefetched) objects
 
     """
 
@@ -71,6 +87,14 @@ class S3Config:
     temp_folder: Optional[str] = "/tmp/"
     download_config: S3DownloadConfig = S3DownloadConfig()
     upload_config: S3UploadConfig = S3UploadConfig()
+    transfer_config: Optional[TransferConfig] = None
+    show_progress: bool = True
+    max_workers: int = 8
+    in_memory: bool = False
+    cache_dir: Optional[str] = None
+    cache_ttl: Optional[float] = None
+    upload_queue: Optional[S3UploadQueue] = None
+    _prefetched: Dict = attr.ib(factory=dict, init=False, repr=False)
 
     def __attrs_post_init__(self):
         if self.s3_session is None:
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+# Copyright FMR LLC <opensource@fidelity.com>
+# SPDX-License-Identifier: Apache-2.0
+
+"""Handles queueing S3 uploads onto background threads"""
+
+import atexit
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Callable, List
+
+from spock.exceptions import _SpockS3UploadError
+
+
+class S3UploadQueue:
+    """Background queue for S3 uploads
+
+    Uploads submitted to the queue run on a bounded thread pool so the caller is not
+    blocked on network writes. `flush` waits for everything that has been submitted and
+    raises if any upload failed -- the queue can also be used as a context manager which
+    flushes on exit. Any uploads still pending at interpreter exit are flushed by an
+    atexit hook
+
+    Attributes:
+        max_workers: max number of concurrent uploads
+        _executor: thread pool running the uploads
+        _pending: futures of the uploads that have not been flushed
+        _lock: lock guarding the pending futures
+
+    """
+
+    def __init__(self, max_workers: int = 4):
+        """Init call for S3UploadQueue
+
+        Args:
+            max_workers: max number of concurrent uploads
+
+        """
+        self.max_workers = max_workers
+        self._executor = None
+        self._pending: List[Future] = []
+        self._lock = threading.Lock()
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """Queues an upload call
+
+        Args:
+            fn: upload function
+            *args: positional arguments of the upload function
+            **kwargs: keyword arguments of the upload function
+
+        Returns:
+            future of the upload
+
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="spock-s3-upload"
+                )
+                atexit.register(self._flush_at_exit)
+            future = self._executor.submit(fn, *args, **kwargs)
+            self._pending.append(future)
+        return future
+
+    @property
+    def pending(self) -> int:
+        """Number of uploads that have not been flushed"""
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self):
+        """Waits for all submitted uploads to finish
+
+        Raises:
+            _SpockS3UploadError: if any of the uploads failed
+
+        Returns:
+            None
+
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+        wait(pending)
+        errors = [val.exception() for val in pending if val.exception() is not None]
+        if len(errors) > 0:
+            raise _SpockS3UploadError(
+                f"{len(errors)} of {len(pending)} queued S3 upload(s) failed: "
+                f"{[f'{type(val).__name__}: {val}' for val in errors]}"
+            ) from errors[0]
+
+    def close(self):
+        """Flushes all submitted uploads and shuts down the thread pool
+
+        Returns:
+            None
+
+        """
+        try:
+            self.flush()
+        finally:
+            with self._lock:
+                executor, self._executor = self._executor, None
+            if executor is not None:
+                executor.shutdown(wait=True)
+            atexit.unregister(self._flush_at_exit)
+
+    def _flush_at_exit(self):
+        """Flushes any pending uploads at exit -- failures are printed as there is no caller left to raise to"""
+        try:
+            self.close()
+        except _SpockS3UploadError as e:
+            print(f"Error flushing queued S3 uploads at exit: {e}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -9,15 +9,21 @@ import attr
 
 try:
     import boto3
+    from boto3.s3.transfer import TransferConfig
     from botocore.client import BaseClient
 except ImportError:
     print(
         "Missing libraries to support S3 functionality. Please re-install spock with the extra s3 dependencies -- "
         "pip install spock-config[s3]"
     )
+import contextlib
+import hashlib
 import os
 import sys
+import tempfile
+import time
 import typing
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 
 from hurry.filesize import size
@@ -29,7 +35,7 @@ def handle_s3_load_path(path: str, s3_config: S3Config) -> str:
     """Handles loading from S3 uri
 
     Handles downloading file from a given s3 uri to a local temp location and passing the path back to the handler
-    load call
+    load call -- if the uri has already been prefetched the local temp path is just passed back
 
     Args:
         path: s3 uri path
@@ -43,9 +49,108 @@ def handle_s3_load_path(path: str, s3_config: S3Config) -> str:
         raise ValueError(
             "Load from S3 -- Missing S3Config object which is necessary to handle S3 style paths"
         )
+    temp_path = s3_config._prefetched.pop(path, None)
+    if temp_path is None:
+        temp_path = _download_s3_uri(path, s3_config)
+    return temp_path
+
+
+def handle_s3_load_bytes(path: str, s3_config: S3Config) -> bytes:
+    """Handles loading from S3 uri directly into memory
+
+    Reads the body of the object at the given s3 uri without writing it to the temp folder -- if the uri has
+    already been prefetched the bytes are just passed back
+
+    Args:
+        path: s3 uri path
+        s3_config: s3_config object
+
+    Returns:
+        contents: the contents of the config file on s3
+
+    """
+    if s3_config is None:
+        raise ValueError(
+            "Load from S3 -- Missing S3Config object which is necessary to handle S3 style paths"
+        )
+    contents = s3_config._prefetched.pop(path, None)
+    if contents is None:
+        contents = _read_s3_uri(path, s3_config)
+    return contents
+
+
+def prefetch_s3(paths: typing.List[str], s3_config: S3Config) -> None:
+    """Downloads a set of S3 uris concurrently so later loads can skip the download
+
+    All objects are downloaded on a thread pool (sharing the same client) and the local temp paths (or the object
+    bytes if in_memory is set) are registered on the S3Config -- any failed download is not registered and thus falls back to the regular load path (and its
+    error handling)
+
+    Args:
+        paths: list of s3 uri paths
+        s3_config: s3_config object
+
+    Returns:
+        None
+
+    """
+    if s3_config is None:
+        return
+    uris = [val for val in dict.fromkeys(paths) if val not in s3_config._prefetched]
+    if len(uris) == 0:
+        return
+    fetch = _read_s3_uri if s3_config.in_memory else _download_s3_uri
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(s3_config.max_workers, len(uris)))
+    ) as executor:
+        futures = [executor.submit(fetch, val, s3_config) for val in uris]
+    for uri, future in zip(uris, futures):
+        if future.exception() is None and future.result() is not None:
+            s3_config._prefetched[uri] = future.result()
+
+
+def _read_s3_uri(path: str, s3_config: S3Config) -> bytes:
+    """Reads the body of a s3 uri into memory
+
+    Args:
+        path: s3 uri path
+        s3_config: s3_config object
+
+    Returns:
+        contents: the contents of the object
+
+    """
+    if s3_config.cache_dir is not None:
+        with open(_get_cached_s3_uri(path, s3_config), "rb") as fid:
+            return fid.read()
+    bucket, obj, _ = get_s3_bucket_object_name(s3_path=path)
+    return read_s3(
+        bucket=bucket,
+        obj=obj,
+        s3_session=s3_config.s3_session,
+        download_config=s3_config.download_config,
+        show_progress=s3_config.show_progress,
+    )
+
+
+def _download_s3_uri(path: str, s3_config: S3Config) -> str:
+    """Downloads a s3 uri to a unique local temp path (or the local cache if set)
+
+    Args:
+        path: s3 uri path
+        s3_config: s3_config object
+
+    Returns:
+        temp_path: the temporary path of the config file downloaded from s3
+
+    """
+    if s3_config.cache_dir is not None:
+        return _get_cached_s3_uri(path, s3_config)
     bucket, obj, fid = get_s3_bucket_object_name(s3_path=path)
-    # Construct the full temp path
-    temp_path = f"{s3_config.temp_folder}/{fid}"
+    # Construct the full temp path -- prefix with a hash of the bucket/object so that
+    # objects with the same name (from different prefixes) don't overwrite each other
+    uri_hash = hashlib.sha1(f"{bucket}/{obj}".encode()).hexdigest()[:12]
+    temp_path = f"{s3_config.temp_folder}/{uri_hash}.{fid}"
     # Strip double slashes if exist
     temp_path = temp_path.replace(r"//", r"/")
     temp_path = download_s3(
@@ -54,14 +159,120 @@ def handle_s3_load_path(path: str, s3_config: S3Config) -> str:
         temp_path=temp_path,
         s3_session=s3_config.s3_session,
         download_config=s3_config.download_config,
+        transfer_config=s3_config.transfer_config,
+        show_progress=s3_config.show_progress,
     )
     return temp_path
 
 
+def _get_cached_s3_uri(path: str, s3_config: S3Config) -> str:
+    """Gets the local cached copy of a s3 uri -- only downloads if the object has changed
+
+    Cached objects live in the cache_dir keyed by a hash of the bucket/object and the object ETag. A marker file per
+    bucket/object holds the last seen ETag and its mtime is the time of the last check -- within the cache_ttl (if
+    set) the cached copy is used without contacting S3, otherwise a head_object call is used to get the current ETag
+    and the object is only downloaded if the ETag has changed (older copies of the object are removed)
+
+    Args:
+        path: s3 uri path
+        s3_config: s3_config object
+
+    Returns:
+        cache_path: the local path of the cached config file
+
+    """
+    bucket, obj, fid = get_s3_bucket_object_name(s3_path=path)
+    os.makedirs(s3_config.cache_dir, exist_ok=True)
+    uri_hash = hashlib.sha256(f"{bucket}/{obj}".encode()).hexdigest()
+    marker_path = os.path.join(s3_config.cache_dir, f"{uri_hash}.etag")
+    suffix = os.path.splitext(fid)[1]
+    # Within the TTL just trust the last seen ETag
+    if s3_config.cache_ttl is not None and os.path.exists(marker_path):
+        if time.time() - os.path.getmtime(marker_path) < s3_config.cache_ttl:
+            with open(marker_path, "r") as marker_fid:
+                cache_path = _get_s3_cache_path(
+                    s3_config.cache_dir, uri_hash, marker_fid.read(), suffix
+                )
+            if os.path.exists(cache_path):
+                return cache_path
+    # Unroll the extra options for those values that are not None
+    extra_options = {
+        k: v for k, v in attr.asdict(s3_config.download_config).items() if v is not None
+    }
+    etag = s3_config.s3_session.head_object(Bucket=bucket, Key=obj, **extra_options)[
+        "ETag"
+    ]
+    cache_path = _get_s3_cache_path(s3_config.cache_dir, uri_hash, etag, suffix)
+    if not os.path.exists(cache_path):
+        # Download to a temp file within the cache and then move it into place so
+        # concurrent readers never see a partial file
+        fd, temp_path = tempfile.mkstemp(dir=s3_config.cache_dir, suffix=suffix)
+        os.close(fd)
+        try:
+            downloaded = download_s3(
+                bucket=bucket,
+                obj=obj,
+                temp_path=temp_path,
+                s3_session=s3_config.s3_session,
+                download_config=s3_config.download_config,
+                transfer_config=s3_config.transfer_config,
+                show_progress=s3_config.show_progress,
+            )
+            if downloaded is None:
+                return downloaded
+            os.replace(downloaded, cache_path)
+        finally:
+            # Never leave the temp file behind if the download failed
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(temp_path)
+        # Drop any stale copies of the same bucket/object -- another process sharing
+        # the cache might have already removed them
+        for val in os.listdir(s3_config.cache_dir):
+            stale_path = os.path.join(s3_config.cache_dir, val)
+            if val.startswith(f"{uri_hash}-") and stale_path != cache_path:
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(stale_path)
+    _write_s3_cache_marker(marker_path, etag)
+    return cache_path
+
+
+def _get_s3_cache_path(cache_dir: str, uri_hash: str, etag: str, suffix: str) -> str:
+    """Gets the path of a cached object from the hash of the uri and the ETag
+
+    Args:
+        cache_dir: local cache directory
+        uri_hash: hash of the bucket/object
+        etag: ETag of the object
+        suffix: file extension of the object
+
+    Returns:
+        cache_path: the local path of the cached object
+
+    """
+    etag_hash = hashlib.sha256(etag.encode()).hexdigest()[:16]
+    return os.path.join(cache_dir, f"{uri_hash}-{etag_hash}{suffix}")
+
+
+def _write_s3_cache_marker(marker_path: str, etag: str):
+    """Atomically writes the last seen ETag of an object (which also resets the TTL)
+
+    Args:
+        marker_path: path of the marker file
+        etag: ETag of the object
+
+    Returns:
+    """
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(marker_path))
+    with os.fdopen(fd, "w") as marker_fid:
+        marker_fid.write(etag)
+    os.replace(temp_path, marker_path)
+
+
 def handle_s3_save_path(temp_path: str, s3_path: str, name: str, s3_config: S3Config):
     """Handles saving to S3 uri
 
-    Points to the local spock configuration file and handles getting it up to S3
+    Points to the local spock configuration file and handles getting it up to S3 -- if uploads are queued the file
+    contents are read right away so the queued upload never depends on the local file
 
     Args:
         temp_path: the temporary path the spock config was written out to locally
@@ -78,15 +289,81 @@ def handle_s3_save_path(temp_path: str, s3_path: str, name: str, s3_config: S3Co
     # Fix posix strip
     s3_path = s3_path.replace("s3:/", "s3://")
     bucket, obj, fid = get_s3_bucket_object_name(f"{s3_path}/{name}")
-    upload_s3(
+    if s3_config.upload_queue is not None:
+        # Snapshot the file now -- it is removed (or rewritten) once this call returns
+        with open(temp_path, "rb") as temp_fid:
+            contents = temp_fid.read()
+        s3_config.upload_queue.submit(
+            write_s3,
+            bucket=bucket,
+            obj=obj,
+            contents=contents,
+            s3_session=s3_config.s3_session,
+            upload_config=s3_config.upload_config,
+            show_progress=s3_config.show_progress,
+        )
+    else:
+        upload_s3(
+            bucket=bucket,
+            obj=obj,
+            temp_path=temp_path,
+            s3_session=s3_config.s3_session,
+            upload_config=s3_config.upload_config,
+            transfer_config=s3_config.transfer_config,
+            show_progress=s3_config.show_progress,
+        )
+
+
+def handle_s3_save_bytes(
+    contents: typing.Union[str, bytes], s3_path: str, name: str, s3_config: S3Config
+):
+    """Handles saving to S3 uri directly from memory
+
+    Uploads the serialized spock configuration without writing it to the temp folder
+
+    Args:
+        contents: the serialized spock config
+        s3_path: base s3 uri
+        name: spock generated filename
+        s3_config: s3_config object
+
+    Returns:
+    """
+    if s3_config is None:
+        raise ValueError(
+            "Save to S3 -- Missing S3Config object which is necessary to handle S3 style paths"
+        )
+    # Fix posix strip
+    s3_path = s3_path.replace("s3:/", "s3://")
+    bucket, obj, fid = get_s3_bucket_object_name(f"{s3_path}/{name}")
+    _run_upload(
+        s3_config,
+        write_s3,
         bucket=bucket,
         obj=obj,
-        temp_path=temp_path,
+        contents=contents.encode("utf-8") if isinstance(contents, str) else contents,
         s3_session=s3_config.s3_session,
         upload_config=s3_config.upload_config,
+        show_progress=s3_config.show_progress,
     )
 
 
+def _run_upload(s3_config: S3Config, fn: typing.Callable, **kwargs):
+    """Runs an upload call -- queued onto the S3UploadQueue if one is set
+
+    Args:
+        s3_config: s3_config object
+        fn: upload function
+        **kwargs: keyword arguments of the upload function
+
+    Returns:
+    """
+    if s3_config.upload_queue is not None:
+        s3_config.upload_queue.submit(fn, **kwargs)
+    else:
+        fn(**kwargs)
+
+
 def get_s3_bucket_object_name(s3_path: str) -> typing.Tuple[str, str, str]:
     """Splits a S3 uri into bucket, object, name
 
@@ -109,6 +386,8 @@ def download_s3(
     temp_path: str,
     s3_session: BaseClient,
     download_config: S3DownloadConfig,
+    transfer_config: typing.Optional[TransferConfig] = None,
+    show_progress: bool = True,
 ) -> str:
     """Attempts to download the file from the S3 uri to a temp location using any extra arguments to the download
 
@@ -118,6 +397,8 @@ def download_s3(
         temp_path: local temporary path to write file
         s3_session: current s3 session
         download_config: S3DownloadConfig with extra options for the file transfer
+        transfer_config: boto3 TransferConfig for the file transfer
+        show_progress: print the transfer info and progress bar (skips the extra head_object call if False)
 
     Returns:
         temp_path: the temporary path of the config file downloaded from s3
@@ -128,6 +409,11 @@ def download_s3(
         extra_options = {
             k: v for k, v in attr.asdict(download_config).items() if v is not None
         }
+        if not show_progress:
+            s3_session.download_file(
+                bucket, obj, temp_path, ExtraArgs=extra_options, Config=transfer_config
+            )
+            return temp_path
         file_size = s3_session.head_object(Bucket=bucket, Key=obj, **extra_options)[
             "ContentLength"
         ]
@@ -150,7 +436,12 @@ def download_s3(
 
         # Download with the progress callback
         s3_session.download_file(
-            bucket, obj, temp_path, Callback=_s3_progress_bar, ExtraArgs=extra_options
+            bucket,
+            obj,
+            temp_path,
+            Callback=_s3_progress_bar,
+            ExtraArgs=extra_options,
+            Config=transfer_config,
         )
         return temp_path
     except IOError:
@@ -161,12 +452,76 @@ def download_s3(
         )
 
 
+def read_s3(
+    bucket: str,
+    obj: str,
+    s3_session: BaseClient,
+    download_config: S3DownloadConfig,
+    show_progress: bool = True,
+) -> bytes:
+    """Attempts to read the body of the S3 object into memory using any extra arguments to the download
+
+    Args:
+        bucket: s3 bucket
+        obj: s3 object
+        s3_session: current s3 session
+        download_config: S3DownloadConfig with extra options for the get_object call
+        show_progress: print the transfer info
+
+    Returns:
+        contents: the contents of the object
+
+    """
+    # Unroll the extra options for those values that are not None
+    extra_options = {
+        k: v for k, v in attr.asdict(download_config).items() if v is not None
+    }
+    response = s3_session.get_object(Bucket=bucket, Key=obj, **extra_options)
+    contents = response["Body"].read()
+    if show_progress:
+        print(f"Read s3://{bucket}/{obj} into memory (size: {size(len(contents))})")
+    return contents
+
+
+def write_s3(
+    bucket: str,
+    obj: str,
+    contents: bytes,
+    s3_session: BaseClient,
+    upload_config: S3UploadConfig,
+    show_progress: bool = True,
+):
+    """Attempts to write the bytes to the S3 object using any extra arguments to the upload
+
+    Args:
+        bucket: s3 bucket
+        obj: s3 object
+        contents: bytes to write
+        s3_session: current s3 session
+        upload_config: S3UploadConfig with extra options for the put_object call
+        show_progress: print the transfer info
+
+    Returns:
+    """
+    # Unroll the extra options for those values that are not None
+    extra_options = {
+        k: v for k, v in attr.asdict(upload_config).items() if v is not None
+    }
+    if show_progress:
+        print(
+            f"Attempting to write s3://{bucket}/{obj} from memory (size: {size(len(contents))})"
+        )
+    s3_session.put_object(Bucket=bucket, Key=obj, Body=contents, **extra_options)
+
+
 def upload_s3(
     bucket: str,
     obj: str,
     temp_path: str,
     s3_session: BaseClient,
     upload_config: S3UploadConfig,
+    transfer_config: typing.Optional[TransferConfig] = None,
+    show_progress: bool = True,
 ):
     """Attempts to upload the local file to the S3 uri using any extra arguments to the upload
 
@@ -176,6 +531,8 @@ def upload_s3(
         temp_path: temporary path of the config file
         s3_session: current s3 session
         upload_config: S3UploadConfig with extra options for the file transfer
+        transfer_config: boto3 TransferConfig for the file transfer
+        show_progress: print the transfer info and progress bar
 
     Returns:
     """
@@ -184,6 +541,11 @@ def upload_s3(
         extra_options = {
             k: v for k, v in attr.asdict(upload_config).items() if v is not None
         }
+        if not show_progress:
+            s3_session.upload_file(
+                temp_path, bucket, obj, ExtraArgs=extra_options, Config=transfer_config
+            )
+            return
         file_size = os.path.getsize(temp_path)
         print(f"Attempting to upload s3://{bucket}/{obj} (size: {size(file_size)})")
         current_progress = 0
@@ -204,7 +566,12 @@ def upload_s3(
 
         # Upload with progress callback
         s3_session.upload_file(
-            temp_path, bucket, obj, Callback=_s3_progress_bar, ExtraArgs=extra_options
+            temp_path,
+            bucket,
+            obj,
+            Callback=_s3_progress_bar,
+            ExtraArgs=extra_options,
+            Config=transfer_config,
         )
     except IOError:
         print(
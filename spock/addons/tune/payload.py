@@ -8,7 +8,7 @@
 from typing import Optional
 
 from spock.backend.payload import BasePayload
-from spock.backend.utils import _T, get_attr_fields
+from spock.backend.utils import _T, get_field_index
 
 
 class TunerPayload(BasePayload):
@@ -22,23 +22,37 @@ class TunerPayload(BasePayload):
 
     """
 
-    def __init__(self, s3_config: Optional[_T] = None):
+    def __init__(
+        self,
+        s3_config: Optional[_T] = None,
+        partial_load: bool = False,
+        include_workers: Optional[int] = None,
+        json_codec: Optional[str] = None,
+    ):
         """Init for TunerPayload
 
         Args:
             s3_config: optional S3 config object
+            partial_load: only process the sections that map to the input classes
+            include_workers: number of threads to load sibling config includes with
+            json_codec: name of the codec used to parse JSON config files
 
         """
-        super().__init__(s3_config=s3_config)
+        super().__init__(
+            s3_config=s3_config,
+            partial_load=partial_load,
+            include_workers=include_workers,
+            json_codec=json_codec,
+        )
 
     @staticmethod
     def _update_payload(base_payload, input_classes, ignore_classes, payload):
-        # Get basic args
-        attr_fields = get_attr_fields(input_classes=input_classes)
-        # Get the ignore fields
-        ignore_fields = get_attr_fields(input_classes=ignore_classes)
+        # Get the precomputed field lookups -- built once per set of classes
+        attr_fields = get_field_index(input_classes).attr_field_sets
+        # Get the ignore class names
+        ignore_names = get_field_index(ignore_classes).class_names
         for k, v in base_payload.items():
-            if k not in ignore_fields:
+            if k not in ignore_names:
                 if k != "config":
                     # Dict infers that we are overriding a global setting in a specific config
                     if isinstance(v, dict):
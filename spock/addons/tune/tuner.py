@@ -63,7 +63,10 @@ class TunerInterface:
         """
         curr_sample = self._lib_interface.sample()
         # Merge w/ fixed parameters
-        return Spockspace(**vars(curr_sample), **vars(self._fixed_namespace))
+        merged = Spockspace(**vars(curr_sample), **vars(self._fixed_namespace))
+        # The salt/key holder lives outside of vars() so carry it over explicitly
+        merged._crypto = getattr(self._fixed_namespace, "_crypto", None)
+        return merged
 
     @property
     def tuner_status(self):
@@ -6,6 +6,7 @@
 """Handles mapping config arguments to a payload with both general and class specific sets"""
 
 
+from copy import copy
 from typing import Any, Dict, Iterable
 
 from _warnings import warn
@@ -63,6 +64,26 @@ class SpockArguments:
         for key in self._arguments:
             yield key
 
+    def updated(self, updates: Dict) -> "SpockArguments":
+        """Returns a copy of the arguments with the given class level values updated
+
+        Only the updated class level dictionaries are copied -- every other dictionary
+        is shared with this instance
+
+        Args:
+            updates: dictionary of class names to the dictionary of updated values
+
+        Returns:
+            updated copy of the arguments
+
+        """
+        arguments = copy(self)
+        arguments._arguments = {
+            **self._arguments,
+            **{k: {**self._arguments.get(k, {}), **v} for k, v in updates.items()},
+        }
+        return arguments
+
     @property
     def items(self):
         """Returns the k,v tuple iterator for the _arguments dictionary"""
@@ -189,5 +210,7 @@ class SpockArguments:
         clean_arguments = {}
         for arg, value in arguments.items():
             if arg not in general_arguments:
-                clean_arguments[arg] = value
+                # Copy the class level dictionaries as general arguments get assigned
+                # into them -- the given arguments stay untouched
+                clean_arguments[arg] = dict(value) if isinstance(value, dict) else value
         return clean_arguments
@@ -10,12 +10,14 @@ Please refer to the documentation provided in the README.md
 """
 
 __all__ = [
+    "batch",
     "builder",
     "config",
     "field_handlers",
     "handler",
     "help",
     "payload",
+    "plan",
     "saver",
     "spaces",
     "typed",
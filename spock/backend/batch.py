@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+
+# Copyright FMR LLC <opensource@fidelity.com>
+# SPDX-License-Identifier: Apache-2.0
+
+"""Handles building batches of Spockspaces across a process pool"""
+
+import importlib
+import sys
+from concurrent.futures import FIRST_EXCEPTION, ProcessPoolExecutor, wait
+from typing import Any, ByteString, Dict, List, Optional, Tuple
+
+from spock.backend.builder import AttrBuilder
+from spock.backend.wrappers import Spockspace
+from spock.exceptions import _SpockValueError
+from spock.utils import _C
+
+# Per worker process builder -- set by the pool initializer
+_WORKER_BUILDER = None
+
+
+def _get_class_identities(input_classes: Tuple[_C, ...]) -> Tuple[List, List]:
+    """Gets the picklable identities of the spock classes
+
+    Classes are registered by name within spock.backend.config when decorated, thus
+    the name plus the module that defines them is enough to find them again within
+    a worker process
+
+    Args:
+        input_classes: tuple of @spock decorated classes
+
+    Returns:
+        list of class names and list of the modules that define them
+
+    """
+    class_names = [val.__name__ for val in input_classes]
+    modules = []
+    for val in input_classes:
+        module = getattr(val, "__spock_module__", None)
+        if module is not None and module not in modules:
+            modules.append(module)
+    return class_names, modules
+
+
+def has_crypto_references(value: Any) -> bool:
+    """Checks if a (possibly nested) payload contains any crypto references or annotations
+
+    Args:
+        value: payload or value within a payload
+
+    Returns:
+        boolean if any string value references crypto
+
+    """
+    if isinstance(value, str):
+        return "${spock.crypto" in value or "${spock.env.crypto" in value
+    if isinstance(value, dict):
+        return any(has_crypto_references(val) for val in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(has_crypto_references(val) for val in value)
+    return False
+
+
+def _init_batch_worker(
+    class_names: List[str],
+    modules: List[str],
+    salt: Optional[str],
+    key: Optional[ByteString],
+) -> None:
+    """Initializer for each worker process -- builds the worker level builder once
+
+    Args:
+        class_names: names of the @spock decorated classes
+        modules: modules that define the @spock decorated classes
+        salt: cryptographic salt
+        key: cryptographic key
+
+    Returns:
+        None
+
+    """
+    global _WORKER_BUILDER
+    # Importing the defining modules runs the @spock decorators which registers the
+    # classes within spock.backend.config -- __main__ is handled by multiprocessing
+    for module in modules:
+        if module not in ("__main__", "__mp_main__"):
+            importlib.import_module(module)
+    config_module = sys.modules["spock"].backend.config
+    missing = [val for val in class_names if not hasattr(config_module, val)]
+    if len(missing) > 0:
+        raise _SpockValueError(
+            f"Could not find @spock decorated class(es) {missing} within the worker process -- classes must be "
+            f"defined at the module level to be used with a process pool"
+        )
+    input_classes = [getattr(config_module, val) for val in class_names]
+    _WORKER_BUILDER = AttrBuilder(*input_classes, lazy=False, salt=salt, key=key)
+
+
+def _build_batch_chunk(payloads: List[Dict]) -> List[Spockspace]:
+    """Builds a chunk of payloads within a worker process
+
+    Args:
+        payloads: list of payload dictionaries
+
+    Returns:
+        list of Spockspaces
+
+    """
+    return [_WORKER_BUILDER.generate(payload) for payload in payloads]
+
+
+def generate_parallel(
+    input_classes: Tuple[_C, ...],
+    payloads: List[Dict],
+    n_workers: int,
+    salt: Optional[str],
+    key: Optional[ByteString],
+    chunksize: Optional[int] = None,
+) -> List[Spockspace]:
+    """Builds a Spockspace for each payload across a process pool
+
+    Payloads are split into ordered chunks and results are gathered back in the same
+    order as the given payloads. As soon as any chunk raises, all pending chunks are
+    cancelled and the error from the earliest (in payload order) failed chunk is raised
+
+    Args:
+        input_classes: tuple of @spock decorated classes
+        payloads: list of validated payload dictionaries
+        n_workers: number of worker processes
+        salt: cryptographic salt
+        key: cryptographic key
+        chunksize: number of payloads to send to a worker at once -- defaults to
+            spreading the payloads over ~4 chunks per worker
+
+    Returns:
+        list of Spockspaces in the same order as the payloads
+
+    """
+    if len(payloads) == 0:
+        return []
+    if chunksize is None:
+        chunksize = max(1, -(-len(payloads) // (n_workers * 4)))
+    chunks = [
+        payloads[idx : idx + chunksize] for idx in range(0, len(payloads), chunksize)
+    ]
+    class_names, modules = _get_class_identities(input_classes)
+    executor = ProcessPoolExecutor(
+        max_workers=n_workers,
+        initializer=_init_batch_worker,
+        initargs=(class_names, modules, salt, key),
+    )
+    try:
+        futures = [executor.submit(_build_batch_chunk, chunk) for chunk in chunks]
+        done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+        failed = [val for val in futures if val in done and val.exception() is not None]
+        if len(failed) > 0:
+            # Fail fast -- drop anything that has not started yet
+            for val in not_done:
+                val.cancel()
+            raise failed[0].exception()
+        return [spockspace for val in futures for spockspace in val.result()]
+    finally:
+        executor.shutdown(wait=True)
@@ -6,6 +6,7 @@
 """Handles the building/saving of the configurations from the Spock config classes"""
 import argparse
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from enum import EnumMeta
 from typing import ByteString, Dict, List, Optional, Set, Tuple
 
@@ -14,11 +15,13 @@ import attr
 from spock.args import SpockArguments
 from spock.backend.field_handlers import RegisterSpockCls
 from spock.backend.help import attrs_help
+from spock.backend.plan import BuildPlan
 from spock.backend.resolvers import VarResolver
-from spock.backend.spaces import BuilderSpace
+from spock.backend.spaces import BuilderSpace, BuildState
+from spock.backend.utils import CryptoKeys
 from spock.backend.wrappers import Spockspace
 from spock.exceptions import _SpockInstantiationError
-from spock.graph import Graph, MergeGraph, SelfGraph, VarGraph
+from spock.graph import MergeGraph, SelfGraph, VarGraph
 from spock.utils import (
     _C,
     _T,
@@ -37,14 +40,15 @@ class BaseBuilder(ABC):  # pylint: disable=too-few-public-methods
     Attributes
 
         _input_classes: list of input classes that link to a backend
+        _plan: BuildPlan, compiled (and cached) build info for the input classes
         _graph: Graph, graph of the dependencies between spock classes
         _max_indent: maximum to indent between help prints
         _module_name: module name to register in the spock module space
         save_path: list of path(s) to save the configs to
         _lazy: attempts to lazily find @spock decorated classes registered within
         sys.modules["spock"].backend.config
-        _salt: salt use for crypto purposes
-        _key: key used for crypto purposes
+        _crypto: salt and key used for crypto purposes (only created on first use)
+        _instantiate_workers: number of threads used to instantiate independent classes
 
     """
 
@@ -54,8 +58,10 @@ class BaseBuilder(ABC):  # pylint: disable=too-few-public-methods
         max_indent: int = 4,
         module_name: str,
         lazy: bool,
-        salt: str,
-        key: ByteString,
+        salt: Optional[str] = None,
+        key: Optional[ByteString] = None,
+        crypto: Optional[CryptoKeys] = None,
+        instantiate_workers: Optional[int] = None,
         **kwargs,
     ):
         """Init call for BaseBuilder
@@ -67,15 +73,22 @@ class BaseBuilder(ABC):  # pylint: disable=too-few-public-methods
             lazy: lazily find @spock decorated classes
             salt: cryptographic salt
             key: cryptographic key
+            crypto: lazily created cryptographic salt and key -- takes precedence over salt and key
+            instantiate_workers: number of threads used to instantiate the independent classes of each level of
+                the dependency graph concurrently (None instantiates them one after another)
             **kwargs: keyword args
         """
         self._input_classes = args
         self._lazy = lazy
-        self._salt = salt
-        self._key = key
-        self._graph = Graph(input_classes=self.input_classes, lazy=self._lazy)
+        self._crypto = (
+            crypto if crypto is not None else CryptoKeys.from_values(salt, key)
+        )
+        self._instantiate_workers = instantiate_workers
+        # Get the compiled plan -- only built once per tuple of input classes
+        self._plan = BuildPlan.get(self.input_classes, lazy=self._lazy)
+        self._graph = self._plan.graph
         # Make sure the input classes are updated -- lazy evaluation
-        self._input_classes = self._graph.nodes
+        self._input_classes = self._plan.input_classes
         self._module_name = module_name
         self._max_indent = max_indent
         self.save_path = None
@@ -95,6 +108,11 @@ class BaseBuilder(ABC):  # pylint: disable=too-few-public-methods
         """Returns the underlying graph object"""
         return self._graph
 
+    @property
+    def plan(self):
+        """Returns the compiled build plan"""
+        return self._plan
+
     @staticmethod
     @abstractmethod
     def _make_group_override_parser(
@@ -144,10 +162,36 @@ class BaseBuilder(ABC):  # pylint: disable=too-few-public-methods
         Returns:
             namespace containing automatically generated instances of the classes
         """
-        spock_space_kwargs = self.resolve_spock_space_kwargs(self._graph, dict_args)
+        spock_space_kwargs = self.resolve_spock_space_kwargs(self._plan, dict_args)
         return Spockspace(**spock_space_kwargs)
 
-    def resolve_spock_space_kwargs(self, graph: Graph, dict_args: Dict) -> Dict:
+    def build(self, dict_args: Dict) -> Tuple[Spockspace, BuildState]:
+        """Generates the class instances and keeps the state needed to update them
+
+        Same as generate but also returns the arguments, the (unresolved) fields of each
+        class, and the graphs so that the Spockspace can be incrementally updated
+
+        Args:
+            dict_args: dictionary of arguments from the configs
+
+        Returns:
+            tuple of the namespace containing automatically generated instances of the
+            classes and the BuildState to pass to update
+        """
+        (
+            builder_space,
+            cls_fields_dict,
+            var_graph,
+            merged_graph,
+        ) = self._prepare_spock_space(self._plan, dict_args)
+        spock_space = self._instantiate_space(
+            self._plan, merged_graph, var_graph, cls_fields_dict, builder_space
+        )
+        return Spockspace(**spock_space), BuildState(
+            builder_space.arguments, cls_fields_dict, var_graph, merged_graph
+        )
+
+    def resolve_spock_space_kwargs(self, plan: BuildPlan, dict_args: Dict) -> Dict:
         """Build the dictionary that will define the spock space.
 
         This is essentially the meat of the builder. Handles both the cls dep graph
@@ -155,34 +199,149 @@ class BaseBuilder(ABC):  # pylint: disable=too-few-public-methods
         it cal traverse the dep structure correct to resolve both cls references and
         var refs
 
+        The class dependency graph, topological order, and cast types all come from
+        the compiled plan so that they are not recomputed for each payload
+
         Args:
-            graph: Dependency graph of nested spock configurations
+            plan: compiled build plan for the input classes
             dict_args: dictionary of arguments from the configs
 
         Returns:
             dictionary containing automatically generated instances of the classes
         """
+        (
+            builder_space,
+            cls_fields_dict,
+            var_graph,
+            merged_graph,
+        ) = self._prepare_spock_space(plan, dict_args)
+        return self._instantiate_space(
+            plan, merged_graph, var_graph, cls_fields_dict, builder_space
+        )
+
+    def update(
+        self, state: BuildState, spockspace: Spockspace, changes: Dict[str, Dict]
+    ) -> Tuple[Spockspace, BuildState]:
+        """Incrementally re-builds a Spockspace after some classes had values changed
+
+        Only the fields of the changed classes are generated again -- the fields of every
+        other class and the graphs are re-used from the given BuildState (the graphs are
+        only rebuilt if the variable references of a changed class differ). Only the
+        changed classes and the classes downstream of them (within the merged cls and var
+        reference graph) are resolved and instantiated again -- the instances of every
+        other class are shared with the given Spockspace
+
+        Args:
+            state: BuildState of the given Spockspace
+            spockspace: previously built Spockspace to share unaffected instances with
+            changes: dictionary of class names to the dictionary of changed values
+
+        Returns:
+            tuple of the namespace containing the re-built and shared instances of the
+            classes and the BuildState of it
+        """
+        builder_space = BuilderSpace(
+            arguments=state.arguments.updated(changes), spock_space={}
+        )
+        cls_fields_dict = dict(state.cls_fields)
+        for spock_name in self._plan.topological_order:
+            if spock_name in changes:
+                self._generate_cls_fields(
+                    self._plan.node_map[spock_name], builder_space, cls_fields_dict
+                )
+        var_graph, merged_graph = state.var_graph, state.merged_graph
+        if any(
+            self._var_references(state.cls_fields[spock_name]["fields"])
+            != self._var_references(cls_fields_dict[spock_name]["fields"])
+            for spock_name in changes
+        ):
+            var_graph, merged_graph = self._build_graphs(self._plan, cls_fields_dict)
+        affected = merged_graph.downstream(set(changes.keys()))
+        builder_space.spock_space.update(
+            {
+                spock_name: getattr(spockspace, spock_name)
+                for spock_name in merged_graph.topological_order
+                if spock_name not in affected
+            }
+        )
+        spock_space = self._instantiate_space(
+            self._plan,
+            merged_graph,
+            var_graph,
+            cls_fields_dict,
+            builder_space,
+            affected=affected,
+        )
+        return Spockspace(**spock_space), BuildState(
+            builder_space.arguments, cls_fields_dict, var_graph, merged_graph
+        )
+
+    def _prepare_spock_space(
+        self, plan: BuildPlan, dict_args: Dict
+    ) -> Tuple[BuilderSpace, Dict, VarGraph, MergeGraph]:
+        """Generates the fields of each class and the graphs needed to instantiate them
+
+        Args:
+            plan: compiled build plan for the input classes
+            dict_args: dictionary of arguments from the configs
+
+        Returns:
+            tuple of the BuilderSpace, the map of class names to the class and fields
+            dictionary, the var reference graph, and the merged cls and var reference graph
+        """
         # Assemble the arguments dictionary and BuilderSpace
         builder_space = BuilderSpace(
-            arguments=SpockArguments(dict_args, graph), spock_space={}
+            arguments=SpockArguments(dict_args, plan.graph), spock_space={}
         )
         cls_fields_dict = {}
         # For each node in the cls dep graph step through in topological order
         # We must do this first so that we can resolve the fields dict for each class
         # so that we can figure out which variables we need to resolve prior to
         # instantiation
-        for spock_name in graph.topological_order:
-            spock_cls = graph.node_map[spock_name]
-            # This generates the fields dict for each cls
-            spock_cls, special_keys, fields = RegisterSpockCls.recurse_generate(
-                spock_cls, builder_space, self._salt, self._key
-            )
-            cls_fields_dict.update(
-                {spock_cls.__name__: {"cls": spock_cls, "fields": fields}}
+        for spock_name in plan.topological_order:
+            self._generate_cls_fields(
+                plan.node_map[spock_name], builder_space, cls_fields_dict
             )
-            # Push back special keys
-            for special_key, value in special_keys.items():
-                setattr(self, special_key, value)
+        var_graph, merged_graph = self._build_graphs(plan, cls_fields_dict)
+        return builder_space, cls_fields_dict, var_graph, merged_graph
+
+    def _generate_cls_fields(
+        self, spock_cls: _C, builder_space: BuilderSpace, cls_fields_dict: Dict
+    ) -> None:
+        """Generates the fields dict of a class from the arguments
+
+        Args:
+            spock_cls: spock class to generate the fields of
+            builder_space: named_tuple containing the arguments and spock_space
+            cls_fields_dict: map of class names to the class and fields dictionary to
+                add the class to
+
+        Returns:
+            None
+        """
+        # This generates the fields dict for each cls
+        spock_cls, special_keys, fields = RegisterSpockCls.recurse_generate(
+            spock_cls, builder_space, self._crypto
+        )
+        cls_fields_dict.update(
+            {spock_cls.__name__: {"cls": spock_cls, "fields": fields}}
+        )
+        # Push back special keys
+        for special_key, value in special_keys.items():
+            setattr(self, special_key, value)
+
+    def _build_graphs(
+        self, plan: BuildPlan, cls_fields_dict: Dict
+    ) -> Tuple[VarGraph, MergeGraph]:
+        """Builds the var reference graph and merges it with the cls dependency graph
+
+        Args:
+            plan: compiled build plan for the input classes
+            cls_fields_dict: map of class names to the class and fields dictionary
+
+        Returns:
+            tuple of the var reference graph and the merged cls and var reference graph
+        """
         # Create the variable dependency graph -- this needs the fields dict to do so
         # as we need all the values that are current set for instantiation
         var_graph = VarGraph(
@@ -191,46 +350,223 @@ class BaseBuilder(ABC):  # pylint: disable=too-few-public-methods
         )
         # Merge the cls dependency graph and the variable dependency graph
         merged_graph = MergeGraph(
-            graph.dag, var_graph.dag, input_classes=self._input_classes
+            plan.graph.dag, var_graph.dag, input_classes=self._input_classes
         )
+        return var_graph, merged_graph
+
+    @staticmethod
+    def _var_references(fields: Dict) -> Dict:
+        """Gets the field values that contain variable references
+
+        Args:
+            fields: fields dictionary of a class
+
+        Returns:
+            dictionary of the field names and values that contain variable references
+        """
+        return {
+            k: v
+            for k, v in fields.items()
+            if isinstance(v, str) and VarGraph.var_resolver.detect(v, str)
+        }
+
+    def _instantiate_space(
+        self,
+        plan: BuildPlan,
+        merged_graph: MergeGraph,
+        var_graph: VarGraph,
+        cls_fields_dict: Dict,
+        builder_space: BuilderSpace,
+        affected: Optional[Set[str]] = None,
+    ) -> Dict:
+        """Resolves and instantiates the classes in the merged topological order
+
+        Args:
+            plan: compiled build plan for the input classes
+            merged_graph: merged cls and var reference graph
+            var_graph: var reference graph
+            cls_fields_dict: map of class names to the class and fields dictionary
+            builder_space: named_tuple containing the arguments and spock_space
+            affected: set of the names of the classes to instantiate -- the instances
+                of all other classes must already be within the spock_space (None
+                instantiates all classes)
+
+        Returns:
+            dictionary containing automatically generated instances of the classes
+        """
+        if self._instantiate_workers is not None and self._instantiate_workers > 1:
+            return self._instantiate_levels(
+                plan,
+                merged_graph,
+                var_graph,
+                cls_fields_dict,
+                builder_space,
+                affected=affected,
+            )
         # Iterate in merged topological order so that we can resolve both cls and ref
         # dependencies in the correct order
         for spock_name in merged_graph.topological_order:
-            # First we check for any needed cls dependent variable resolution
-            cls_fields, cls_changed_vars = var_graph.resolve(
-                spock_name, builder_space.spock_space
+            if affected is not None and spock_name not in affected:
+                continue
+            cls_fields = self._resolve_cls_fields(
+                spock_name, plan, var_graph, cls_fields_dict, builder_space
             )
-            # Then we map cls references to their instantiated version
-            cls_fields = self._clean_up_cls_refs(cls_fields, builder_space.spock_space)
-            # Lastly we have to check for self-resolution -- we do this w/ yet another
-            # graph -- graphs FTW! -- this maps back to the fields dict in the tuple
-            cls_fields, var_changed_vars = SelfGraph(
-                cls_fields_dict[spock_name]["cls"], cls_fields
-            ).resolve()
-            # Get the actual underlying class
-            spock_cls = merged_graph.node_map[spock_name]
-            # Merge the changed sets -- then attempt to cast them all post resolution
-            self._cast_all_maps(
-                spock_cls, cls_fields, cls_changed_vars | var_changed_vars
-            )
-            # Once all resolution occurs we attempt to instantiate the cls
-            try:
-                spock_instance = spock_cls(**cls_fields)
-            except Exception as e:
-                raise _SpockInstantiationError(
-                    f"Spock class `{spock_cls.__name__}` could not be instantiated "
-                    f"-- attrs message: {e}"
-                )
             # Push back into the builder_space
-            builder_space.spock_space[spock_cls.__name__] = spock_instance
-        return builder_space.spock_space
+            builder_space.spock_space[spock_name] = self._instantiate(
+                plan.node_map[spock_name], cls_fields
+            )
+        return {
+            spock_name: builder_space.spock_space[spock_name]
+            for spock_name in merged_graph.topological_order
+        }
+
+    @staticmethod
+    def _instantiate(spock_cls: _C, cls_fields: Dict):
+        """Instantiates a spock class once all resolution has occurred
+
+        Args:
+            spock_cls: spock class to instantiate
+            cls_fields: fields dictionary to instantiate the class with
+
+        Returns:
+            instance of the spock class
+
+        Raises:
+            _SpockInstantiationError: if the class could not be instantiated
+
+        """
+        try:
+            return spock_cls(**cls_fields)
+        except Exception as e:
+            raise _SpockInstantiationError(
+                f"Spock class `{spock_cls.__name__}` could not be instantiated "
+                f"-- attrs message: {e}"
+            )
+
+    def _instantiate_levels(
+        self,
+        plan: BuildPlan,
+        merged_graph: MergeGraph,
+        var_graph: VarGraph,
+        cls_fields_dict: Dict,
+        builder_space: BuilderSpace,
+        affected: Optional[Set[str]] = None,
+    ) -> Dict:
+        """Instantiates the classes level by level with the classes of a level in parallel
+
+        Classes within a level of the merged graph don't depend on each other so once the
+        previous levels are instantiated their fields can be resolved and the classes
+        (and thus any __post_hook__ validation) can be instantiated on a thread pool. Any
+        errors of a level are collected and reported per class
+
+        Args:
+            plan: compiled build plan for the input classes
+            merged_graph: merged cls and var reference graph
+            var_graph: var reference graph
+            cls_fields_dict: map of class names to the class and fields dictionary
+            builder_space: named_tuple containing the arguments and spock_space
+            affected: set of the names of the classes to instantiate -- the instances
+                of all other classes must already be within the spock_space (None
+                instantiates all classes)
+
+        Returns:
+            dictionary containing automatically generated instances of the classes
+            (in the same order as a sequential build)
+
+        Raises:
+            _SpockInstantiationError: if any class within a level could not be instantiated
+
+        """
+        levels = [
+            level
+            for level in (
+                [
+                    spock_name
+                    for spock_name in level
+                    if affected is None or spock_name in affected
+                ]
+                for level in merged_graph.topological_levels
+            )
+            if len(level) > 0
+        ]
+        max_workers = min(
+            self._instantiate_workers, max((len(level) for level in levels), default=1)
+        )
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for level in levels:
+                futures = {}
+                for spock_name in level:
+                    # Resolution is cheap compared to instantiation so stays sequential
+                    cls_fields = self._resolve_cls_fields(
+                        spock_name, plan, var_graph, cls_fields_dict, builder_space
+                    )
+                    futures[spock_name] = executor.submit(
+                        plan.node_map[spock_name], **cls_fields
+                    )
+                errors = []
+                for spock_name, future in futures.items():
+                    try:
+                        builder_space.spock_space[spock_name] = future.result()
+                    except Exception as e:
+                        errors.append(
+                            f"Spock class `{spock_name}` could not be instantiated "
+                            f"-- attrs message: {e}"
+                        )
+                if len(errors) > 0:
+                    raise _SpockInstantiationError("\n".join(errors))
+        return {
+            spock_name: builder_space.spock_space[spock_name]
+            for spock_name in merged_graph.topological_order
+        }
+
+    def _resolve_cls_fields(
+        self,
+        spock_name: str,
+        plan: BuildPlan,
+        var_graph: VarGraph,
+        cls_fields_dict: Dict,
+        builder_space: BuilderSpace,
+    ) -> Dict:
+        """Resolves the references of a class and casts the resolved values
+
+        Args:
+            spock_name: name of the spock class
+            plan: compiled build plan for the input classes
+            var_graph: var reference graph
+            cls_fields_dict: map of class names to the class and fields dictionary
+            builder_space: named_tuple containing the arguments and spock_space
+
+        Returns:
+            fields dictionary ready to instantiate the class with
+
+        """
+        # First we check for any needed cls dependent variable resolution
+        cls_fields, cls_changed_vars = var_graph.resolve(
+            spock_name,
+            builder_space.spock_space,
+            fields=cls_fields_dict[spock_name]["fields"],
+        )
+        # Then we map cls references to their instantiated version
+        cls_fields = self._clean_up_cls_refs(cls_fields, builder_space.spock_space)
+        # Lastly we have to check for self-resolution -- we do this w/ yet another
+        # graph -- graphs FTW! -- this maps back to the fields dict in the tuple
+        cls_fields, var_changed_vars = SelfGraph(
+            cls_fields_dict[spock_name]["cls"], cls_fields
+        ).resolve()
+        # Merge the changed sets -- then attempt to cast them all post resolution
+        self._cast_all_maps(
+            plan.cast_types[spock_name],
+            cls_fields,
+            cls_changed_vars | var_changed_vars,
+        )
+        return cls_fields
 
     @staticmethod
-    def _cast_all_maps(cls, cls_fields: Dict, changed_vars: Set) -> None:
+    def _cast_all_maps(cast_types: Dict, cls_fields: Dict, changed_vars: Set) -> None:
         """Casts all the resolved references to the requested type
 
         Args:
-            cls: current spock class
+            cast_types: map of attribute names to the type to cast into (from the plan)
             cls_fields: current fields dictionary to attempt cast within
             changed_vars: set of resolved variables that need to be cast
 
@@ -238,14 +574,9 @@ class BaseBuilder(ABC):  # pylint: disable=too-few-public-methods
 
         """
         for val in changed_vars:
-            # Make sure we cast directory and file types back to strings
-            if getattr(cls.__attrs_attrs__, val).type.__name__ in ("directory", "file"):
-                value_type = str
-            else:
-                value_type = getattr(cls.__attrs_attrs__, val).type
             cls_fields[val] = VarResolver._attempt_cast(
                 maybe_env=cls_fields[val],
-                value_type=value_type,
+                value_type=cast_types[val],
                 ref_value=val,
             )
 
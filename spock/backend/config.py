@@ -244,6 +244,9 @@ def _process_class(cls, kw_only: bool, make_init: bool, dynamic: bool):
     # For each class we dynamically create we need to register it within the system
     # modules for pickle to work
     setattr(sys.modules["spock"].backend.config, obj.__name__, obj)
+    # Keep track of the module that defines the class so other processes can import
+    # it (and thus register the class) prior to un-pickling
+    obj.__spock_module__ = cls.__module__
     # Swap the __doc__ string from cls to obj
     obj.__doc__ = cls.__doc__
     # Set the __init__ function
@@ -9,13 +9,15 @@ import importlib
 import sys
 from abc import ABC, abstractmethod
 from enum import EnumMeta
-from typing import Any, ByteString, Callable, Dict, List, Tuple, Type
+from typing import Any, Callable, Dict, List, Tuple, Type
+from weakref import WeakKeyDictionary
 
 from attr import NOTHING, Attribute
 
 from spock.backend.resolvers import CryptoResolver, EnvResolver, VarResolver
 from spock.backend.spaces import AttributeSpace, BuilderSpace, ConfigSpace
 from spock.backend.utils import (
+    CryptoKeys,
     _get_name_py_version,
     _recurse_callables,
     _str_2_callable,
@@ -47,8 +49,7 @@ class RegisterFieldTemplate(ABC):
 
     Attributes:
         special_keys: dictionary to check special keys
-        _salt: salt used for cryptograpy
-        _key: key used for cryptography
+        _crypto: salt and key used for cryptography (only created on first use)
         _env_resolver: class used to resolve environmental variables
         _crypto_resolver: class used to resolve cryptographic variables
     """
@@ -57,18 +58,16 @@ class RegisterFieldTemplate(ABC):
     _env_resolver = EnvResolver()
     _var_resolver = VarResolver()
 
-    def __init__(self, salt: str, key: ByteString):
+    def __init__(self, crypto: CryptoKeys):
         """Init call for RegisterFieldTemplate class
 
         Args:
-            salt: salt used for cryptograpy
-            key: key used for cryptography
+            crypto: salt and key used for cryptography
         """
         self.special_keys = {}
-        self._salt = salt
-        self._key = key
+        self._crypto = crypto
         # self._env_resolver = EnvResolver()
-        self._crypto_resolver = CryptoResolver(self._salt, self._key)
+        self._crypto_resolver = CryptoResolver(self._crypto)
 
     def __call__(self, attr_space: AttributeSpace, builder_space: BuilderSpace):
         """Call method for RegisterFieldTemplate
@@ -112,16 +111,14 @@ class RegisterFieldTemplate(ABC):
             and attr_space.attribute.default is not None
         ):
             # fields, special_keys, annotations, crypto = RegisterSpockCls(
-            #     self._salt, self._key
+            #     self._crypto
             # ).recurse_generate(
-            #     attr_space.attribute.type, builder_space, self._salt, self._key
+            #     attr_space.attribute.type, builder_space, self._crypto
             # )
 
             attr_space.field, special_keys, _ = RegisterSpockCls(
-                self._salt, self._key
-            ).recurse_generate(
-                attr_space.attribute.type, builder_space, self._salt, self._key
-            )
+                self._crypto
+            ).recurse_generate(attr_space.attribute.type, builder_space, self._crypto)
             attr_space.attribute = attr_space.attribute.evolve(default=attr_space.field)
             # builder_space.spock_space[
             #     attr_space.attribute.type.__name__
@@ -181,9 +178,7 @@ class RegisterFieldTemplate(ABC):
     ):
         if annotation == "crypto":
             # Take the current value to string and then encrypt
-            attr_space.annotations = (
-                f"${{spock.crypto:{encrypt_value(str(value), self._key, self._salt)}}}"
-            )
+            attr_space.annotations = f"${{spock.crypto:{encrypt_value(str(value), self._crypto.key, self._crypto.salt)}}}"
             attr_space.crypto = True
         elif annotation == "inject":
             attr_space.annotations = og_value
@@ -220,21 +215,19 @@ class RegisterEnum(RegisterFieldTemplate):
 
     Attributes:
         special_keys: dictionary to check special keys
-        _salt: salt used for cryptograpy
-        _key: key used for cryptography
+        _crypto: salt and key used for cryptography
         _env_resolver: class used to resolve environmental variables
         _crypto_resolver: class used to resolve cryptographic variables
 
     """
 
-    def __init__(self, salt: str, key: ByteString):
+    def __init__(self, crypto: CryptoKeys):
         """Init call to RegisterEnum
 
         Args:
-            salt: salt used for cryptograpy
-            key: key used for cryptography
+            crypto: salt and key used for cryptography
         """
-        super(RegisterEnum, self).__init__(salt, key)
+        super(RegisterEnum, self).__init__(crypto)
 
     def handle_attribute_from_config(
         self, attr_space: AttributeSpace, builder_space: BuilderSpace
@@ -304,7 +297,7 @@ class RegisterEnum(RegisterFieldTemplate):
         Returns:
         """
         attr_space.field, special_keys, _ = RegisterSpockCls.recurse_generate(
-            enum_cls, builder_space, self._salt, self._key
+            enum_cls, builder_space, self._crypto
         )
         self.special_keys.update(special_keys)
         # builder_space.spock_space[enum_cls.__name__] = attr_space.field
@@ -315,21 +308,19 @@ class RegisterCallableField(RegisterFieldTemplate):
 
     Attributes:
         special_keys: dictionary to check special keys
-        _salt: salt used for cryptograpy
-        _key: key used for cryptography
+        _crypto: salt and key used for cryptography
         _env_resolver: class used to resolve environmental variables
         _crypto_resolver: class used to resolve cryptographic variables
 
     """
 
-    def __init__(self, salt: str, key: ByteString):
+    def __init__(self, crypto: CryptoKeys):
         """Init call to RegisterSimpleField
 
         Args:
-            salt: salt used for cryptograpy
-            key: key used for cryptography
+            crypto: salt and key used for cryptography
         """
-        super(RegisterCallableField, self).__init__(salt, key)
+        super(RegisterCallableField, self).__init__(crypto)
 
     def handle_attribute_from_config(
         self, attr_space: AttributeSpace, builder_space: BuilderSpace
@@ -374,21 +365,19 @@ class RegisterGenericAliasCallableField(RegisterFieldTemplate):
 
     Attributes:
         special_keys: dictionary to check special keys
-        _salt: salt used for cryptograpy
-        _key: key used for cryptography
+        _crypto: salt and key used for cryptography
         _env_resolver: class used to resolve environmental variables
         _crypto_resolver: class used to resolve cryptographic variables
 
     """
 
-    def __init__(self, salt: str, key: ByteString):
+    def __init__(self, crypto: CryptoKeys):
         """Init call to RegisterSimpleField
 
         Args:
-            salt: salt used for cryptograpy
-            key: key used for cryptography
+            crypto: salt and key used for cryptography
         """
-        super(RegisterGenericAliasCallableField, self).__init__(salt, key)
+        super(RegisterGenericAliasCallableField, self).__init__(crypto)
 
     def handle_attribute_from_config(
         self, attr_space: AttributeSpace, builder_space: BuilderSpace
@@ -447,21 +436,19 @@ class RegisterSimpleField(RegisterFieldTemplate):
 
     Attributes:
         special_keys: dictionary to check special keys
-        _salt: salt used for cryptograpy
-        _key: key used for cryptography
+        _crypto: salt and key used for cryptography
         _env_resolver: class used to resolve environmental variables
         _crypto_resolver: class used to resolve cryptographic variables
 
     """
 
-    def __init__(self, salt: str, key: ByteString):
+    def __init__(self, crypto: CryptoKeys):
         """Init call to RegisterSimpleField
 
         Args:
-            salt: salt used for cryptograpy
-            key: key used for cryptography
+            crypto: salt and key used for cryptography
         """
-        super(RegisterSimpleField, self).__init__(salt, key)
+        super(RegisterSimpleField, self).__init__(crypto)
 
     def handle_attribute_from_config(
         self, attr_space: AttributeSpace, builder_space: BuilderSpace
@@ -549,21 +536,19 @@ class RegisterTuneCls(RegisterFieldTemplate):
 
     Attributes:
         special_keys: dictionary to check special keys
-        _salt: salt used for cryptograpy
-        _key: key used for cryptography
+        _crypto: salt and key used for cryptography
         _env_resolver: class used to resolve environmental variables
         _crypto_resolver: class used to resolve cryptographic variables
 
     """
 
-    def __init__(self, salt: str, key: ByteString):
+    def __init__(self, crypto: CryptoKeys):
         """Init call to RegisterTuneCls
 
         Args:
-            salt: salt used for cryptograpy
-            key: key used for cryptography
+            crypto: salt and key used for cryptography
         """
-        super(RegisterTuneCls, self).__init__(salt, key)
+        super(RegisterTuneCls, self).__init__(crypto)
 
     @staticmethod
     def _attr_type(attr_space: AttributeSpace):
@@ -635,21 +620,23 @@ class RegisterSpockCls(RegisterFieldTemplate):
 
     Attributes:
         special_keys: dictionary to check special keys
-        _salt: salt used for cryptograpy
-        _key: key used for cryptography
+        _crypto: salt and key used for cryptography
         _env_resolver: class used to resolve environmental variables
         _crypto_resolver: class used to resolve cryptographic variables
+        _handler_cache: map of spock class to the chosen Register* class for each
+            attribute -- handler choice only depends on the class definition
 
     """
 
-    def __init__(self, salt: str, key: ByteString):
+    _handler_cache = WeakKeyDictionary()
+
+    def __init__(self, crypto: CryptoKeys):
         """Init call to RegisterSpockCls
 
         Args:
-            salt: salt used for cryptograpy
-            key: key used for cryptography
+            crypto: salt and key used for cryptography
         """
-        super(RegisterSpockCls, self).__init__(salt, key)
+        super(RegisterSpockCls, self).__init__(crypto)
 
     @staticmethod
     def _attr_type(attr_space: AttributeSpace):
@@ -681,7 +668,7 @@ class RegisterSpockCls(RegisterFieldTemplate):
         """
         attr_type = self._attr_type(attr_space)
         attr_space.field, special_keys, _ = self.recurse_generate(
-            attr_type, builder_space, self._salt, self._key
+            attr_type, builder_space, self._crypto
         )
         # builder_space.spock_space[attr_type.__name__] = attr_space.field
         self.special_keys.update(special_keys)
@@ -722,7 +709,7 @@ class RegisterSpockCls(RegisterFieldTemplate):
         Returns:
         """
         attr_space.field, special_keys, _ = RegisterSpockCls.recurse_generate(
-            self._attr_type(attr_space), builder_space, self._salt, self._key
+            self._attr_type(attr_space), builder_space, self._crypto
         )
         self.special_keys.update(special_keys)
 
@@ -765,9 +752,70 @@ class RegisterSpockCls(RegisterFieldTemplate):
                 )
         return out
 
+    @classmethod
+    def _select_handler(cls, attribute: Attribute) -> Type[RegisterFieldTemplate]:
+        """Logic to handle the underlying type to call the correct Register* class
+
+        Args:
+            attribute: current attribute class
+
+        Returns:
+            Register* class that handles the attribute
+
+        """
+        # Dict/List of Callables
+        if (
+            (attribute.type is list)
+            or (attribute.type is List)
+            or (attribute.type is dict)
+            or (attribute.type is Dict)
+            or (attribute.type is tuple)
+            or (attribute.type is Tuple)
+        ) and cls._find_callables(attribute.metadata["type"]):
+            handler = RegisterGenericAliasCallableField
+        # Enums
+        elif isinstance(attribute.type, EnumMeta) and _check_iterable(attribute.type):
+            handler = RegisterEnum
+        # References to other spock classes
+        elif _is_spock_instance(attribute.type):
+            handler = RegisterSpockCls
+        # References to tuner classes
+        elif _is_spock_tune_instance(attribute.type):
+            handler = RegisterTuneCls
+        # References to callables
+        elif isinstance(attribute.type, _SpockVariadicGenericAlias):
+            handler = RegisterCallableField
+        # Basic field -- this might fail -- should we try catch here?
+        else:
+            handler = RegisterSimpleField
+        return handler
+
+    @classmethod
+    def _get_handler(
+        cls, spock_cls: _C, attribute: Attribute
+    ) -> Type[RegisterFieldTemplate]:
+        """Gets the Register* class for an attribute -- the choice is memoized per
+        spock class so type inspection only happens on the first build
+
+        Args:
+            spock_cls: current spock class that is being handled
+            attribute: current attribute class
+
+        Returns:
+            Register* class that handles the attribute
+
+        """
+        handlers = cls._handler_cache.get(spock_cls)
+        if handlers is None:
+            handlers = {}
+            cls._handler_cache[spock_cls] = handlers
+        if attribute.name not in handlers:
+            handlers[attribute.name] = cls._select_handler(attribute)
+        return handlers[attribute.name]
+
     @classmethod
     def recurse_generate(
-        cls, spock_cls: _C, builder_space: BuilderSpace, salt: str, key: ByteString
+        cls, spock_cls: _C, builder_space: BuilderSpace, crypto: CryptoKeys
     ):
         """Call on a spock classes to iterate through the attrs attributes and handle each based on type and optionality
 
@@ -776,8 +824,7 @@ class RegisterSpockCls(RegisterFieldTemplate):
         Args:
             spock_cls: current spock class that is being handled
             builder_space: named_tuple containing the arguments and spock_space
-            salt: salt used for cryptograpy
-            key: key used for cryptography
+            crypto: salt and key used for cryptography
 
         Returns:
             tuple of the instantiated spock class, the dictionary of special keys,
@@ -788,7 +835,7 @@ class RegisterSpockCls(RegisterFieldTemplate):
         special_keys = {}
         fields = {}
         annotations = {}
-        crypto = False
+        crypto_flag = False
         # Init the ConfigSpace for this spock class
         config_space = ConfigSpace(spock_cls, fields)
         # Iterate through the attrs within the spock class
@@ -799,37 +846,11 @@ class RegisterSpockCls(RegisterFieldTemplate):
             # if (
             #     (attribute.type is list) or (attribute.type is List)
             # ) and _is_spock_instance(attribute.metadata["type"].__args__[0]):
-            #     handler = RegisterList(salt, key)
+            #     handler = RegisterList(crypto)
             # Wrap this in a try except to gracefully handle when a handler isn't
             # correct
             try:
-                # Dict/List of Callables
-                if (
-                    (attribute.type is list)
-                    or (attribute.type is List)
-                    or (attribute.type is dict)
-                    or (attribute.type is Dict)
-                    or (attribute.type is tuple)
-                    or (attribute.type is Tuple)
-                ) and cls._find_callables(attribute.metadata["type"]):
-                    handler = RegisterGenericAliasCallableField(salt, key)
-                # Enums
-                elif isinstance(attribute.type, EnumMeta) and _check_iterable(
-                    attribute.type
-                ):
-                    handler = RegisterEnum(salt, key)
-                # References to other spock classes
-                elif _is_spock_instance(attribute.type):
-                    handler = RegisterSpockCls(salt, key)
-                # References to tuner classes
-                elif _is_spock_tune_instance(attribute.type):
-                    handler = RegisterTuneCls(salt, key)
-                # References to callables
-                elif isinstance(attribute.type, _SpockVariadicGenericAlias):
-                    handler = RegisterCallableField(salt, key)
-                # Basic field -- this might fail -- should we try catch here?
-                else:
-                    handler = RegisterSimpleField(salt, key)
+                handler = cls._get_handler(spock_cls, attribute)(crypto)
                 # Call the handler
                 handler(attr_space, builder_space)
                 # Update any special keys
@@ -844,11 +865,11 @@ class RegisterSpockCls(RegisterFieldTemplate):
             if attr_space.annotations is not None:
                 annotations.update({attr_space.attribute.name: attr_space.annotations})
             if attr_space.crypto:
-                crypto = True
+                crypto_flag = True
         # If there are annotations attach them to the spock class
         # in the __resolver__ attribute
         if len(annotations) > 0:
             spock_cls.__resolver__ = annotations
-        if crypto:
+        if crypto_flag:
             spock_cls.__crypto__ = True
         return spock_cls, special_keys, fields
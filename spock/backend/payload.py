@@ -8,19 +8,15 @@
 import os
 import sys
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from itertools import chain
 from pathlib import Path
 from typing import Dict, List, Optional
 
 from spock.backend.handler import BaseHandler
-from spock.backend.utils import (
-    convert_to_tuples,
-    deep_update,
-    flatten_type_dict,
-    get_attr_fields,
-    get_type_fields,
-)
-from spock.utils import _C, _T, check_path_s3
+from spock.backend.utils import convert_to_tuples, deep_update, get_field_index
+from spock.handlers import JSONHandler
+from spock.utils import _C, _T, check_path_s3, path_object_to_s3path
 
 
 class BasePayload(BaseHandler):  # pylint: disable=too-few-public-methods
@@ -32,11 +28,26 @@ class BasePayload(BaseHandler):  # pylint: disable=too-few-public-methods
     Attributes:
         _loaders: maps of each file extension to the loader class
         __s3_config: optional S3Config object to handle s3 access
+        _partial_load: only process the top-level sections and general keys that map
+            to the input classes -- all other keys are dropped
+        _include_workers: number of threads used to load sibling config includes
+            concurrently (None loads them one after another)
+        _json_codec: name of the codec used to parse JSON config files (None uses orjson
+            if installed)
 
     """
 
-    def __init__(self, s3_config: Optional[_T] = None):
+    def __init__(
+        self,
+        s3_config: Optional[_T] = None,
+        partial_load: bool = False,
+        include_workers: Optional[int] = None,
+        json_codec: Optional[str] = None,
+    ):
         super(BasePayload, self).__init__(s3_config=s3_config)
+        self._partial_load = partial_load
+        self._include_workers = include_workers
+        self._json_codec = json_codec
 
     @staticmethod
     @abstractmethod
@@ -67,7 +78,7 @@ class BasePayload(BaseHandler):  # pylint: disable=too-few-public-methods
             ignore_classes: list of classes to ignore
             path: path to config file(s)
             cmd_args: command line overrides
-            deps: dictionary of config dependencies
+            deps: IncludeGraph of the config file includes
 
         Returns:
             payload: dictionary of all mapped parameters
@@ -77,7 +88,15 @@ class BasePayload(BaseHandler):  # pylint: disable=too-few-public-methods
         payload = self._handle_overrides(payload, ignore_classes, cmd_args)
         return payload
 
-    def _payload(self, input_classes, ignore_classes, path, deps, root=False):
+    def _payload(
+        self,
+        input_classes,
+        ignore_classes,
+        path,
+        deps,
+        root=False,
+        base_payload: Optional[Dict] = None,
+    ):
         """Private call to construct the payload
 
         Main function call that builds out the payload from config files of multiple types. It handles
@@ -87,7 +106,9 @@ class BasePayload(BaseHandler):  # pylint: disable=too-few-public-methods
             input_classes: list of backend classes
             ignore_classes: list of classes to ignore
             path: path to config file(s)
-            deps: dictionary of config dependencies
+            deps: IncludeGraph of the config file includes
+            root: boolean if root
+            base_payload: already loaded payload of the config file (if prefetched)
 
         Returns:
             payload: dictionary of all mapped parameters
@@ -98,15 +119,11 @@ class BasePayload(BaseHandler):  # pylint: disable=too-few-public-methods
         if path is not None:
             # Match to loader based on file-extension
             config_extension = Path(path).suffix.lower()
-            # Verify extension
-            self._check_extension(file_extension=config_extension)
-            # Load from file
-            base_payload = self._supported_extensions.get(config_extension)().load(
-                path, s3_config=self._s3_config
-            )
-            base_payload = {} if base_payload is None else base_payload
-            # Check and? update the dependencies
-            deps = self._handle_dependencies(deps, path, root)
+            # Load from file if it hasn't been prefetched
+            if base_payload is None:
+                base_payload = self._load_file(path, input_classes)
+            # Add to the include graph -- raises on cycles and duplicate reads
+            deps.enter(path, root=root)
             if "config" in base_payload:
                 payload = self._handle_includes(
                     base_payload,
@@ -120,41 +137,59 @@ class BasePayload(BaseHandler):  # pylint: disable=too-few-public-methods
             payload = self._update_payload(
                 base_payload, input_classes, ignore_classes, payload
             )
+            deps.leave()
         return payload
 
+    def _load_file(self, path, input_classes) -> Dict:
+        """Loads and parses a single config file
+
+        Args:
+            path: path to config file
+            input_classes: list of backend classes
+
+        Returns:
+            base_payload: dictionary of the read file
+
+        """
+        # Match to loader based on file-extension
+        config_extension = Path(path).suffix.lower()
+        # Verify extension
+        self._check_extension(file_extension=config_extension)
+        # Load from file -- JSON files are parsed with the requested codec
+        handler = (
+            JSONHandler(codec=self._json_codec)
+            if config_extension == ".json"
+            else self._supported_extensions.get(config_extension)()
+        )
+        base_payload = handler.load(path, s3_config=self._s3_config)
+        base_payload = {} if base_payload is None else base_payload
+        # Only keep the sections that can map to the input classes
+        if self._partial_load:
+            base_payload = self.select_sections(base_payload, input_classes)
+        return base_payload
+
     @staticmethod
-    def _handle_dependencies(deps, path, root):
-        """Handles config file dependencies
+    def select_sections(base_payload: Dict, input_classes) -> Dict:
+        """Selects the top-level keys of a payload that can map to the input classes
 
-        Checks to see if the config path (full or relative) has already been encountered. Essentially a DFS for graph
-        cycles
+        Keeps the config includes, the class sections of the input classes, and any
+        general keys that are attributes of the input classes -- everything else is
+        dropped without being validated
 
         Args:
-            deps: dictionary of config dependencies
-            path: current config path
-            root: boolean if root
+            base_payload: payload read from a config file
+            input_classes: list of backend classes
 
         Returns:
-            deps: updated dependencies
+            payload with only the reachable top-level keys
 
         """
-        if root and path in deps.get("paths"):
-            raise ValueError(
-                f"Duplicate Read -- Config file {path} has already been encountered. "
-                f"Please remove duplicate reads of config files."
-            )
-        elif path in deps.get("paths") or path in deps.get("rel_paths"):
-            raise ValueError(
-                f"Cyclical Dependency -- Config file {path} has already been encountered. "
-                f"Please remove cyclical dependencies between config files."
-            )
-        else:
-            # Update the dependency lists
-            deps.get("paths").append(path)
-            deps.get("rel_paths").append(os.path.basename(path))
-            if root:
-                deps.get("roots").append(path)
-        return deps
+        index = get_field_index(input_classes)
+        return {
+            k: v
+            for k, v in base_payload.items()
+            if k == "config" or k in index.class_names or k in index.all_fields
+        }
 
     def _handle_includes(
         self,
@@ -179,13 +214,13 @@ class BasePayload(BaseHandler):  # pylint: disable=too-few-public-methods
             ignore_classes: list of classes to ignore
             path: path to base file
             payload: payload pulled from composed files
-            deps: dictionary of config dependencies
+            deps: IncludeGraph of the config file includes
 
         Returns:
             payload: payload update from composed files
 
         """
-        included_params = {}
+        use_paths = []
         for inc_path in base_payload["config"]:
             if check_path_s3(inc_path):
                 use_path = inc_path
@@ -197,12 +232,82 @@ class BasePayload(BaseHandler):  # pylint: disable=too-few-public-methods
                 raise RuntimeError(
                     f"Could not find included {config_extension} file {inc_path} or is not an S3 URI!"
                 )
+            use_paths.append(use_path)
+        self.prefetch_s3(use_paths)
+        prefetched = self._prefetch_includes(use_paths, input_classes)
+        included_params = {}
+        # Merge in the declared order so that override precedence and the dependency
+        # checks are the same regardless of prefetching
+        for use_path, inc_payload in zip(use_paths, prefetched):
             included_params.update(
-                self._payload(input_classes, ignore_classes, use_path, deps)
+                self._payload(
+                    input_classes,
+                    ignore_classes,
+                    use_path,
+                    deps,
+                    base_payload=None if inc_payload is None else inc_payload.result(),
+                )
             )
         payload.update(included_params)
         return payload
 
+    def prefetch_s3(self, paths: List) -> None:
+        """Downloads any S3 URIs within a set of config paths concurrently
+
+        Only triggered if an S3Config is set and more than one S3 URI is given -- the
+        downloads are consumed by the subsequent loads of the same URIs. Any includes of
+        the downloaded files are not fetched here (they are only known once parsed)
+
+        Args:
+            paths: config paths (local or S3 URIs)
+
+        Returns:
+            None
+
+        """
+        if self._s3_config is None:
+            return
+        s3_paths = [
+            path_object_to_s3path(Path(val))
+            for val in paths
+            if check_path_s3(Path(val))
+        ]
+        if len(s3_paths) < 2:
+            return
+        try:
+            from spock.addons.s3.utils import prefetch_s3
+
+            prefetch_s3(s3_paths, self._s3_config)
+        except ImportError:
+            print("Error importing spock s3 utils after detecting s3:// load paths")
+
+    def _prefetch_includes(self, use_paths: List, input_classes) -> List:
+        """Starts loading and parsing sibling includes concurrently on a thread pool
+
+        Only the includes of a single `config` tag are loaded together -- the includes of
+        each of these files are only known once it is parsed and are loaded as their own
+        set when its `config` tag is handled
+
+        Args:
+            use_paths: resolved paths of the sibling includes
+            input_classes: list of backend classes
+
+        Returns:
+            list of futures of the loaded payloads in the same order as the paths (or
+            Nones if not prefetching)
+
+        """
+        if self._include_workers is None or len(use_paths) < 2:
+            return [None] * len(use_paths)
+        with ThreadPoolExecutor(
+            max_workers=min(self._include_workers, len(use_paths))
+        ) as executor:
+            futures = [
+                executor.submit(self._load_file, use_path, input_classes)
+                for use_path in use_paths
+            ]
+        return futures
+
     def _handle_overrides(self, payload, ignore_classes, args):
         """Handle command line overrides
 
@@ -270,14 +375,28 @@ class AttrPayload(BasePayload):
 
     """
 
-    def __init__(self, s3_config: Optional[_T] = None):
+    def __init__(
+        self,
+        s3_config: Optional[_T] = None,
+        partial_load: bool = False,
+        include_workers: Optional[int] = None,
+        json_codec: Optional[str] = None,
+    ):
         """Init for AttrPayload
 
         Args:
             s3_config: optional S3 config object
+            partial_load: only process the sections that map to the input classes
+            include_workers: number of threads to load sibling config includes with
+            json_codec: name of the codec used to parse JSON config files
 
         """
-        super().__init__(s3_config=s3_config)
+        super().__init__(
+            s3_config=s3_config,
+            partial_load=partial_load,
+            include_workers=include_workers,
+            json_codec=json_codec,
+        )
 
     def __call__(self, *args, **kwargs):
         """Call to allow self chaining
@@ -293,22 +412,21 @@ class AttrPayload(BasePayload):
 
     @staticmethod
     def _update_payload(base_payload, input_classes, ignore_classes, payload):
-        # Get basic args
-        attr_fields = get_attr_fields(input_classes=input_classes)
-        # Get the ignore fields
-        ignore_fields = get_attr_fields(input_classes=ignore_classes)
-        # Class names
-        class_names = [val.__name__ for val in input_classes]
-        # Parse out the types if generic
-        type_fields = get_type_fields(input_classes)
-        flat_fields = flatten_type_dict(type_fields)
+        # Get the precomputed field lookups -- built once per set of classes
+        index = get_field_index(input_classes)
+        attr_fields = index.attr_field_sets
+        # Get the ignore class names
+        ignore_names = get_field_index(ignore_classes).class_names
         for keys, values in base_payload.items():
-            if keys not in ignore_fields:
+            if keys not in ignore_names:
                 # check if the keys, value pair is expected by the attr class
                 if keys != "config":
                     # Dict infers that we are overriding a global setting in a specific config -- if it's not in the
                     # flattened field of all parameters
-                    if isinstance(values, (dict, Dict)) and keys not in flat_fields:
+                    if (
+                        isinstance(values, (dict, Dict))
+                        and keys not in index.flat_fields
+                    ):
                         # we're in a namespace
                         # Check for incorrect specific override of global def
                         if keys not in attr_fields:
@@ -322,7 +440,7 @@ class AttrPayload(BasePayload):
                                 )
                     else:
                         # Check if the key is actually a reference to another class
-                        if keys in class_names:
+                        if keys in index.class_names:
                             if isinstance(values, (list, List)):
                                 # Check for incorrect specific override of global def
                                 if keys not in attr_fields:
@@ -332,20 +450,20 @@ class AttrPayload(BasePayload):
                                 # We are in a repeated class def
                                 # Raise if the key set is different from the defined set (i.e. incorrect arguments)
                                 key_set = set(
-                                    list(chain(*[list(val.keys()) for val in values]))
+                                    chain.from_iterable(val.keys() for val in values)
                                 )
                                 for i_keys in key_set:
                                     if i_keys not in attr_fields[keys]:
                                         raise ValueError(
                                             f"Provided an unknown argument named {keys}.{i_keys}"
                                         )
-                            # Chain all the values from multiple spock classes into one list
-                            elif keys not in list(chain(*attr_fields.values())):
+                            # Check against the set of all the values from multiple spock classes
+                            elif keys not in index.all_fields:
                                 raise ValueError(
                                     f"Provided an unknown argument named {keys}"
                                 )
-                        # Chain all the values from multiple spock classes into one list
-                        elif keys not in list(chain(*attr_fields.values())):
+                        # Check against the set of all the values from multiple spock classes
+                        elif keys not in index.all_fields:
                             raise ValueError(
                                 f"Provided an unknown argument named {keys}"
                             )
@@ -354,9 +472,8 @@ class AttrPayload(BasePayload):
                 else:
                     payload[keys] = values
         tuple_payload = convert_to_tuples(
-            payload, type_fields, flat_fields, class_names
+            payload, index.type_fields, index.flat_fields, index.class_names
         )
-        # tuple_payload = convert_to_tuples(payload, type_fields, class_names)
         payload = deep_update(payload, tuple_payload)
         return payload
 
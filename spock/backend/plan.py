@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+# Copyright FMR LLC <opensource@fidelity.com>
+# SPDX-License-Identifier: Apache-2.0
+
+"""Handles compiling and caching the build plan for a set of spock classes"""
+
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+from spock.graph import Graph
+from spock.utils import _C, _T
+
+
+class BuildPlan:
+    """Compiled build information for a fixed tuple of input classes
+
+    Everything in here depends only on the class definitions (and not on the payload)
+    so it is computed once per tuple of input classes and then re-used by every build
+    that uses the same set of classes. Plans are held within a bounded LRU cache
+
+    Attributes:
+        graph: Graph of the dependencies between spock classes
+        input_classes: input classes post lazy evaluation (i.e. the graph nodes)
+        topological_order: topological order of the class dependency graph
+        node_map: map of the class names to the underlying classes
+        cast_types: map of class names to a map of attribute names and the type to
+            cast any resolved references into
+        _cache: class level LRU cache of compiled plans
+        _max_size: max number of compiled plans to hold in the cache
+
+    """
+
+    _cache = OrderedDict()
+    _max_size = 64
+
+    def __init__(self, input_classes: Tuple[_C, ...], lazy: bool):
+        """Init call for BuildPlan
+
+        Args:
+            input_classes: tuple of @spock decorated classes
+            lazy: attempts to lazily find @spock decorated classes registered within
+                sys.modules["spock"].backend.config
+        """
+        self.graph = Graph(input_classes=input_classes, lazy=lazy)
+        self.input_classes = self.graph.nodes
+        self.topological_order = self.graph.topological_order
+        self.node_map = self.graph.node_map
+        self.cast_types = {
+            name: self._get_cast_types(spock_cls)
+            for name, spock_cls in self.node_map.items()
+        }
+
+    @classmethod
+    def get(cls, input_classes: Tuple[_C, ...], lazy: bool) -> "BuildPlan":
+        """Gets the compiled plan for the given classes -- compiles it on a cache miss
+
+        Args:
+            input_classes: tuple of @spock decorated classes
+            lazy: attempts to lazily find @spock decorated classes
+
+        Returns:
+            compiled BuildPlan
+
+        """
+        cache_key = (tuple(input_classes), lazy)
+        plan = cls._cache.get(cache_key)
+        if plan is None:
+            plan = cls(tuple(input_classes), lazy)
+            cls._cache[cache_key] = plan
+            # Evict the least recently used plan if over the size limit
+            if len(cls._cache) > cls._max_size:
+                cls._cache.popitem(last=False)
+        else:
+            cls._cache.move_to_end(cache_key)
+        return plan
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Clears all compiled plans
+
+        Returns:
+            None
+
+        """
+        cls._cache.clear()
+
+    @staticmethod
+    def _get_cast_types(spock_cls: _C) -> Dict[str, _T]:
+        """Gets the type to cast into for each attribute post reference resolution
+
+        Directory and file types are cast back to strings as they are validated
+        on instantiation
+
+        Args:
+            spock_cls: current spock class
+
+        Returns:
+            dictionary of attribute names and cast types
+
+        """
+        cast_types = {}
+        for attribute in spock_cls.__attrs_attrs__:
+            if getattr(attribute.type, "__name__", None) in ("directory", "file"):
+                cast_types[attribute.name] = str
+            else:
+                cast_types[attribute.name] = attribute.type
+        return cast_types
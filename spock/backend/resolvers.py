@@ -7,18 +7,116 @@
 import os
 import re
 from abc import ABC, abstractmethod
-from distutils.util import strtobool
-from typing import Any, ByteString, List, Optional, Pattern, Tuple, Union
+from functools import lru_cache
+from typing import Any, List, NamedTuple, Optional, Tuple, Union
 
-from spock.backend.utils import decrypt_value
+from spock.backend.utils import CryptoKeys, _str_2_bool, decrypt_value
 from spock.exceptions import (
-    _SpockCryptoResolverError,
     _SpockEnvResolverError,
     _SpockResolverError,
     _SpockVarResolverError,
 )
 from spock.utils import _T
 
+# Single pattern for every resolver reference: ${spock.env[.annotation]:body},
+# ${spock.crypto[.annotation]:body}, and ${spock.var:body}
+_REFERENCE_PATTERN = re.compile(
+    r"\$\{spock\.(?:(?P<kind>env|crypto)\.?(?P<annotation>[a-z]*?)|(?P<var>var)):"
+    r"(?P<body>[^}]+)\}"
+)
+_REFERENCE_PREFIX = "${spock."
+# Env and crypto references must be the whole value -- the body runs to the final `}`
+_WHOLE_VALUE_PATTERN = re.compile(
+    r"\$\{spock\.(?P<kind>env|crypto)\.?(?P<annotation>[a-z]*?):(?P<body>.*)\}"
+)
+
+
+class _Reference(NamedTuple):
+    """A single resolver reference within a string
+
+    Attributes:
+        kind: type of the reference (env, crypto, or var)
+        annotation: annotation of the reference (empty if not given)
+        body: string between the `:` and the closing `}`
+        matched: full matched string of the reference
+
+    """
+
+    kind: str
+    annotation: str
+    body: str
+    matched: str
+
+
+class _Template(NamedTuple):
+    """A string tokenized into literal and reference segments
+
+    Attributes:
+        segments: tuple of the literal strings and references in order
+        references: tuple of only the references in order
+
+    """
+
+    segments: Tuple[Union[str, _Reference], ...]
+    references: Tuple[_Reference, ...]
+
+    @property
+    def full(self) -> Optional[_Reference]:
+        """Returns the reference if the whole string is a single reference"""
+        if len(self.segments) == 1 and len(self.references) == 1:
+            return self.references[0]
+        return None
+
+
+_EMPTY_TEMPLATE = _Template(segments=(), references=())
+
+
+@lru_cache(maxsize=4096)
+def _tokenize(value: str) -> _Template:
+    """Tokenizes a string (once per unique string) into literal and reference segments
+
+    Args:
+        value: string to tokenize
+
+    Returns:
+        parsed template of the string
+
+    """
+    segments = []
+    references = []
+    position = 0
+    for match in _REFERENCE_PATTERN.finditer(value):
+        if match.start() > position:
+            segments.append(value[position : match.start()])
+        reference = _Reference(
+            kind=match.group("kind") or match.group("var"),
+            annotation=match.group("annotation") or "",
+            body=match.group("body"),
+            matched=match.group(0),
+        )
+        segments.append(reference)
+        references.append(reference)
+        position = match.end()
+    if position < len(value):
+        segments.append(value[position:])
+    return _Template(segments=tuple(segments), references=tuple(references))
+
+
+def _parse_template(value: Any) -> _Template:
+    """Gets the parsed template of a value (non strings never contain references)
+
+    Args:
+        value: current value
+
+    Returns:
+        parsed template of the value
+
+    """
+    # Most values never contain resolver syntax so skip the cache entirely
+    if not isinstance(value, str) or _REFERENCE_PREFIX not in value:
+        return _EMPTY_TEMPLATE
+    return _tokenize(value)
+
 
 class BaseResolver(ABC):
     """Base class for resolvers
@@ -69,38 +167,37 @@ class BaseResolver(ABC):
         return env_value, default_value
 
     @staticmethod
-    def _check_full_match(
-        full_regex_op: Pattern,
-        value: Any,
-    ) -> bool:
-        """Check if the value passed into the resolver matches the compiled regex op
+    def _full_reference(value: Any, kind: str) -> Optional[_Reference]:
+        """Gets the reference if the whole value is a single reference of the given kind
+
+        Values that start with the reference syntax and end with `}` but don't tokenize
+        into a single reference (e.g. `}` within the default) keep everything between
+        the `:` and the final `}` as the body -- anything else passes through
 
         Args:
-            full_regex_op: the full compiled regex
             value: the value passed into the resolver
+            kind: type of the reference (env or crypto)
 
         Returns:
-            boolean if there is a regex match
+            the reference or None if there is no match
 
         """
-        # If it's a string we can check the regex
-        if isinstance(value, str):
-            # Check the regex and return non None status
-            return full_regex_op.fullmatch(value) is not None
         # If it's not a string we can't resolve anything so just passthrough and
         # let spock handle the value
-        else:
-            return False
-
-    @staticmethod
-    def _check_multi_match(
-        full_regex_op: Pattern,
-        value: Any,
-    ) -> bool:
-        if isinstance(value, str):
-            return len(full_regex_op.findall(value)) >= 1
-        else:
-            return False
+        reference = _parse_template(value).full
+        if reference is not None:
+            return reference if reference.kind == kind else None
+        if not isinstance(value, str) or not value.startswith(_REFERENCE_PREFIX):
+            return None
+        match = _WHOLE_VALUE_PATTERN.fullmatch(value)
+        if match is not None and match.group("kind") == kind:
+            return _Reference(
+                kind=kind,
+                annotation=match.group("annotation"),
+                body=match.group("body"),
+                matched=value,
+            )
+        return None
 
     @staticmethod
     def _attempt_cast(maybe_env: Optional[str], value_type: _T, ref_value: str) -> Any:
@@ -123,7 +220,9 @@ class BaseResolver(ABC):
         try:
             if value_type.__name__ == "bool" and not isinstance(maybe_env, bool):
                 typed_env = (
-                    value_type(strtobool(maybe_env)) if maybe_env is not None else False
+                    value_type(_str_2_bool(maybe_env))
+                    if maybe_env is not None
+                    else False
                 )
             else:
                 typed_env = value_type(maybe_env) if maybe_env is not None else None
@@ -158,21 +257,17 @@ class BaseResolver(ABC):
         # exception
         return self._attempt_cast(maybe_env, value_type, ref_value)
 
-    def _regex_clip(
+    def _split_reference(
         self,
-        end_regex_op: Pattern,
-        clip_regex_op: Pattern,
+        reference: _Reference,
         value: str,
         allow_default: bool,
         allow_annotation: bool,
     ) -> Tuple[str, str, Optional[str]]:
-        """Applies the front and back regexes to the string value, determines defaults
-        and annotations
+        """Splits a parsed reference into its value, default, and annotation
 
         Args:
-            end_regex_op: compiled regex for the back half of the match
-            clip_regex_op: compiled regex for the front half of the match
-            full_regex_op: compiled full regex
+            reference: parsed reference
             value: current string value to resolve
             allow_default: if allowed to contain default value syntax
             allow_annotation: if allowed to contain annotation syntax
@@ -187,30 +282,21 @@ class BaseResolver(ABC):
             not supported
 
         """
-        # Based on the start and end regex ops find the value the user set
-        env_str = end_regex_op.split(clip_regex_op.split(value)[-1])[0]
-        if (
-            allow_annotation
-            and len(clip_regex_op.split(value)) > 2
-            and clip_regex_op.split(value)[1] != ""
-        ):
-            annotation = clip_regex_op.split(value)[1]
+        if allow_annotation and reference.annotation != "":
+            annotation = reference.annotation
             if annotation not in self._annotation_set:
                 raise _SpockResolverError(
                     f"Resolver annotation must be "
                     f"within {self._annotation_set} -- got `{annotation}`"
                 )
-        elif (
-            not allow_annotation
-            and len(clip_regex_op.split(value)) > 2
-            and clip_regex_op.split(value)[1] != ""
-        ):
+        elif not allow_annotation and reference.annotation != "":
             raise _SpockResolverError(
                 f"Found annotation style format however `{value}` does not "
                 f"support annotations"
             )
         else:
             annotation = None
+        env_str = reference.body
         # Attempt to split on a comma for a default value
         split_len = len(env_str.split(","))
         # Default found if the len is 2
@@ -235,80 +321,20 @@ class BaseResolver(ABC):
             default_value = "None"
         return env_value, default_value, annotation
 
-    def _apply_regex(
-        self,
-        end_regex_op: Pattern,
-        clip_regex_op: Pattern,
-        full_regex_op: Pattern,
-        value: str,
-        allow_default: bool,
-        allow_annotation: bool,
-        allow_multiple: bool = False,
-    ) -> List[Tuple[str, str, Optional[str]]]:
-        """Applies the front and back regexes to the string value, determines defaults
-        and annotations
-
-        Args:
-            end_regex_op: compiled regex for the back half of the match
-            clip_regex_op: compiled regex for the front half of the match
-            full_regex_op: compiled full regex
-            value: current string value to resolve
-            allow_default: if allowed to contain default value syntax
-            allow_annotation: if allowed to contain annotation syntax
-
-        Returns:
-            List of tuples containing the resolved string reference, the default value,
-            and the annotation string
-
-        Raises:
-            _SpockResolverError if annotation isn't within the supported set, annotation
-            is not supported, multiple `,` values are used, or defaults are given yet
-            not supported
-
-        """
-
-        # Split out multiple refs if allowed
-        multi_list = []
-        if allow_multiple:
-            multi_match = full_regex_op.findall(value)
-            for val in multi_match:
-                env_value, default_value, annotation = self._regex_clip(
-                    end_regex_op, clip_regex_op, val, allow_default, allow_annotation
-                )
-                multi_list.append((env_value, default_value, annotation, val))
-        else:
-            env_value, default_value, annotation = self._regex_clip(
-                end_regex_op, clip_regex_op, value, allow_default, allow_annotation
-            )
-            multi_list.append((env_value, default_value, annotation))
-        return multi_list
-
 
 class VarResolver(BaseResolver):
     """Class for resolving references to other variable definitions
 
     This needs to happen post instantiation of dependencies
 
+    References can be anywhere within a string (and multiple are allowed) --
+    ${spock.var:Class.attribute}
+
     Attributes:
         _annotation_set: current set of supported resolver annotations
-        CLIP_VAR_PATTERN: regex for the front half
-        CLIP_REGEX_OP: compiled regex for front half
-        END_VAR_PATTERN: regex for back half
-        END_REGEX_OP: compiled regex for back half
-        FULL_VAR_PATTERN: full regex pattern
-        FULL_REGEX_OP: compiled regex for full regex
 
     """
 
-    # VAR Resolver -- full regex is ^\${spock\.var\.?([a-z]*?):.*}$
-    CLIP_VAR_PATTERN = r"\$\{spock\.var\:"
-    MID_VAR_PATTERN = r"[^\}]+"
-    END_VAR_PATTERN = r"\}"
-    FULL_VAR_PATTERN = CLIP_VAR_PATTERN + MID_VAR_PATTERN + END_VAR_PATTERN
-    CLIP_REGEX_OP = re.compile(CLIP_VAR_PATTERN)
-    END_REGEX_OP = re.compile(END_VAR_PATTERN)
-    FULL_REGEX_OP = re.compile(FULL_VAR_PATTERN)
-
     def __init__(self):
         """Init for EnvResolver"""
         super(VarResolver, self).__init__()
@@ -324,10 +350,9 @@ class VarResolver(BaseResolver):
             bool if matched or not
 
         """
-        # Check the full regex for a match
-        return self._check_full_match(
-            self.FULL_REGEX_OP, value
-        ) or self._check_multi_match(self.FULL_REGEX_OP, value)
+        return any(
+            reference.kind == "var" for reference in _parse_template(value).references
+        )
 
     def get_regex_match_reference(
         self, value: Any
@@ -342,23 +367,23 @@ class VarResolver(BaseResolver):
             and the annotation string
 
         """
-        # Apply the regex
-        return_list = self._apply_regex(
-            self.END_REGEX_OP,
-            self.CLIP_REGEX_OP,
-            self.FULL_REGEX_OP,
-            value,
-            allow_default=False,
-            allow_annotation=False,
-            allow_multiple=True,
-        )
+        return_list = []
+        for reference in _parse_template(value).references:
+            if reference.kind == "var":
+                env_value, default_value, annotation = self._split_reference(
+                    reference,
+                    reference.matched,
+                    allow_default=False,
+                    allow_annotation=False,
+                )
+                return_list.append(
+                    (env_value, default_value, annotation, reference.matched)
+                )
         return return_list
 
     def _resolve(self, test_value: str, match_val: Any, regex_str: str, name: str):
-        # Check the full regex for a single full match -- add the start and end matches
-        # to the full regex pattern -- this is direct replacement
-        single_re = r"^" + re.escape(regex_str) + r"$"
-        if re.fullmatch(single_re, test_value) is not None:
+        # A single full match is direct replacement
+        if test_value == regex_str:
             maybe_val = match_val
         else:
             # Cast back to string as we are doing str substitution here prior to the
@@ -413,25 +438,13 @@ class VarResolver(BaseResolver):
 class EnvResolver(BaseResolver):
     """Class for resolving environmental variables
 
+    The reference must be the whole value -- ${spock.env.annotation:NAME, DEFAULT}
+
     Attributes:
         _annotation_set: current set of supported resolver annotations
-        CLIP_ENV_PATTERN: regex for the front half
-        CLIP_REGEX_OP: compiled regex for front half
-        END_ENV_PATTERN: regex for back half
-        END_REGEX_OP: compiled regex for back half
-        FULL_ENV_PATTERN: full regex pattern
-        FULL_REGEX_OP: compiled regex for full regex
 
     """
 
-    # ENV Resolver -- full regex is ^\${spock\.env\.?([a-z]*?):.*}$
-    CLIP_ENV_PATTERN = r"^\${spock\.env\.?([a-z]*?)\:"
-    CLIP_REGEX_OP = re.compile(CLIP_ENV_PATTERN)
-    END_ENV_PATTERN = r"\}$"
-    END_REGEX_OP = re.compile(END_ENV_PATTERN)
-    FULL_ENV_PATTERN = CLIP_ENV_PATTERN + r".*" + END_ENV_PATTERN
-    FULL_REGEX_OP = re.compile(FULL_ENV_PATTERN)
-
     def __init__(self):
         """Init for EnvResolver"""
         super(EnvResolver, self).__init__()
@@ -439,28 +452,12 @@ class EnvResolver(BaseResolver):
     def resolve(
         self, value: Any, value_type: _T, **kwargs
     ) -> Tuple[Any, Optional[str]]:
-        # Check the full regex for a match
-        regex_match = self._check_full_match(self.FULL_REGEX_OP, value)
-        # if there is a regex match it needs to be handled by the underlying resolver ops
-        if regex_match:
-            # Apply the regex
-            return_list = self._apply_regex(
-                self.END_REGEX_OP,
-                self.CLIP_REGEX_OP,
-                self.FULL_REGEX_OP,
-                value,
-                allow_default=True,
-                allow_annotation=True,
+        reference = self._full_reference(value, "env")
+        # if there is a match it needs to be handled by the underlying resolver ops
+        if reference is not None:
+            env_value, default_value, annotation = self._split_reference(
+                reference, value, allow_default=True, allow_annotation=True
             )
-            # Check the len such that it is only 1 -- if not something has gone wrong
-            # most likely with the resolver syntax
-            if len(return_list) > 1:
-                raise _SpockEnvResolverError(
-                    f"Length of regex match is `{len(return_list)}` but should only "
-                    f"be of len 1 -- check your syntax"
-                )
-            # Unpack based on len == 1
-            env_value, default_value, annotation = return_list[0]
             # Get the value from the env
             maybe_env = self._get_from_env(default_value, env_value)
             # Attempt to cast the value to its underlying type
@@ -504,61 +501,34 @@ class EnvResolver(BaseResolver):
 class CryptoResolver(BaseResolver):
     """Class for resolving cryptographic variables
 
+    The reference must be the whole value -- ${spock.crypto:ENCRYPTED}
+
     Attributes:
         _annotation_set: current set of supported resolver annotations
-        CLIP_CRYPTO_PATTERN: regex for the front half
-        CLIP_REGEX_OP: compiled regex for front half
-        END_ENV_PATTERN: regex for back half
-        END_REGEX_OP: compiled regex for back half
-        FULL_ENV_PATTERN: full regex pattern
-        FULL_REGEX_OP: compiled regex for full regex
-        _salt: current cryptographic salt
-        _key: current cryptographic key
+        _crypto: current cryptographic salt and key (only created when a crypto value is resolved)
 
     """
 
-    # CRYPTO Resolver -- full regex is ^\${spock\.crypto\.?([a-z]*?):.*}$
-    CLIP_CRYPTO_PATTERN = r"^\${spock\.crypto\.?([a-z]*?):"
-    CLIP_REGEX_OP = re.compile(CLIP_CRYPTO_PATTERN)
-    END_ENV_PATTERN = r"}$"
-    END_REGEX_OP = re.compile(END_ENV_PATTERN)
-    FULL_ENV_PATTERN = CLIP_CRYPTO_PATTERN + r".*" + END_ENV_PATTERN
-    FULL_REGEX_OP = re.compile(FULL_ENV_PATTERN)
-
-    def __init__(self, salt: str, key: ByteString):
+    def __init__(self, crypto: CryptoKeys):
         """Init for CryptoResolver
 
         Args:
-            salt: cryptographic salt to use
-            key: cryptographic key to use
+            crypto: cryptographic salt and key to use
         """
         super(CryptoResolver, self).__init__()
-        self._salt = salt
-        self._key = key
+        self._crypto = crypto
 
     def resolve(
         self, value: Any, value_type: _T, **kwargs
     ) -> Tuple[Any, Optional[str]]:
-        regex_match = self._check_full_match(self.FULL_REGEX_OP, value)
-        if regex_match:
-            return_list = self._apply_regex(
-                self.END_REGEX_OP,
-                self.CLIP_REGEX_OP,
-                self.FULL_REGEX_OP,
-                value,
-                allow_default=False,
-                allow_annotation=False,
+        reference = self._full_reference(value, "crypto")
+        if reference is not None:
+            crypto_value, default_value, annotation = self._split_reference(
+                reference, value, allow_default=False, allow_annotation=False
+            )
+            decrypted_value = decrypt_value(
+                crypto_value, self._crypto.key, self._crypto.salt
             )
-            # Check the len such that it is only 1 -- if not something has gone wrong
-            # most likely with the resolver syntax
-            if len(return_list) > 1:
-                raise _SpockCryptoResolverError(
-                    f"Length of regex match is `{len(return_list)}` but should only "
-                    f"be of len 1 -- check your syntax"
-                )
-            # Unpack based on len == 1
-            crypto_value, default_value, annotation = return_list[0]
-            decrypted_value = decrypt_value(crypto_value, self._key, self._salt)
             typed_decrypted = self._attempt_cast(
                 decrypted_value, value_type, crypto_value
             )
@@ -59,6 +59,7 @@ class BaseSaver(BaseHandler):  # pylint: disable=too-few-public-methods
         file_extension: str = ".yaml",
         tuner_payload: Optional[Spockspace] = None,
         fixed_uuid: Optional[str] = None,
+        cache_git_status: bool = False,
     ) -> None:  # pylint: disable=too-many-arguments
         """Writes Spock config to file
 
@@ -74,6 +75,7 @@ class BaseSaver(BaseHandler):  # pylint: disable=too-few-public-methods
             file_extension: what type of file to write
             tuner_payload: tuner level payload (unsampled)
             fixed_uuid: fixed uuid to allow for file overwrite
+            cache_git_status: reuse the cached git status instead of checking the working tree again
 
         Returns:
             None
@@ -105,7 +107,7 @@ class BaseSaver(BaseHandler):  # pylint: disable=too-few-public-methods
         if tuner_dict is not None:
             out_dict.update(tuner_dict)
         # Get extra info
-        extra_dict = add_info() if extra_info else None
+        extra_dict = add_info(cache_git_status=cache_git_status) if extra_info else None
         library_dict = get_packages() if extra_info else None
         try:
             self._supported_extensions.get(file_extension)().save(
@@ -81,3 +81,7 @@ class AttributeSpace:
 
 
 BuilderSpace = namedtuple("BuilderSpace", ["arguments", "spock_space"])
+
+BuildState = namedtuple(
+    "BuildState", ["arguments", "cls_fields", "var_graph", "merged_graph"]
+)
@@ -6,14 +6,93 @@
 """Attr utility functions for Spock"""
 
 import importlib
-from typing import Any, ByteString, Callable, Dict, List, Tuple, Type, Union
-
-from cryptography.fernet import Fernet
+import threading
+from functools import lru_cache
+from itertools import chain
+from typing import Any, ByteString, Callable, Dict, List, Optional, Tuple, Type, Union
 
 from spock.exceptions import _SpockValueError
 from spock.utils import _C, _T, _SpockVariadicGenericAlias
 
 
+class CryptoKeys:
+    """Holds the salt and key used for cryptography and only creates them on first use
+
+    Most configs never use any crypto annotations so generating (or reading) the salt
+    and key is deferred until a crypto annotation is seen or a save needs them
+
+    Attributes:
+        _factory: callable that returns a tuple of the salt and key
+        _lock: lock so the salt and key are only created once across threads
+        _values: tuple of the salt and key (None until first use)
+
+    """
+
+    def __init__(self, factory: Callable[[], Tuple[str, ByteString]]):
+        """Init for CryptoKeys
+
+        Args:
+            factory: callable that returns a tuple of the salt and key
+        """
+        self._factory = factory
+        self._lock = threading.Lock()
+        self._values: Optional[Tuple[str, ByteString]] = None
+
+    @classmethod
+    def from_values(cls, salt: Optional[str], key: Optional[ByteString]):
+        """Creates a CryptoKeys object from an existing salt and key
+
+        Args:
+            salt: salt used for cryptography
+            key: key used for cryptography
+
+        Returns:
+            CryptoKeys object that is already resolved
+
+        """
+        crypto = cls(None)
+        crypto._values = (salt, key)
+        return crypto
+
+    def _resolve(self) -> Tuple[str, ByteString]:
+        """Creates the salt and key if they haven't been already
+
+        Returns:
+            tuple of the salt and key
+
+        """
+        if self._values is None:
+            with self._lock:
+                if self._values is None:
+                    self._values = self._factory()
+                    self._factory = None
+        return self._values
+
+    @property
+    def created(self) -> bool:
+        """Returns if the salt and key have been created"""
+        return self._values is not None
+
+    @property
+    def salt(self) -> str:
+        """Returns the salt (creates it on first access)"""
+        return self._resolve()[0]
+
+    @property
+    def key(self) -> ByteString:
+        """Returns the key (creates it on first access)"""
+        return self._resolve()[1]
+
+    def __deepcopy__(self, memo):
+        # The salt and key are shared (never modified) so copies can point to the same
+        # object -- also keeps copying from creating the salt and key
+        return self
+
+    def __reduce__(self):
+        # Crossing process boundaries requires the actual values
+        return self.from_values, self._resolve()
+
+
 def encrypt_value(value: Any, key: Union[str, ByteString, bytes], salt: str):
     """Encrypts a given value with a key and salt
 
@@ -26,6 +105,8 @@ def encrypt_value(value: Any, key: Union[str, ByteString, bytes], salt: str):
         encrypted value
 
     """
+    from cryptography.fernet import Fernet
+
     # Make the class to encrypt
     encrypt = Fernet(key=key)
     # Encrypt the plaintext value
@@ -46,6 +127,8 @@ def decrypt_value(value: Any, key: Union[str, ByteString, bytes], salt: str):
         decrypted value
 
     """
+    from cryptography.fernet import Fernet
+
     # Make the class to encrypt
     decrypt = Fernet(key=key)
     # Decrypt back to plaintext value
@@ -53,6 +136,30 @@ def decrypt_value(value: Any, key: Union[str, ByteString, bytes], salt: str):
     return salted_password[: -len(salt)]
 
 
+def _str_2_bool(val: str) -> bool:
+    """Converts a string representation of truth to a boolean
+
+    Matches distutils.util.strtobool (which is slow to import and deprecated)
+
+    Args:
+        val: string to convert
+
+    Returns:
+        boolean of the string
+
+    Raises:
+        ValueError if the string is not a representation of truth
+
+    """
+    val = val.lower()
+    if val in ("y", "yes", "t", "true", "on", "1"):
+        return True
+    elif val in ("n", "no", "f", "false", "off", "0"):
+        return False
+    else:
+        raise ValueError(f"invalid truth value {val}")
+
+
 def _str_2_callable(val: str, **kwargs):
     """Tries to convert a string representation of a module and callable to the reference to the callable
 
@@ -207,6 +314,54 @@ def flatten_type_dict(type_dict: Dict):
     return flat_dict
 
 
+class FieldIndex:
+    """Precomputed field lookups for a set of input classes
+
+    Holds everything needed to validate a payload against a set of classes with hash based
+    lookups so that it can be built once and re-used for every config file (and include)
+
+    Attributes:
+        attr_fields: dictionary of class names to a list of attribute names
+        attr_field_sets: dictionary of class names to a set of attribute names
+        all_fields: set of all attribute names across all classes
+        class_names: set of all class names
+        type_fields: dictionary of class names to a dictionary of attribute names and generic types
+        flat_fields: flattened dictionary of attribute names and generic types
+
+    """
+
+    def __init__(self, input_classes: Tuple):
+        """Init call for FieldIndex
+
+        Args:
+            input_classes: tuple of input classes
+        """
+        self.attr_fields = get_attr_fields(input_classes)
+        self.attr_field_sets = {k: frozenset(v) for k, v in self.attr_fields.items()}
+        self.all_fields = frozenset(chain(*self.attr_fields.values()))
+        self.class_names = frozenset(self.attr_fields.keys())
+        self.type_fields = get_type_fields(input_classes)
+        self.flat_fields = flatten_type_dict(self.type_fields)
+
+
+@lru_cache(maxsize=64)
+def _get_field_index(input_classes: Tuple) -> FieldIndex:
+    return FieldIndex(input_classes)
+
+
+def get_field_index(input_classes: Union[List, Tuple]) -> FieldIndex:
+    """Gets the (cached) field index for a set of input classes
+
+    Args:
+        input_classes: list or tuple of input classes
+
+    Returns:
+        FieldIndex for the input classes
+
+    """
+    return _get_field_index(tuple(input_classes))
+
+
 def _get_iter(value: Union[List, Dict]):
     """Returns the iterator for the type
 
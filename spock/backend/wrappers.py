@@ -10,14 +10,71 @@ import argparse
 import yaml
 
 
+class _NoAliasDumper(yaml.Dumper):
+    """YAML dumper that never writes aliases -- keeps the global yaml.Dumper untouched"""
+
+    def ignore_aliases(self, data):
+        return True
+
+
+class _CryptoAttribute:
+    """Descriptor for the salt and key attached to a Spockspace
+
+    Values set directly on the Spockspace are stored in the instance dictionary as
+    usual -- otherwise the value is read from the attached lazy salt/key holder so the
+    salt and key are only created when something actually asks for them
+
+    Attributes:
+        _field: name of the value on the salt/key holder (salt or key)
+        _name: name of the attribute on the Spockspace
+
+    """
+
+    def __init__(self, field: str):
+        """Init for _CryptoAttribute
+
+        Args:
+            field: name of the value on the salt/key holder (salt or key)
+        """
+        self._field = field
+        self._name = f"__{field}__"
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        if self._name in obj.__dict__:
+            return obj.__dict__[self._name]
+        crypto = getattr(obj, "_crypto", None)
+        if crypto is None:
+            raise AttributeError(self._name)
+        return getattr(crypto, self._field)
+
+    def __set__(self, obj, value):
+        obj.__dict__[self._name] = value
+
+    def __delete__(self, obj):
+        # Only removes a directly set value -- the holder is shared with the builder
+        if self._name not in obj.__dict__ and getattr(obj, "_crypto", None) is None:
+            raise AttributeError(self._name)
+        obj.__dict__.pop(self._name, None)
+
+
 class Spockspace(argparse.Namespace):
     """Inherits from Namespace to implement a pretty print on the obj
 
     Overwrites the __repr__ method with a pretty version of printing
 
+    Attributes:
+        _crypto: lazily created salt and key (kept out of the instance dictionary)
+
     """
 
+    __slots__ = ("_crypto",)
+    __salt__ = _CryptoAttribute("salt")
+    __key__ = _CryptoAttribute("key")
+
     def __init__(self, **kwargs):
+        self._crypto = None
         super(Spockspace, self).__init__(**kwargs)
 
     @property
@@ -38,9 +95,10 @@ class Spockspace(argparse.Namespace):
     def __repr__(self):
         """Overloaded repr to pretty print the spock object"""
         # Remove aliases in YAML print
-        yaml.Dumper.ignore_aliases = lambda *args: True
         # yaml.emitter.Emitter.process_tag = lambda self, *args, **kw: None
-        return yaml.dump(self.__repr_dict__, default_flow_style=False)
+        return yaml.dump(
+            self.__repr_dict__, Dumper=_NoAliasDumper, default_flow_style=False
+        )
 
     def __iter__(self):
         """Iter for the underlying dictionary"""
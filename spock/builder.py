@@ -6,23 +6,26 @@
 """Handles the building/saving of the configurations from the Spock config classes"""
 
 import argparse
+import logging
 import os.path
 import sys
 from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
 from copy import deepcopy
 from pathlib import Path
-from typing import ByteString, Dict, List, Optional, Tuple, Type, Union
+from typing import Any, ByteString, Dict, List, Optional, Tuple, Type, Union
 from uuid import uuid4
 
 import attr
-from cryptography.fernet import Fernet
 
 from spock.backend.builder import AttrBuilder
 from spock.backend.payload import AttrPayload
 from spock.backend.resolvers import EnvResolver
 from spock.backend.saver import AttrSaver
+from spock.backend.utils import CryptoKeys
 from spock.backend.wrappers import Spockspace
 from spock.exceptions import _SpockCryptoError, _SpockEvolveError, _SpockValueError
+from spock.graph import IncludeGraph
 from spock.handlers import YAMLHandler
 from spock.helpers import to_dict
 from spock.utils import (
@@ -34,6 +37,8 @@ from spock.utils import (
     make_salt,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class ConfigArgBuilder:
     """Automatically generates dataclass instances from config file(s)
@@ -46,6 +51,7 @@ class ConfigArgBuilder:
     Attributes:
         _args: all command line args
         _arg_namespace: generated argument namespace
+        _build_state: BuildState of the generated argument namespace (used by update)
         _builder_obj: instance of a BaseBuilder class
         _dict_args: dictionary args from the command line
         _payload_obj: instance of a BasePayload class
@@ -57,13 +63,19 @@ class ConfigArgBuilder:
         _tune_namespace: namespace that hold the generated tuner related parameters
         _sample_count: current call to the sample function
         _fixed_uuid: fixed uuid to write the best file to the same path
+        _include_graph: IncludeGraph of the config files (and includes) read for the fixed configs
         _configs = configs if configs is None else [Path(c) for c in configs]
         _lazy: flag to lazily find @spock decorated classes registered within sys.modules["spock"].backend.config
             thus alleviating the need to pass all @spock decorated classes to *args
         _no_cmd_line: turn off cmd line args
         _desc: description for help
-        _salt: salt use for crypto purposes
-        _key: key used for crypto purposes
+        _crypto: salt and key used for crypto purposes (only created on first use)
+        _partial_load: only process the config file sections and general keys that map to the input classes
+        _include_workers: number of threads used to load sibling config includes concurrently
+        _json_codec: codec used to parse JSON config files (None uses orjson if installed)
+        _save_workers: number of writer threads used for non-blocking saves
+        _save_executor: thread pool that runs non-blocking saves (created on first use)
+        _instantiate_workers: number of threads used to instantiate independent classes concurrently
 
     """
 
@@ -77,6 +89,11 @@ class ConfigArgBuilder:
         s3_config: Optional[_T] = None,
         key: Optional[Union[str, ByteString]] = None,
         salt: Optional[str] = None,
+        partial_load: bool = False,
+        include_workers: Optional[int] = None,
+        save_workers: int = 1,
+        instantiate_workers: Optional[int] = None,
+        json_codec: Optional[str] = None,
         **kwargs,
     ):
         """Init call for ConfigArgBuilder
@@ -93,6 +110,19 @@ class ConfigArgBuilder:
             salt: either a path to a prior spock saved salt.yaml file or a string of the salt (can be an env reference)
             key: either a path to a prior spock saved key.yaml file, a ByteString of the key, or a str of the key
                 (can be an env reference)
+            partial_load: only process the config file sections and general keys that map to the input classes --
+                any other keys are dropped (instead of raising) which allows large monolithic config files to be used
+                with only a subset of classes
+            include_workers: number of threads used to load (and parse) the sibling config files of a `config:`
+                include concurrently -- each nested `config:` tag is loaded as its own set once its file is parsed
+                -- useful for S3 hosted includes (None loads them one after another)
+            save_workers: number of writer threads used for non-blocking saves (the default of 1 keeps the saves in
+                call order)
+            instantiate_workers: number of threads used to instantiate independent classes (those in the same level
+                of the dependency graph) concurrently -- useful when classes have slow `__post_hook__` checks (None
+                instantiates them one after another)
+            json_codec: codec used to parse JSON config files -- `json` (stdlib) or `orjson` (None uses orjson if it
+                is installed). Only applies to loading as saved JSON files are always written with the stdlib
             **kwargs: keyword args
 
         """
@@ -102,15 +132,30 @@ class ConfigArgBuilder:
         self._lazy = lazy
         self._no_cmd_line = no_cmd_line
         self._desc = desc
-        self._salt, self._key = self._maybe_crypto(key, salt, s3_config)
+        self._partial_load = partial_load
+        self._include_workers = include_workers
+        self._save_workers = save_workers
+        self._save_executor = None
+        self._instantiate_workers = instantiate_workers
+        self._json_codec = json_codec
+        self._crypto = self._maybe_crypto(key, salt, s3_config)
         # Build the payload and saver objects
-        self._payload_obj = AttrPayload(s3_config=s3_config)
+        self._payload_obj = AttrPayload(
+            s3_config=s3_config,
+            partial_load=partial_load,
+            include_workers=include_workers,
+            json_codec=json_codec,
+        )
         self._saver_obj = AttrSaver(s3_config=s3_config)
         # Split the fixed parameters from the tuneable ones (if present)
         fixed_args, tune_args = self._strip_tune_parameters(args)
         # The fixed parameter builder
         self._builder_obj = AttrBuilder(
-            *fixed_args, lazy=lazy, salt=self._salt, key=self._key, **kwargs
+            *fixed_args,
+            lazy=lazy,
+            crypto=self._crypto,
+            instantiate_workers=instantiate_workers,
+            **kwargs,
         )
         # The possible tunable parameter builder -- might return None
         self._tune_obj, self._tune_payload_obj = self._handle_tuner_objects(
@@ -121,6 +166,7 @@ class ConfigArgBuilder:
         self._tuner_status = None
         self._sample_count = 0
         self._fixed_uuid = str(uuid4())
+        self._include_graph = IncludeGraph()
         try:
             # Get all cmd line args and build overrides
             self._args = self._handle_cmd_line()
@@ -129,13 +175,15 @@ class ConfigArgBuilder:
                 payload_obj=self._payload_obj,
                 input_classes=self._builder_obj.input_classes,
                 ignore_args=tune_args,
+                include_graph=self._include_graph,
             )
             # Build the Spockspace from the payload and the classes
-            # Fixed configs
-            self._arg_namespace = self._builder_obj.generate(self._dict_args)
-            # Attach the key and salt to the Spockspace
-            self._arg_namespace.__salt__ = self.salt
-            self._arg_namespace.__key__ = self.key
+            # Fixed configs -- generation leaves the payload untouched so any later
+            # batch generation can copy it as needed
+            self._arg_namespace, self._build_state = self._builder_obj.build(
+                self._dict_args
+            )
+            self._arg_namespace._crypto = self._crypto
             # Get the payload from the config files -- hyper-parameters --
             # only if the obj is not None
             if self._tune_obj is not None:
@@ -173,6 +221,125 @@ class ConfigArgBuilder:
         """
         return self._arg_namespace
 
+    def generate_batch(
+        self,
+        payloads: Optional[List[Dict]] = None,
+        overrides: Optional[List[Dict]] = None,
+        n_workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
+    ) -> List[Spockspace]:
+        """Generate method that returns a Spockspace for each payload in a batch
+
+        Takes either a list of full payload dictionaries (same structure as a config file) or a list of override
+        dictionaries that are deep updated onto the payload this builder was constructed with. The class dependency
+        graph, field handler selection, and class preparation are shared across the batch so only the payload specific
+        work is done for each Spockspace
+
+        If n_workers is set the batch is built across a process pool. Each worker builds its own builder once from
+        the class identities (classes must be defined at the module level) and the results are returned in order. The
+        first payload that fails to build cancels the rest of the batch and the error is raised
+
+        Args:
+            payloads: list of payload dictionaries to build from
+            overrides: list of (possibly nested) dictionaries to deep update the base payload with
+            n_workers: number of worker processes to build with -- None builds within the current process
+            chunksize: number of payloads to send to a worker process at once
+
+        Returns:
+            list of Spockspaces in the same order as the given payloads or overrides
+
+        Raises:
+            _SpockValueError: if both or neither of payloads and overrides are given
+
+        """
+        batch = self._prepare_batch(payloads, overrides)
+        if n_workers is None:
+            return [self._generate_from_payload(payload) for payload in batch]
+        # Only import if needed
+        from spock.backend.batch import generate_parallel, has_crypto_references
+
+        # Workers only need the salt and key if they already exist (so every Spockspace
+        # shares them) or a payload uses crypto -- otherwise they stay uncreated
+        if self._crypto.created or has_crypto_references(batch):
+            salt, key = self.salt, self.key
+        else:
+            salt, key = None, None
+        spockspaces = generate_parallel(
+            self._builder_obj.input_classes,
+            batch,
+            n_workers=n_workers,
+            salt=salt,
+            key=key,
+            chunksize=chunksize,
+        )
+        for spockspace in spockspaces:
+            spockspace._crypto = self._crypto
+        return spockspaces
+
+    def _prepare_batch(
+        self, payloads: Optional[List[Dict]], overrides: Optional[List[Dict]]
+    ) -> List[Dict]:
+        """Validates and builds the payload dictionaries for a batch
+
+        Args:
+            payloads: list of payload dictionaries to build from
+            overrides: list of (possibly nested) dictionaries to deep update the base payload with
+
+        Returns:
+            list of validated payload dictionaries
+
+        """
+        if (payloads is None) == (overrides is None):
+            raise _SpockValueError(
+                "Batch generation requires exactly one of `payloads` or `overrides` to be set"
+            )
+        if overrides is not None:
+            payloads = [
+                deep_payload_update(deepcopy(self._dict_args), deepcopy(val))
+                for val in overrides
+            ]
+        else:
+            payloads = deepcopy(payloads)
+        if self._partial_load:
+            payloads = [
+                self._payload_obj.select_sections(
+                    payload, self._builder_obj.input_classes
+                )
+                for payload in payloads
+            ]
+        ignore_classes = (
+            self._tune_obj.input_classes if self._tune_obj is not None else []
+        )
+        # Check each payload against the input classes -- this is the same check
+        # the config files go through
+        return [
+            self._payload_obj._update_payload(
+                payload, self._builder_obj.input_classes, ignore_classes, {}
+            )
+            for payload in payloads
+        ]
+
+    def _generate_from_payload(self, payload: Dict) -> Spockspace:
+        """Builds a Spockspace from a payload dictionary and attaches the crypto info
+
+        Args:
+            payload: dictionary of parameter values
+
+        Returns:
+            argument namespace consisting of all config classes
+
+        """
+        spockspace = self._builder_obj.generate(payload)
+        # Attach the key and salt to the Spockspace -- they are only created if
+        # something (e.g. a save of crypto values) asks for them
+        spockspace._crypto = self._crypto
+        return spockspace
+
+    @property
+    def include_graph(self) -> IncludeGraph:
+        """Returns the graph of the config files (and their includes) that were read"""
+        return self._include_graph
+
     @property
     def tuner_status(self) -> Dict:
         """Returns a dictionary of all the necessary underlying tuner internals to
@@ -187,13 +354,13 @@ class ConfigArgBuilder:
 
     @property
     def salt(self):
-        """Returns the salt for crypto"""
-        return self._salt
+        """Returns the salt for crypto (creates it on first access)"""
+        return self._crypto.salt
 
     @property
     def key(self):
-        """Returns the key for crypto"""
-        return self._key
+        """Returns the key for crypto (creates it on first access)"""
+        return self._crypto.key
 
     def sample(self) -> Spockspace:
         """Sample method that constructs a namespace from the fixed parameters and
@@ -210,7 +377,7 @@ class ConfigArgBuilder:
             )
         return_tuple = self._tuner_state
         self._tuner_status = self._tuner_interface.tuner_status
-        self._tuner_state = self._tuner_interface.sample()
+        self._tuner_state = self._sample_tuner()
         self._sample_count += 1
         return return_tuple
 
@@ -239,11 +406,22 @@ class ConfigArgBuilder:
                 tuner_namespace=self._tune_namespace,
                 fixed_namespace=self._arg_namespace,
             )
-            self._tuner_state = self._tuner_interface.sample()
+            self._tuner_state = self._sample_tuner()
         except Exception as e:
             raise e
         return self
 
+    def _sample_tuner(self) -> Spockspace:
+        """Draws a sample from the tuner backend and attaches the salt/key holder
+
+        Returns:
+            Spockspace of the drawn sample merged with the fixed parameters
+
+        """
+        tuner_state = self._tuner_interface.sample()
+        tuner_state._crypto = self._crypto
+        return tuner_state
+
     def _print_usage_and_exit(
         self, msg: Optional[str] = None, sys_exit: bool = True, exit_code: int = 1
     ) -> None:
@@ -288,9 +466,14 @@ class ConfigArgBuilder:
                 from spock.addons.tune.payload import TunerPayload
 
                 tuner_builder = TunerBuilder(
-                    *tune_args, **kwargs, lazy=self._lazy, salt=self.salt, key=self.key
+                    *tune_args, **kwargs, lazy=self._lazy, crypto=self._crypto
+                )
+                tuner_payload = TunerPayload(
+                    s3_config=s3_config,
+                    partial_load=self._partial_load,
+                    include_workers=self._include_workers,
+                    json_codec=self._json_codec,
                 )
-                tuner_payload = TunerPayload(s3_config=s3_config)
                 return tuner_builder, tuner_payload
             except ImportError:
                 print(
@@ -425,7 +608,11 @@ class ConfigArgBuilder:
         return args
 
     def _get_payload(
-        self, payload_obj: Type[AttrPayload], input_classes: Tuple, ignore_args: List
+        self,
+        payload_obj: Type[AttrPayload],
+        input_classes: Tuple,
+        ignore_args: List,
+        include_graph: Optional[IncludeGraph] = None,
     ) -> Dict:
         """Get the parameter payload from the config file(s)
 
@@ -436,6 +623,7 @@ class ConfigArgBuilder:
             payload_obj: current payload object to call
             input_classes: classes to use to get payload
             ignore_args: args that were decorated for hyper-parameter tuning
+            include_graph: IncludeGraph to track the config file includes within (a new one is made if None)
 
         Returns:
             payload: dictionary of parameter values
@@ -445,12 +633,14 @@ class ConfigArgBuilder:
             # Call sys exit with a clean code as this is the help call which is not unexpected behavior
             self._print_usage_and_exit(sys_exit=True, exit_code=0)
         payload = {}
-        dependencies = {"paths": [], "rel_paths": [], "roots": []}
+        dependencies = IncludeGraph() if include_graph is None else include_graph
         if payload_obj is not None:
             # Make sure we are actually trying to map to input classes
             if len(input_classes) > 0:
                 # If configs are present then iterate through them and deal with the payload
                 if len(self._args.config) > 0:
+                    # Download any S3 hosted root configs concurrently
+                    payload_obj.prefetch_s3(self._args.config)
                     for configs in self._args.config:
                         payload_update = payload_obj.payload(
                             input_classes,
@@ -481,7 +671,9 @@ class ConfigArgBuilder:
         file_extension: str = ".yaml",
         tuner_payload: Optional[Spockspace] = None,
         fixed_uuid: str = None,
-    ) -> _T:
+        non_blocking: bool = False,
+        cache_git_status: bool = False,
+    ) -> Union[_T, Future]:
         """Private interface -- saves the current config setup to file with a UUID
 
         Args:
@@ -493,9 +685,12 @@ class ConfigArgBuilder:
             file_extension: file type to write (default: yaml)
             tuner_payload: tuner level payload (unsampled)
             fixed_uuid: fixed uuid to allow for file overwrite
+            non_blocking: snapshot the payload(s) and save on the writer pool
+            cache_git_status: reuse the git status cached with the rest of the provenance info instead of checking
+                the working tree again
 
         Returns:
-            self so that functions can be chained
+            self so that functions can be chained (or a Future of the save if non_blocking)
         """
         if user_specified_path is not None:
             save_path = Path(user_specified_path)
@@ -506,8 +701,7 @@ class ConfigArgBuilder:
                 "Save did not receive a valid path from: (1) markup file(s) or (2) "
                 "the keyword arg user_specified_path"
             )
-        # Call the saver class and save function
-        self._saver_obj.save(
+        save_args = (
             payload,
             save_path,
             file_name,
@@ -516,9 +710,29 @@ class ConfigArgBuilder:
             file_extension,
             tuner_payload,
             fixed_uuid,
+            cache_git_status,
         )
+        if non_blocking:
+            # Snapshot the payloads so later changes don't leak into the saved file
+            return self._get_save_executor().submit(
+                self._saver_obj.save, *deepcopy(save_args)
+            )
+        # Call the saver class and save function
+        self._saver_obj.save(*save_args)
         return self
 
+    def _get_save_executor(self) -> ThreadPoolExecutor:
+        """Gets the writer pool for non-blocking saves -- created on first use
+
+        Returns:
+            thread pool that runs the saves
+        """
+        if self._save_executor is None:
+            self._save_executor = ThreadPoolExecutor(
+                max_workers=self._save_workers, thread_name_prefix="spock-save"
+            )
+        return self._save_executor
+
     def save(
         self,
         file_name: str = None,
@@ -527,7 +741,9 @@ class ConfigArgBuilder:
         extra_info: bool = True,
         file_extension: str = ".yaml",
         add_tuner_sample: bool = False,
-    ) -> _T:
+        non_blocking: bool = False,
+        cache_git_status: bool = False,
+    ) -> Union[_T, Future]:
         """Saves the current config setup to file with a UUID
 
         Args:
@@ -537,9 +753,13 @@ class ConfigArgBuilder:
             extra_info: additional info to write to saved config (run date and git info)
             file_extension: file type to write (default: yaml)
             add_tuner_sample: save the current tuner sample to the payload
+            non_blocking: snapshot the current config and save it in the background -- returns a Future whose
+                result() raises any error from the save
+            cache_git_status: reuse the git status cached with the rest of the provenance info (faster for repeated
+                saves) instead of checking the working tree again
 
         Returns:
-            self so that functions can be chained
+            self so that functions can be chained (or a Future of the save if non_blocking)
         """
         if user_specified_path is not None:
             user_specified_path = Path(user_specified_path)
@@ -555,27 +775,27 @@ class ConfigArgBuilder:
                 if file_name is None
                 else f"{file_name}.hp.sample.{self._sample_count+1}"
             )
-            self._save(
+            return self._save(
                 self._tuner_state,
                 file_name,
                 user_specified_path,
                 create_save_path,
                 extra_info,
                 file_extension,
+                non_blocking=non_blocking,
+                cache_git_status=cache_git_status,
             )
-        else:
-            self._save(
-                self._arg_namespace,
-                file_name,
-                user_specified_path,
-                create_save_path,
-                extra_info,
-                file_extension,
-                tuner_payload=self._tune_namespace
-                if self._tune_obj is not None
-                else None,
-            )
-        return self
+        return self._save(
+            self._arg_namespace,
+            file_name,
+            user_specified_path,
+            create_save_path,
+            extra_info,
+            file_extension,
+            tuner_payload=self._tune_namespace if self._tune_obj is not None else None,
+            non_blocking=non_blocking,
+            cache_git_status=cache_git_status,
+        )
 
     def save_best(
         self,
@@ -584,7 +804,9 @@ class ConfigArgBuilder:
         create_save_path: bool = True,
         extra_info: bool = True,
         file_extension: str = ".yaml",
-    ) -> _T:
+        non_blocking: bool = False,
+        cache_git_status: bool = False,
+    ) -> Union[_T, Future]:
         """Saves the current best config setup to file
 
         Args:
@@ -593,9 +815,13 @@ class ConfigArgBuilder:
             create_save_path: bool to create the path to save if called
             extra_info: additional info to write to saved config (run date and git info)
             file_extension: file type to write (default: yaml)
+            non_blocking: snapshot the current best config and save it in the background -- returns a Future whose
+                result() raises any error from the save
+            cache_git_status: reuse the git status cached with the rest of the provenance info (faster for repeated
+                saves) instead of checking the working tree again
 
         Returns:
-            self so that functions can be chained
+            self so that functions can be chained (or a Future of the save if non_blocking)
         """
         if self._tune_obj is None:
             raise ValueError(
@@ -603,18 +829,20 @@ class ConfigArgBuilder:
                 f" method for saving non hyper-parameter tuning runs"
             )
         file_name = f"hp.best" if file_name is None else f"{file_name}.hp.best"
-        self._save(
-            Spockspace(**vars(self._arg_namespace), **vars(self.best[0])),
+        payload = Spockspace(**vars(self._arg_namespace), **vars(self.best[0]))
+        payload._crypto = self._crypto
+        return self._save(
+            payload,
             file_name,
             user_specified_path,
             create_save_path,
             extra_info,
             file_extension,
             fixed_uuid=self._fixed_uuid,
+            non_blocking=non_blocking,
+            cache_git_status=cache_git_status,
         )
 
-        return self
-
     @property
     def config_2_dict(self) -> Dict:
         """Dictionary representation of the arg payload"""
@@ -649,7 +877,8 @@ class ConfigArgBuilder:
 
         This will map the differences between the passed in instantiated objects and the underlying class definitions
         to the underlying namespace -- this essentially allows you to 'evolve' the Spockspace similar to how attrs
-        allows for class evolution -- returns a new Spockspace object
+        allows for class evolution -- returns a new Spockspace object. Instances that aren't evolved (and don't
+        reference an evolved class) are shared by reference with the current Spockspace
 
         Args:
             *args: variable number of instantiated @spock decorated classes to evolve parameters with
@@ -675,128 +904,101 @@ class ConfigArgBuilder:
                     f"Passed class `{k}` into `evolve()` but that class in not within the set of input "
                     f"classes {repr(self._builder_obj.graph.node_names)}"
                 )
-        # Create a new copy of the object
-        new_arg_namespace = deepcopy(self._arg_namespace)
-        # Determine the order of overwrite ops -- based on the topological order
-        topo_idx = sorted(
-            zip(
-                [
-                    self._builder_obj.graph.topological_order.index(type(v).__name__)
-                    for v in args
-                ],
-                args,
-            )
-        )
-        args = {type(v).__name__: v for _, v in topo_idx}
-        # Walk through the now sorted set of evolve classes
-        for k, v in args.items():
-            # Get the class name from the object
-            cls_name = type(v).__name__
-            # Swap in the value to the new object
-            # Note: we don't need to evolve here as it's a fully new obj
-            setattr(new_arg_namespace, cls_name, v)
-            # Recurse upwards through the deps stack and evolve all the necessary classes
-            new_arg_namespace, all_cls = self._recurse_upwards(
-                new_arg_namespace, cls_name, args
-            )
+        graph = self._builder_obj.graph
+        evolved = {type(v).__name__: v for v in args}
+        # Structural sharing -- every instance that isn't evolved (or downstream of an
+        # evolved class) is re-used by reference since the instances are frozen
+        new_arg_namespace = Spockspace(**vars(self._arg_namespace))
+        new_arg_namespace._crypto = self._crypto
+        changed = {}
+        # Deps come before the classes that reference them so one pass in topological
+        # order swaps every changed child into its (possibly also evolved) parents
+        affected = graph.downstream(set(evolved.keys()))
+        for cls_name in graph.topological_order:
+            if cls_name not in affected:
+                continue
+            instance = evolved.get(cls_name, getattr(new_arg_namespace, cls_name))
+            changed[cls_name] = self._evolve_references(instance, changed)
+            setattr(new_arg_namespace, cls_name, changed[cls_name])
         return new_arg_namespace
 
-    def _recurse_upwards(
-        self, new_arg_namespace: Spockspace, current_cls: str, all_cls: Dict
-    ) -> Tuple[Spockspace, Dict]:
-        """Using the underlying graph work recurse upwards through the parents and swap in the correct values
+    def update(self, overrides: Dict[str, Any]) -> Spockspace:
+        """Incrementally updates parameter values and only re-builds the affected classes
+
+        Maps the new values into the underlying payload and then only re-builds the changed
+        classes and the classes downstream of them (via class references or `${spock.var:...}`
+        references) -- every other instance is shared with the current Spockspace. The builder
+        keeps the updated payload and Spockspace so subsequent calls (e.g. `generate()` or
+        `save()`) use the new values
 
         Args:
-            new_arg_namespace: new Spockspace object
-            current_cls: current name of the cls
-            all_cls: dict of the variable number of @spock decorated classes to evolve parameters with
+            overrides: dictionary of `Class.field` keys and the new values
 
         Returns:
-            modified new_arg_namespace and the updated evolve class dict
+            updated Spockspace
+
+        Raises:
+            _SpockValueError: if a key doesn't map to a field of one of the input classes
 
         """
-        # Get the parent deps from the graph
-        parents = self._builder_obj.dag[current_cls]
-        if len(parents) > 0:
-            for parent_cls in parents:
-                parent_name = parent_cls.__name__
-                # Change the parent classes in the Spockspace
-                new_arg_namespace = self._set_matching_attrs_by_name(
-                    new_arg_namespace, current_cls, parent_name
+        updates = {}
+        for k, v in overrides.items():
+            cls_name, _, field = k.partition(".")
+            if cls_name not in self._builder_obj.graph.node_names:
+                raise _SpockValueError(
+                    f"Passed `{k}` into `update()` but the class `{cls_name}` is not within the set of input "
+                    f"classes {repr(self._builder_obj.graph.node_names)}"
                 )
-                # if the parent is in the evolve classes then morph them too
-                if parent_name in all_cls.keys():
-                    all_cls = self._set_matching_attrs_by_name_args(
-                        current_cls, parent_name, all_cls
-                    )
-                # then recurse to the parents
-                new_arg_namespace, all_cls = self._recurse_upwards(
-                    new_arg_namespace, parent_name, all_cls
+            if field not in attr.fields_dict(
+                self._builder_obj.graph.node_map[cls_name]
+            ):
+                raise _SpockValueError(
+                    f"Passed `{k}` into `update()` but `{field}` is not a parameter of the class `{cls_name}` -- "
+                    f"keys must be of the form `Class.field`"
                 )
-        return new_arg_namespace, all_cls
+            updates.setdefault(cls_name, {}).update({field: v})
+        # Only the changed sections are checked and converted -- the rest of the payload
+        # is shared with the current one
+        ignore_classes = (
+            self._tune_obj.input_classes if self._tune_obj is not None else []
+        )
+        updates = self._payload_obj._update_payload(
+            deepcopy(updates), self._builder_obj.input_classes, ignore_classes, {}
+        )
+        spockspace, self._build_state = self._builder_obj.update(
+            self._build_state, self._arg_namespace, updates
+        )
+        spockspace._crypto = self._crypto
+        self._dict_args = {
+            **self._dict_args,
+            **{k: {**self._dict_args.get(k, {}), **v} for k, v in updates.items()},
+        }
+        self._arg_namespace = spockspace
+        return spockspace
 
     @staticmethod
-    def _set_matching_attrs_by_name_args(
-        current_cls_name: str, parent_cls_name: str, all_cls: Dict
-    ) -> Dict:
-        """Sets the value of an attribute by matching it to a spock class name
+    def _evolve_references(instance: _C, changed: Dict) -> _C:
+        """Swaps any changed classes into the attributes of an instance that reference them
 
         Args:
-            current_cls_name: current name of the changed class
-            parent_cls_name: name of the parent class that contains a reference to the current class
-            all_cls: dict of the variable number of @spock decorated classes to evolve parameters with
+            instance: instance of a @spock decorated class
+            changed: dictionary of class names to the changed (evolved) instances
 
         Returns:
-            modified all_cls dictionary
-
-        """
-        new_arg_namespace = all_cls[parent_cls_name]
-        names = attr.fields_dict(type(new_arg_namespace)).keys()
-        for v in names:
-            if type(getattr(new_arg_namespace, v)).__name__ == current_cls_name:
-                # Some evolution magic -- attr library wants kwargs so trick it by unrolling the dict
-                # This creates a new object
-                new_obj = attr.evolve(
-                    new_arg_namespace,
-                    **{v: all_cls[current_cls_name]},
-                )
-                all_cls[parent_cls_name] = new_obj
-                print(
-                    f"Evolved CLS Dependency: Parent = {parent_cls_name}, Child = {current_cls_name}, Value = {v}"
-                )
-        return all_cls
-
-    @staticmethod
-    def _set_matching_attrs_by_name(
-        new_arg_namespace: Spockspace, current_cls_name: str, parent_cls_name: str
-    ) -> Spockspace:
-        """Sets the value of an attribute by matching it to a spock class name
+            the instance or a new (evolved) instance if any referenced classes changed
 
-        Args:
-            new_arg_namespace: new Spockspace object
-            current_cls_name: current name of the changed class
-            parent_cls_name: name of the parent class that contains a reference to the current class
-
-        Returns:
-            modified new_arg_namespace
-
-        """
-        parent_attr = getattr(new_arg_namespace, parent_cls_name)
-        names = attr.fields_dict(type(parent_attr)).keys()
-        for v in names:
-            if type(getattr(parent_attr, v)).__name__ == current_cls_name:
-                # Some evolution magic -- attr library wants kwargs so trick it by unrolling the dict
-                # This creates a new object
-                new_obj = attr.evolve(
-                    getattr(new_arg_namespace, parent_cls_name),
-                    **{v: getattr(new_arg_namespace, current_cls_name)},
-                )
-                # Swap the new object into the existing attribute slot
-                setattr(new_arg_namespace, parent_cls_name, new_obj)
-                print(
-                    f"Evolved: Parent = {parent_cls_name}, Child = {current_cls_name}, Value = {v}"
+        """
+        updates = {}
+        for k in attr.fields_dict(type(instance)).keys():
+            ref_name = type(getattr(instance, k)).__name__
+            if ref_name in changed:
+                updates[k] = changed[ref_name]
+                logger.debug(
+                    f"Evolved: Parent = {type(instance).__name__}, Child = {ref_name}, Value = {k}"
                 )
-        return new_arg_namespace
+        # Some evolution magic -- attr library wants kwargs so trick it by unrolling the dict
+        # This creates a new object
+        return attr.evolve(instance, **updates) if len(updates) > 0 else instance
 
     def _maybe_crypto(
         self,
@@ -804,9 +1006,13 @@ class ConfigArgBuilder:
         salt: Optional[str],
         s3_config: Optional[_T] = None,
         salt_len: int = 16,
-    ) -> Tuple[str, ByteString]:
+    ) -> CryptoKeys:
         """Handles setting up the underlying cryptography needs
 
+        A generated salt and key are only created on first use (a crypto annotation or a
+        save that needs them) -- a given salt or key is read right away so any issue
+        with it is raised at build time
+
         Args:
             salt: either a path to a prior spock saved salt.yaml file or a string of the salt (can be an env reference)
             key: either a path to a prior spock saved key.yaml file, a ByteString of the key, or a str of the key
@@ -815,13 +1021,21 @@ class ConfigArgBuilder:
             salt_len: length of the salt to create
 
         Returns:
-            tuple containing a salt and a key that spock can use to hide parameters
+            CryptoKeys object holding the salt and key that spock can use to hide parameters
 
         """
-        env_resolver = EnvResolver()
-        salt = self._get_salt(salt, env_resolver, salt_len, s3_config)
-        key = self._get_key(key, env_resolver, s3_config)
-        return salt, key
+
+        def _create() -> Tuple[str, ByteString]:
+            env_resolver = EnvResolver()
+            return (
+                self._get_salt(salt, env_resolver, salt_len, s3_config),
+                self._get_key(key, env_resolver, s3_config),
+            )
+
+        crypto = CryptoKeys(_create)
+        if salt is not None or key is not None:
+            _ = crypto.salt
+        return crypto
 
     def _get_salt(
         self,
@@ -870,6 +1084,8 @@ class ConfigArgBuilder:
 
         """
         if key is None:
+            from cryptography.fernet import Fernet
+
             key = Fernet.generate_key()
         # Byte string is assumed to be a direct key
         elif os.path.splitext(key)[1] in {".yaml", ".YAML", ".yml", ".YML"}:
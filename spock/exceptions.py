@@ -74,3 +74,9 @@ class _SpockFieldHandlerError(Exception):
     """Custom exception for failing within the field handler"""
 
     pass
+
+
+class _SpockS3UploadError(Exception):
+    """Custom exception for failed background S3 uploads"""
+
+    pass
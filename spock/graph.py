@@ -5,20 +5,37 @@
 
 """Handles creation and ops for DAGs"""
 
+import heapq
+import os
 import sys
-from abc import ABC, abstractmethod, abstractproperty
-from typing import Dict, Generator, List, Set, Tuple, Union
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Callable, Dict, Generator, List, Optional, Set, Tuple, Union
 
 from spock.backend.resolvers import VarResolver
 from spock.exceptions import _SpockInstantiationError, _SpockVarResolverError
-from spock.utils import _C, _find_all_spock_classes
+from spock.utils import (
+    _C,
+    _T,
+    _find_all_spock_classes,
+    check_path_s3,
+    path_object_to_s3path,
+)
 
 
 class BaseGraph(ABC):
     """Class that holds graph methods
 
+    The node maps, adjacency and topological order are computed once (after the graph
+    is built) and then re-used on every access. Sorting and cycle detection use Kahn's
+    algorithm which is iterative (deep chains of classes can't hit the recursion limit)
+    and breaks ties by node order so the topological order is deterministic
+
     Attributes:
         _dag: graph of the dependencies between spock classes
+        _whoami: str value of whom the caller is
+        _memo: cache of the computed graph properties
+
     """
 
     def __init__(self, dag: Dict, whoami: str):
@@ -30,14 +47,38 @@ class BaseGraph(ABC):
         """
         self._dag = dag
         self._whoami = whoami
+        # Anything computed while the nodes were still being gathered is dropped
+        self._memo = {}
         # Validate (No cycles in DAG)
         if self._has_cycles() is True:
             raise _SpockInstantiationError(
                 f"Cycle detected within the constructed DAG from {self._whoami} - "
                 f"Please remove any cyclic references. DAG Dictionary {{Node: Edges}} "
-                f"`{self.dag}`"
+                f"`{self.dag}` -- Nodes within or downstream of the cycle(s): "
+                f"{self._blocked_nodes()}"
             )
 
+    def _memoize(self, name: str, fn: Callable[[], _T]) -> _T:
+        """Computes a graph property once and re-uses it on every other access
+
+        Nothing is cached until the graph is fully built (i.e. the base init has run) as
+        the nodes might still be changing (e.g. lazy evaluation)
+
+        Args:
+            name: name of the property
+            fn: callable that computes the property
+
+        Returns:
+            value of the property
+
+        """
+        memo = self.__dict__.get("_memo")
+        if memo is None:
+            return fn()
+        if name not in memo:
+            memo[name] = fn()
+        return memo[name]
+
     @property
     def dag(self):
         """Returns the DAG"""
@@ -52,17 +93,21 @@ class BaseGraph(ABC):
     @property
     def node_names(self):
         """Returns the node names"""
-        return {f"{k.__name__}" for k in self.nodes}
+        return self._memoize("node_names", lambda: set(self.node_map.keys()))
 
     @property
     def node_map(self):
         """Returns a map of the node names to the underlying classes"""
-        return {f"{k.__name__}": k for k in self.nodes}
+        return self._memoize(
+            "node_map", lambda: {f"{k.__name__}": k for k in self.nodes}
+        )
 
     @property
     def reverse_map(self):
         """Returns a map from the underlying classes to the node names"""
-        return {k: f"{k.__name__}" for k in self.nodes}
+        return self._memoize(
+            "reverse_map", lambda: {k: f"{k.__name__}" for k in self.nodes}
+        )
 
     @property
     def roots(self):
@@ -70,9 +115,58 @@ class BaseGraph(ABC):
         return [self.node_map[k] for k, v in self.dag.items() if len(v) == 0]
 
     @property
-    def topological_order(self):
+    def topological_order(self) -> List:
         """Returns the topological sort of the DAG"""
-        return self._topological_sort()
+        return self._memoize("topological_order", self._topological_sort)
+
+    @property
+    def topological_index(self) -> Dict:
+        """Returns a map of the node names to their position in the topological sort"""
+        return self._memoize(
+            "topological_index",
+            lambda: {k: idx for idx, k in enumerate(self.topological_order)},
+        )
+
+    @property
+    def topological_levels(self) -> List[List]:
+        """Returns the topological sort of the DAG split into levels
+
+        Each level is an antichain (no node within a level depends on another node of the
+        same level) and only depends on nodes within earlier levels -- nodes within a
+        level keep their topological order
+
+        """
+        return self._memoize("topological_levels", self._topological_levels)
+
+    @property
+    def _adjacency(self) -> Dict:
+        """Returns a map of node names to the names of their edges (in node order)"""
+        return self._memoize("_adjacency", self._build_adjacency)
+
+    @property
+    def _kahn_order(self) -> List:
+        """Returns all DAG node names that Kahn's algorithm could sort"""
+        return self._memoize("_kahn_order", self._kahn)
+
+    def downstream(self, names: Set[str]) -> Set[str]:
+        """Finds the given nodes and every node that (transitively) depends on them
+
+        Args:
+            names: set of node names to start from
+
+        Returns:
+            set of the node names
+
+        """
+        adjacency = self._adjacency
+        found = set(names)
+        stack = list(names)
+        while len(stack) > 0:
+            for val in adjacency.get(stack.pop(), ()):
+                if val not in found:
+                    found.add(val)
+                    stack.append(val)
+        return found
 
     @abstractmethod
     def _build(self) -> Dict:
@@ -84,94 +178,110 @@ class BaseGraph(ABC):
         """
         pass
 
+    @staticmethod
+    def _edge_name(val) -> str:
+        """Gets the node name of an edge (edges are either classes or names)
+
+        Args:
+            val: edge value
+
+        Returns:
+            name of the node the edge points to
+
+        """
+        return val.__name__ if hasattr(val, "__name__") else val
+
+    def _build_adjacency(self) -> Dict:
+        """Builds the adjacency (with edges as node names) of the DAG
+
+        Nodes are ordered by the order of the nodes property followed by any DAG keys that
+        aren't nodes -- this ordering is used to break ties within the topological sort
+
+        Returns:
+            dictionary of node names to the list of edge names
+
+        """
+        order = dict.fromkeys(self.node_map.keys())
+        order.update(dict.fromkeys(self.dag.keys()))
+        return {k: [self._edge_name(val) for val in self.dag.get(k, ())] for k in order}
+
+    def _kahn(self) -> List:
+        """Kahn's algorithm -- repeatedly removes nodes without any incoming edges
+
+        Ties (multiple nodes without incoming edges) are broken by node order
+
+        Returns:
+            list of the node names in topological order (nodes within or downstream of a
+            cycle are never removed so are missing from the list)
+
+        """
+        adjacency = self._adjacency
+        position = {k: idx for idx, k in enumerate(adjacency.keys())}
+        names = list(adjacency.keys())
+        in_degree = dict.fromkeys(names, 0)
+        for edges in adjacency.values():
+            for val in edges:
+                if val in in_degree:
+                    in_degree[val] += 1
+        ready = [position[k] for k, v in in_degree.items() if v == 0]
+        heapq.heapify(ready)
+        order = []
+        while len(ready) > 0:
+            node = names[heapq.heappop(ready)]
+            order.append(node)
+            for val in adjacency[node]:
+                if val in in_degree:
+                    in_degree[val] -= 1
+                    if in_degree[val] == 0:
+                        heapq.heappush(ready, position[val])
+        return order
+
     def _has_cycles(self) -> bool:
-        """Uses DFS to check for cycles within the given graph
+        """Checks for cycles within the given graph via Kahn's algorithm
 
         Returns:
             boolean if a cycle is found
 
         """
-        # DFS w/ recursion stack for DAG cycle detection
-        visited = {key: False for key in self.dag.keys()}
-        all_nodes = list(visited.keys())
-        recursion_stack = {key: False for key in self.dag.keys()}
-        # Recur for all edges
-        for node in all_nodes:
-            if visited.get(node) is False:
-                # Surface the recursive checks
-                if self._cycle_dfs(node, visited, recursion_stack) is True:
-                    return True
-        return False
-
-    def _cycle_dfs(self, node: str, visited: Dict, recursion_stack: Dict) -> bool:
-        """DFS via a recursion stack for cycles
+        return len(self._kahn_order) != len(self._adjacency)
 
-        Args:
-            node: current graph node (spock class type)
-            visited: dictionary of visited nodes
-            recursion_stack: dictionary that is the recursion stack that is used to find cycles
+    def _blocked_nodes(self) -> List:
+        """Gets the nodes that couldn't be sorted (within or downstream of a cycle)
 
         Returns:
-            boolean if a cycle is found
+            list of node names
 
         """
-        # Update the visited nodes
-        visited.update({node: True})
-        # Update recursion stack
-        recursion_stack.update({node: True})
-        # Recur through the edges
-        for val in self.dag.get(node):
-            if visited.get(self.reverse_map[val]) is False:
-                # The recursion returns True then works it up the stack
-                if (
-                    self._cycle_dfs(self.reverse_map[val], visited, recursion_stack)
-                    is True
-                ):
-                    return True
-            # If the vertex is already in the recursion stack then we have a cycle
-            elif recursion_stack.get(self.reverse_map[val]) is True:
-                return True
-        # Reset the stack for the current node if we've completed the DFS from this node
-        recursion_stack.update({node: False})
-        return False
+        sorted_nodes = set(self._kahn_order)
+        return [k for k in self._adjacency.keys() if k not in sorted_nodes]
 
-    def _topological_sort(self) -> List:
-        """Topologically sorts the DAG
+    def _topological_levels(self) -> List[List]:
+        """Splits the topological order into levels by the longest path from a root
 
         Returns:
-            list of topological order
+            list of the levels (lists of node names)
 
         """
-        # DFS for topological sort
-        # https://en.wikipedia.org/wiki/Topological_sorting
-        visited = {key: False for key in self.node_names}
-        all_nodes = list(visited.keys())
-        stack = []
-        for node in all_nodes:
-            if visited.get(node) is False:
-                self._topological_sort_dfs(node, visited, stack)
-        stack.reverse()
-        return stack
-
-    def _topological_sort_dfs(self, node: str, visited: Dict, stack: List) -> None:
-        """Depth first search
+        depth = dict.fromkeys(self._kahn_order, 0)
+        for node in self._kahn_order:
+            for val in self._adjacency[node]:
+                if val in depth:
+                    depth[val] = max(depth[val], depth[node] + 1)
+        levels = [[] for _ in range(max(depth.values(), default=-1) + 1)]
+        for node in self.topological_order:
+            levels[depth[node]].append(node)
+        return [level for level in levels if len(level) > 0]
 
-        Args:
-            node: current node
-            visited: visited nodes
-            stack: order of graph
+    def _topological_sort(self) -> List:
+        """Topologically sorts the DAG
 
         Returns:
+            list of topological order
 
         """
-        # Update the visited dict
-        visited.update({node: True})
-        # Recur for all edges
-        for val in self._dag.get(node):
-            val_name = val.__name__ if hasattr(val, "__name__") else val
-            if visited.get(val_name) is False:
-                self._topological_sort_dfs(val_name, visited, stack)
-        stack.append(node)
+        # https://en.wikipedia.org/wiki/Topological_sorting#Kahn's_algorithm
+        node_names = self.node_names
+        return [k for k in self._kahn_order if k in node_names]
 
 
 class MergeGraph(BaseGraph):
@@ -240,17 +350,17 @@ class SelfGraph(BaseGraph):
 
     @property
     def node_names(self):
-        return {k.name for k in self._cls.__attrs_attrs__}
+        return self._memoize("node_names", lambda: set(self.nodes))
 
     @property
     def node_map(self):
         """Returns a map of the node names to the underlying classes"""
-        return {k: k for k in self.nodes}
+        return self._memoize("node_map", lambda: {k: k for k in self.nodes})
 
     @property
     def reverse_map(self):
         """Returns a map from the underlying classes to the node names"""
-        return {k: k for k in self.nodes}
+        return self._memoize("reverse_map", lambda: {k: k for k in self.nodes})
 
     @property
     def nodes(self):
@@ -338,21 +448,31 @@ class VarGraph(BaseGraph):
     @property
     def cls_names(self):
         """Returns the set of class names"""
-        return {spock_cls.__name__ for spock_cls, _ in self._cls_fields_tuple}
+        return self._memoize(
+            "cls_names",
+            lambda: {spock_cls.__name__ for spock_cls, _ in self._cls_fields_tuple},
+        )
 
     @property
     def cls_values(self):
         """Returns a map of the class name and the underlying classes"""
-        return {
-            spock_cls.__name__: spock_cls for spock_cls, _ in self._cls_fields_tuple
-        }
+        return self._memoize(
+            "cls_values",
+            lambda: {
+                spock_cls.__name__: spock_cls for spock_cls, _ in self._cls_fields_tuple
+            },
+        )
 
     @property
     def cls_map(self):
         """Returns a map between the class names and the field dictionaries"""
-        return {
-            spock_cls.__name__: fields for spock_cls, fields in self._cls_fields_tuple
-        }
+        return self._memoize(
+            "cls_map",
+            lambda: {
+                spock_cls.__name__: fields
+                for spock_cls, fields in self._cls_fields_tuple
+            },
+        )
 
     @property
     def nodes(self):
@@ -362,20 +482,28 @@ class VarGraph(BaseGraph):
     @property
     def ref_2_resolve(self) -> Set:
         """Returns the values that need to be resolved"""
-        return set(self.ref_map.keys())
+        return self._memoize("ref_2_resolve", lambda: set(self.ref_map.keys()))
 
-    def resolve(self, spock_cls: str, spock_space: Dict) -> Tuple[Dict, Set]:
+    def resolve(
+        self, spock_cls: str, spock_space: Dict, fields: Optional[Dict] = None
+    ) -> Tuple[Dict, Set]:
         """Resolves variable references by searching thorough the current spock_space
 
+        The values are resolved into a copy of the field dictionary so the fields the
+        graph was built from are left unresolved (and can be resolved again)
+
         Args:
             spock_cls: name of the spock class
             spock_space: current spock_space to look for the underlying value
+            fields: field dictionary of the class to resolve -- defaults to the field
+                dictionary the graph was built from
 
         Returns:
             field dictionary containing the resolved values and a set containing all
             changed variables to delay casting post resolution
 
         """
+        fields = dict(self.cls_map[spock_cls] if fields is None else fields)
         # First we check for any needed variable resolution
         changed_vars = set()
         if spock_cls in self.ref_2_resolve:
@@ -383,7 +511,7 @@ class VarGraph(BaseGraph):
             # to get the correct values
             for ref in self.ref_map[spock_cls]:
                 typed_val, _ = self.var_resolver.resolve(
-                    value=self.cls_map[spock_cls][ref["val"]],
+                    value=fields[ref["val"]],
                     value_type=getattr(
                         self.node_map[spock_cls].__attrs_attrs__, ref["val"]
                     ).type,
@@ -391,11 +519,11 @@ class VarGraph(BaseGraph):
                     spock_space=spock_space,
                 )
                 # Swap the value to the replaced version
-                self.cls_map[spock_cls][ref["val"]] = typed_val
+                fields[ref["val"]] = typed_val
             # Get a set of all changed variables
             changed_vars = {n["val"] for n in self.ref_map[spock_cls]}
         # Return the field dict
-        return self.cls_map[spock_cls], changed_vars
+        return fields, changed_vars
 
     def _build(self) -> Tuple[Dict, Dict]:
         """Builds a dictionary of nodes and their edges (essentially builds the DAG)
@@ -610,3 +738,118 @@ class Graph(BaseGraph):
             nodes.get(v).append(input_class)
         nodes = {key: set(val) for key, val in nodes.items()}
         return nodes
+
+
+class IncludeGraph:
+    """Graph of the config file includes encountered while building a payload
+
+    Nodes are the canonical (resolved) paths of config files (or S3 URIs) and the edges
+    go from a config file to the files it includes (in declared order). Every config
+    file may only be read once per build -- reading a file that is within the current
+    chain of includes is a cycle (reported with the cycle path) and reading it anywhere
+    else is a duplicate read
+
+    Attributes:
+        _edges: ordered dictionary of canonical paths to the list of included paths
+        _roots: list of canonical paths of the root config files
+        _stack: chain of canonical paths currently being read (root first)
+        _stack_set: set of the canonical paths within the stack
+
+    """
+
+    def __init__(self):
+        """Init call for IncludeGraph"""
+        self._edges = {}
+        self._roots = []
+        self._stack = []
+        self._stack_set = set()
+
+    def __contains__(self, path: Union[str, Path]) -> bool:
+        return self.canonical(path) in self._edges
+
+    @property
+    def nodes(self) -> List[str]:
+        """Returns the canonical paths of all config files in the order they were read"""
+        return list(self._edges.keys())
+
+    @property
+    def roots(self) -> List[str]:
+        """Returns the canonical paths of the root config files"""
+        return list(self._roots)
+
+    @property
+    def edges(self) -> Dict[str, List[str]]:
+        """Returns a dictionary of config files and the config files they include"""
+        return {k: list(v) for k, v in self._edges.items()}
+
+    def children(self, path: Union[str, Path]) -> List[str]:
+        """Returns the config files included by the given config file
+
+        Args:
+            path: path to a config file within the graph
+
+        Returns:
+            list of canonical paths of the included config files
+
+        """
+        return list(self._edges[self.canonical(path)])
+
+    @staticmethod
+    def canonical(path: Union[str, Path]) -> str:
+        """Gets the canonical representation of a config path
+
+        Args:
+            path: config path or S3 URI
+
+        Returns:
+            fully resolved local path or the S3 URI
+
+        """
+        path = Path(path)
+        if check_path_s3(path):
+            return path_object_to_s3path(path)
+        return os.path.realpath(path)
+
+    def enter(self, path: Union[str, Path], root: bool = False) -> str:
+        """Adds a config file to the graph and pushes it onto the current include chain
+
+        Args:
+            path: path to the config file
+            root: boolean if the config file is a root (i.e. not included by another)
+
+        Returns:
+            canonical path of the config file
+
+        Raises:
+            ValueError: if the config file would create a cycle or has already been read
+
+        """
+        node = self.canonical(path)
+        if node in self._stack_set:
+            cycle = self._stack[self._stack.index(node) :] + [node]
+            raise ValueError(
+                f"Cyclical Dependency -- Config file {path} has already been encountered. "
+                f"Please remove cyclical dependencies between config files: {' -> '.join(cycle)}"
+            )
+        if node in self._edges:
+            raise ValueError(
+                f"Duplicate Read -- Config file {path} has already been encountered. "
+                f"Please remove duplicate reads of config files."
+            )
+        self._edges[node] = []
+        if root:
+            self._roots.append(node)
+        elif len(self._stack) > 0:
+            self._edges[self._stack[-1]].append(node)
+        self._stack.append(node)
+        self._stack_set.add(node)
+        return node
+
+    def leave(self) -> None:
+        """Pops the last config file off the current include chain
+
+        Returns:
+            None
+
+        """
+        self._stack_set.discard(self._stack.pop())
@@ -5,21 +5,212 @@
 
 """I/O handlers for various file formats"""
 
+import hashlib
+import importlib.util
 import json
 import os
+import pickle
 import re
+import shutil
+import tempfile
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path, PurePosixPath
-from typing import ByteString, Dict, Optional, Tuple, Union
+from typing import ByteString, Callable, Dict, Optional, Tuple, Union
 from warnings import warn
 
-import pytomlpp
 import yaml
 
 from spock._version import get_versions
 from spock.utils import _T, check_path_s3, path_object_to_s3path
 
-__version__ = get_versions()["version"]
+# Use the libyaml backed loader/dumper when available -- fall back to pure python
+try:
+    from yaml import CSafeDumper as _BaseSafeDumper
+    from yaml import CSafeLoader as _BaseSafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeDumper as _BaseSafeDumper
+    from yaml import SafeLoader as _BaseSafeLoader
+
+
+@lru_cache(maxsize=None)
+def _get_version() -> str:
+    """Gets the spock version string once (from source this shells out to git)"""
+    return get_versions()["version"]
+
+
+class ParsedFileCache:
+    """Bounded LRU cache of parsed config file payloads
+
+    Entries are keyed by the resolved path and validated against the file mtime and size
+    (and optionally a hash of the file contents) on every lookup so a changed file is
+    always re-parsed. Payloads are held as pickled bytes and un-pickled on each hit so
+    callers always get their own copy that they are free to modify
+
+    If a cache_dir is given the pickled payloads are also persisted to disk keyed by a
+    hash of the file contents, the file extension, and the spock version so a fresh
+    process can skip parsing any unchanged file. Files are written to a temp file and
+    then atomically moved into place so multiple processes can share the directory.
+    Only point this at a directory you trust as the entries are un-pickled
+
+    Attributes:
+        max_size: max number of parsed files to hold in memory
+        hash_contents: also validate entries against a hash of the file contents
+        cache_dir: optional directory to persist parsed payloads within
+        hits: number of lookups served from memory
+        misses: number of lookups not served from memory
+        disk_hits: number of misses that were served from the cache_dir
+        _entries: ordered map of resolved paths to (signature, pickled payload)
+        _lock: lock guarding the entries and counters
+
+    """
+
+    def __init__(
+        self,
+        max_size: int = 128,
+        hash_contents: bool = False,
+        cache_dir: Optional[Union[str, Path]] = None,
+    ):
+        """Init call for ParsedFileCache
+
+        Args:
+            max_size: max number of parsed files to hold in memory
+            hash_contents: also validate entries against a hash of the file contents
+            cache_dir: optional directory to persist parsed payloads within
+        """
+        self.max_size = max_size
+        self.hash_contents = hash_contents
+        self.cache_dir = cache_dir
+        if self.cache_dir is not None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> Dict:
+        """Returns a dictionary of the cache counters"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "disk_hits": self.disk_hits,
+            "size": len(self),
+        }
+
+    def clear(self) -> None:
+        """Clears all entries and resets the counters
+
+        Returns:
+            None
+
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.disk_hits = 0
+
+    def load(self, path: Union[str, Path], loader: Callable[[str], Dict]) -> Dict:
+        """Gets the parsed payload for a file -- calls the loader on a miss
+
+        Args:
+            path: path to the file
+            loader: function that parses the file at the given path
+
+        Returns:
+            copy of the parsed payload
+
+        """
+        key = os.path.realpath(path)
+        signature = self._get_signature(key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == signature:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return pickle.loads(entry[1])
+            self.misses += 1
+        if self.cache_dir is not None:
+            blob = self._load_from_disk(path, loader)
+        else:
+            blob = pickle.dumps(loader(path), protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._entries[key] = (signature, blob)
+            self._entries.move_to_end(key)
+            # Evict the least recently used entries if over the size limit
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return pickle.loads(blob)
+
+    def _load_from_disk(
+        self, path: Union[str, Path], loader: Callable[[str], Dict]
+    ) -> bytes:
+        """Gets the pickled payload from the cache_dir -- parses and persists it on a miss
+
+        Args:
+            path: path to the file
+            loader: function that parses the file at the given path
+
+        Returns:
+            pickled payload
+
+        """
+        with open(path, "rb") as fid:
+            contents = fid.read()
+        hasher = hashlib.sha256(
+            f"{_get_version()}:{Path(path).suffix.lower()}:".encode()
+        )
+        hasher.update(contents)
+        cache_path = os.path.join(self.cache_dir, f"{hasher.hexdigest()}.pickle")
+        try:
+            with open(cache_path, "rb") as fid:
+                blob = fid.read()
+            # Make sure the entry is intact before handing it back
+            pickle.loads(blob)
+            with self._lock:
+                self.disk_hits += 1
+            return blob
+        except Exception:
+            # Missing or unreadable entry -- fall through and (re)build it
+            pass
+        blob = pickle.dumps(loader(path), protocol=pickle.HIGHEST_PROTOCOL)
+        # Write to a temp file within the same dir and then atomically swap it into
+        # place so concurrent readers never see a partial file
+        temp_path = None
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as fid:
+                fid.write(blob)
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            warn(f"Unable to write to the parsed file cache dir {self.cache_dir}: {e}")
+            if temp_path is not None and os.path.exists(temp_path):
+                os.remove(temp_path)
+        return blob
+
+    def _get_signature(self, path: str) -> Tuple:
+        """Gets the signature used to check if a cached entry is still valid
+
+        Args:
+            path: resolved path to the file
+
+        Returns:
+            tuple of the mtime, size, and (optionally) the content hash
+
+        """
+        stat = os.stat(path)
+        digest = None
+        if self.hash_contents:
+            with open(path, "rb") as fid:
+                digest = hashlib.sha256(fid.read()).hexdigest()
+        return stat.st_mtime_ns, stat.st_size, digest
 
 
 class Handler(ABC):
@@ -27,12 +218,37 @@ class Handler(ABC):
 
     ABC for loaders
 
+    Attributes:
+        _file_cache: optional ParsedFileCache shared by all handlers (None is off)
+
     """
 
+    _file_cache = None
+
+    @staticmethod
+    def set_file_cache(file_cache: Optional[ParsedFileCache]) -> None:
+        """Sets (or removes with None) the parsed file cache used by all handlers
+
+        Args:
+            file_cache: ParsedFileCache instance or None to turn off caching
+
+        Returns:
+            None
+
+        """
+        Handler._file_cache = file_cache
+
+    @staticmethod
+    def get_file_cache() -> Optional[ParsedFileCache]:
+        """Returns the parsed file cache used by all handlers (None if off)"""
+        return Handler._file_cache
+
     def load(self, path: Path, s3_config: Optional[_T] = None) -> Dict:
         """Load function for file type
 
-        This handles s3 path conversion for all handler types pre load call
+        This handles s3 path conversion for all handler types pre load call -- if a
+        parsed file cache is set then parsing is skipped for unchanged files. S3 objects
+        are parsed straight from memory if the s3 config is set to in_memory
 
         Args:
             path: path to file
@@ -42,8 +258,15 @@ class Handler(ABC):
             dictionary of read file
 
         """
+        if self._is_s3_in_memory(path=path, s3_config=s3_config):
+            contents = self._handle_s3_load_bytes(path=path, s3_config=s3_config)
+            return self._post_process_config_paths(self._loads(contents))
         path = self._handle_possible_s3_load_path(path=path, s3_config=s3_config)
-        return self._post_process_config_paths(self._load(path=path))
+        if self._file_cache is not None:
+            payload = self._file_cache.load(path, self._load)
+        else:
+            payload = self._load(path=path)
+        return self._post_process_config_paths(payload)
 
     @staticmethod
     def _post_process_config_paths(payload):
@@ -67,6 +290,19 @@ class Handler(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def _loads(self, contents: Union[str, bytes]) -> Dict:
+        """Private load function for the contents of a file
+
+        Args:
+            contents: contents of the file
+
+        Returns:
+            dictionary of read contents
+
+        """
+        raise NotImplementedError
+
     def _write_crypto(
         self,
         value: Union[str, ByteString],
@@ -98,13 +334,24 @@ class Handler(ABC):
         # We need to shim in the crypto value name into the name used for S3
         name_root, name_extension = os.path.splitext(name)
         name = f"{name_root}.{crypto_name}.yaml"
+        if is_s3 and self._is_s3_in_memory(path=path, s3_config=s3_config):
+            self._check_s3_write_bytes(
+                YAMLHandler.dumps({crypto_name: value}), path, name, s3_config
+            )
+            return
         # Also need to shim the crypto name into the full path
+        if is_s3:
+            write_path = self._make_s3_temp_path(write_path)
         root, extension = os.path.splitext(write_path)
         full_name = f"{root}.{crypto_name}.yaml"
-        YAMLHandler.write({crypto_name: value}, full_name)
-        # After write check if it needs to be pushed to S3
-        if is_s3:
-            self._check_s3_write(write_path, path, name, s3_config)
+        try:
+            YAMLHandler.write({crypto_name: value}, full_name)
+            # After write check if it needs to be pushed to S3
+            if is_s3:
+                self._check_s3_write(full_name, path, name, s3_config)
+        finally:
+            if is_s3:
+                self._remove_s3_temp(write_path)
 
     def save(
         self,
@@ -121,7 +368,8 @@ class Handler(ABC):
         """Write function for file type
 
         This will handle local or s3 writes with the boolean is_s3 flag. If detected it will conditionally import
-        the necessary addons to handle the upload
+        the necessary addons to handle the upload -- if the s3 config is set to in_memory the serialized payload is
+        uploaded directly without writing a temp file
 
         Args:
             out_dict: payload to write
@@ -139,15 +387,27 @@ class Handler(ABC):
         write_path, is_s3 = self._handle_possible_s3_save_path(
             path=path, name=name, create_path=create_path, s3_config=s3_config
         )
-        write_path = self._save(
-            out_dict=out_dict,
-            info_dict=info_dict,
-            library_dict=library_dict,
-            path=write_path,
-        )
-        # After write check if it needs to be pushed to S3
-        if is_s3:
-            self._check_s3_write(write_path, path, name, s3_config)
+        if is_s3 and self._is_s3_in_memory(path=path, s3_config=s3_config):
+            contents = self._dumps(
+                out_dict=out_dict, info_dict=info_dict, library_dict=library_dict
+            )
+            self._check_s3_write_bytes(contents, path, name, s3_config)
+        else:
+            if is_s3:
+                write_path = self._make_s3_temp_path(write_path)
+            try:
+                self._save(
+                    out_dict=out_dict,
+                    info_dict=info_dict,
+                    library_dict=library_dict,
+                    path=write_path,
+                )
+                # After write check if it needs to be pushed to S3
+                if is_s3:
+                    self._check_s3_write(write_path, path, name, s3_config)
+            finally:
+                if is_s3:
+                    self._remove_s3_temp(write_path)
         # Write the crypto files if needed
         if (salt is not None) and (key is not None):
             # If the values are not none then write the salt and key into individual files
@@ -181,6 +441,33 @@ class Handler(ABC):
         except ImportError:
             print("Error importing spock s3 utils after detecting s3:// save path")
 
+    @staticmethod
+    def _check_s3_write_bytes(
+        contents: Union[str, bytes], path: Path, name: str, s3_config: Optional[_T]
+    ):
+        """Handles writing to S3 directly from memory
+
+        Args:
+            contents: serialized file contents
+            path: original path specified
+            name: original file name
+            s3_config: optional s3 config object if using s3 storage
+
+        Returns:
+
+        """
+        try:
+            from spock.addons.s3.utils import handle_s3_save_bytes
+
+            handle_s3_save_bytes(
+                contents=contents,
+                s3_path=str(PurePosixPath(path)),
+                name=name,
+                s3_config=s3_config,
+            )
+        except ImportError:
+            print("Error importing spock s3 utils after detecting s3:// save path")
+
     @abstractmethod
     def _save(
         self,
@@ -201,6 +488,57 @@ class Handler(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def _dumps(
+        self,
+        out_dict: Dict,
+        info_dict: Optional[Dict],
+        library_dict: Optional[Dict],
+    ) -> str:
+        """Serializes the payload(s) into the contents of the file type
+
+        Args:
+            out_dict: payload to write
+            info_dict: info payload to write
+            library_dict: package info to write
+
+        Returns:
+            serialized contents
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def _is_s3_in_memory(path: Path, s3_config: Optional[_T] = None) -> bool:
+        """Checks if the path is a S3 uri that should be read/written from memory
+
+        Args:
+            path: spock config path
+            s3_config: optional s3 configuration object
+
+        Returns:
+            boolean if the S3 object should be handled in memory
+
+        """
+        return getattr(s3_config, "in_memory", False) and check_path_s3(path=path)
+
+    @staticmethod
+    def _handle_s3_load_bytes(path: Path, s3_config: Optional[_T] = None) -> bytes:
+        """Handles reading the contents of a S3 uri into memory
+
+        Args:
+            path: spock config path
+            s3_config: optional s3 configuration object
+
+        Returns:
+            contents of the S3 object
+
+        """
+        from spock.addons.s3.utils import handle_s3_load_bytes
+
+        return handle_s3_load_bytes(
+            path=path_object_to_s3path(path), s3_config=s3_config
+        )
+
     @staticmethod
     def _handle_possible_s3_load_path(
         path: Path, s3_config: Optional[_T] = None
@@ -261,6 +599,32 @@ class Handler(ABC):
             write_path = f"{path}/{name}"
         return write_path, is_s3
 
+    @staticmethod
+    def _make_s3_temp_path(write_path: str) -> str:
+        """Moves the temp path of a S3 save into its own temp directory
+
+        Each save gets its own directory so concurrent (or queued) saves of the same name never share a file
+
+        Args:
+            write_path: temporary path within the temp folder
+
+        Returns:
+            unique temporary path with the same file name
+        """
+        temp_dir = tempfile.mkdtemp(dir=os.path.dirname(write_path))
+        return os.path.join(temp_dir, os.path.basename(write_path))
+
+    @staticmethod
+    def _remove_s3_temp(write_path: str):
+        """Removes the temp directory of a S3 save once the upload has been handed off
+
+        Args:
+            write_path: temporary path the file was written to
+
+        Returns:
+        """
+        shutil.rmtree(os.path.dirname(write_path), ignore_errors=True)
+
     @staticmethod
     def write_extra_info(
         path: str,
@@ -283,46 +647,84 @@ class Handler(ABC):
         """
         # Write the commented info as new lines
         with open(path, write_mode) as fid:
-            if newlines is not None:
-                for _ in range(newlines):
-                    fid.write("\n")
-            if header is not None:
-                fid.write(header)
-            # Write a spock header
-            if version:
-                fid.write(f"# Spock Version: {__version__}\n")
-            # Write info dict if not None
-            if info_dict is not None:
-                for k, v in info_dict.items():
-                    fid.write(f"{k}: {v}\n")
-            fid.write("\n")
+            fid.write(
+                Handler.format_extra_info(
+                    info_dict=info_dict,
+                    version=version,
+                    newlines=newlines,
+                    header=header,
+                )
+            )
+
+    @staticmethod
+    def format_extra_info(
+        info_dict: Optional[Dict],
+        version: bool = True,
+        newlines: Optional[int] = None,
+        header: Optional[str] = None,
+    ) -> str:
+        """Formats extra info as commented newlines
+
+        Args:
+            info_dict: info payload to write
+            version: write the spock version string first
+            newlines: number of new lines to add to start
+            header: optional header to write before the info
+
+        Returns:
+            string of the extra info
+        """
+        lines = "\n" * newlines if newlines is not None else ""
+        if header is not None:
+            lines += header
+        # Write a spock header
+        if version:
+            lines += f"# Spock Version: {_get_version()}\n"
+        # Write info dict if not None
+        if info_dict is not None:
+            for k, v in info_dict.items():
+                lines += f"{k}: {v}\n"
+        return lines + "\n"
+
+
+class SpockYAMLLoader(_BaseSafeLoader):
+    """Safe YAML loader (libyaml backed if available) with spock float resolution"""
+
+
+# override default SafeLoader behavior to correctly
+# interpret 1e1 (as opposed to 1.e+1) as 10
+# https://stackoverflow.com/questions/30458977/yaml-loads-5e-6-as-string-and-not-a-number/30462009#30462009
+# This only modifies the resolvers of the subclass and not the global yaml.SafeLoader
+SpockYAMLLoader.add_implicit_resolver(
+    "tag:yaml.org,2002:float",
+    re.compile(
+        """^(?:
+     [-+]?(?:[0-9][0-9_]*)\\.[0-9_]*(?:[eE][-+]?[0-9]+)?
+    |[-+]?(?:[0-9][0-9_]*)(?:[eE][-+]?[0-9]+)
+    |\\.[0-9_]+(?:[eE][-+][0-9]+)?
+    |[-+]?[0-9][0-9_]*(?::[0-5]?[0-9])+\\.[0-9_]*
+    |[-+]?\\.(?:inf|Inf|INF)
+    |\\.(?:nan|NaN|NAN))$""",
+        re.X,
+    ),
+    list("-+0123456789."),
+)
+
+
+class SpockYAMLDumper(_BaseSafeDumper):
+    """Safe YAML dumper (libyaml backed if available) that never writes aliases"""
+
+    def ignore_aliases(self, data):
+        return True
 
 
 class YAMLHandler(Handler):
     """YAML class for loading YAML config files
 
-    Base YAML class
+    Base YAML class -- uses the libyaml bindings when they are available
 
     """
 
-    # override default SafeLoader behavior to correctly
-    # interpret 1e1 (as opposed to 1.e+1) as 10
-    # https://stackoverflow.com/questions/30458977/yaml-loads-5e-6-as-string-and-not-a-number/30462009#30462009
-    yaml.SafeLoader.add_implicit_resolver(
-        "tag:yaml.org,2002:float",
-        re.compile(
-            """^(?:
-         [-+]?(?:[0-9][0-9_]*)\\.[0-9_]*(?:[eE][-+]?[0-9]+)?
-        |[-+]?(?:[0-9][0-9_]*)(?:[eE][-+]?[0-9]+)
-        |\\.[0-9_]+(?:[eE][-+][0-9]+)?
-        |[-+]?[0-9][0-9_]*(?::[0-5]?[0-9])+\\.[0-9_]*
-        |[-+]?\\.(?:inf|Inf|INF)
-        |\\.(?:nan|NaN|NAN))$""",
-            re.X,
-        ),
-        list("-+0123456789."),
-    )
-
     def _load(self, path: str) -> Dict:
         """YAML load function
 
@@ -333,8 +735,21 @@ class YAMLHandler(Handler):
             base_payload: dictionary of read file
 
         """
-        file_contents = open(path, "r").read()
-        base_payload = yaml.safe_load(file_contents)
+        with open(path, "r") as yaml_fid:
+            file_contents = yaml_fid.read()
+        return self._loads(file_contents)
+
+    def _loads(self, contents: Union[str, bytes]) -> Dict:
+        """YAML load function for the contents of a file
+
+        Args:
+            contents: contents of a YAML file
+
+        Returns:
+            base_payload: dictionary of read contents
+
+        """
+        base_payload = yaml.load(contents, Loader=SpockYAMLLoader)
         return base_payload
 
     def _save(
@@ -353,28 +768,46 @@ class YAMLHandler(Handler):
             path: path to write out
         Returns:
         """
-        # First write the commented info
-        self.write_extra_info(path=path, info_dict=info_dict)
-        # Remove aliases in YAML dump
-        yaml.Dumper.ignore_aliases = lambda *args: True
-        self.write(out_dict, path)
-        # Write the library info at the bottom
-        self.write_extra_info(
-            path=path,
-            info_dict=library_dict,
-            version=False,
-            write_mode="a",
-            newlines=2,
-            header="################\n# Package Info #\n################\n",
-        )
+        with open(path, "w+") as yaml_fid:
+            yaml_fid.write(self._dumps(out_dict, info_dict, library_dict))
         return path
 
+    def _dumps(
+        self,
+        out_dict: Dict,
+        info_dict: Optional[Dict],
+        library_dict: Optional[Dict],
+    ) -> str:
+        """Serialize function for YAML type
+
+        Args:
+            out_dict: payload to write
+            info_dict: info payload to write
+            library_dict: package info to write
+
+        Returns:
+            YAML string with the commented info
+        """
+        # First the commented info, then the payload, then the library info at the bottom
+        return (
+            self.format_extra_info(info_dict=info_dict)
+            + self.dumps(out_dict)
+            + self.format_extra_info(
+                info_dict=library_dict,
+                version=False,
+                newlines=2,
+                header="################\n# Package Info #\n################\n",
+            )
+        )
+
     @staticmethod
     def write(write_dict: Dict, path: str):
-        # Remove aliases in YAML dump
-        yaml.Dumper.ignore_aliases = lambda *args: True
         with open(path, "a") as yaml_fid:
-            yaml.safe_dump(write_dict, yaml_fid, default_flow_style=False)
+            yaml_fid.write(YAMLHandler.dumps(write_dict))
+
+    @staticmethod
+    def dumps(write_dict: Dict) -> str:
+        return yaml.dump(write_dict, Dumper=SpockYAMLDumper, default_flow_style=False)
 
 
 class TOMLHandler(Handler):
@@ -394,9 +827,28 @@ class TOMLHandler(Handler):
             base_payload: dictionary of read file
 
         """
+        import pytomlpp
+
         base_payload = pytomlpp.load(path)
         return base_payload
 
+    def _loads(self, contents: Union[str, bytes]) -> Dict:
+        """TOML load function for the contents of a file
+
+        Args:
+            contents: contents of a TOML file
+
+        Returns:
+            base_payload: dictionary of read contents
+
+        """
+        import pytomlpp
+
+        if isinstance(contents, bytes):
+            contents = contents.decode("utf-8")
+        base_payload = pytomlpp.loads(contents)
+        return base_payload
+
     def _save(
         self,
         out_dict: Dict,
@@ -414,24 +866,154 @@ class TOMLHandler(Handler):
 
         Returns:
         """
-        # First write the commented info
-        self.write_extra_info(path=path, info_dict=info_dict)
-        with open(path, "a") as toml_fid:
-            pytomlpp.dump(out_dict, toml_fid)
-        # Write the library info at the bottom
-        self.write_extra_info(
-            path=path, info_dict=library_dict, version=False, write_mode="a", newlines=2
-        )
+        with open(path, "w+") as toml_fid:
+            toml_fid.write(self._dumps(out_dict, info_dict, library_dict))
         return path
 
+    def _dumps(
+        self,
+        out_dict: Dict,
+        info_dict: Optional[Dict],
+        library_dict: Optional[Dict],
+    ) -> str:
+        """Serialize function for TOML type
+
+        Args:
+            out_dict: payload to write
+            info_dict: info payload to write
+            library_dict: package info to write
+
+        Returns:
+            TOML string with the commented info
+        """
+        import pytomlpp
+
+        # First the commented info, then the payload, then the library info at the bottom
+        return (
+            self.format_extra_info(info_dict=info_dict)
+            + pytomlpp.dumps(out_dict)
+            + self.format_extra_info(info_dict=library_dict, version=False, newlines=2)
+        )
+
+
+class JSONCodec:
+    """Stdlib JSON codec
+
+    Attributes:
+        name: name of the codec
+
+    """
+
+    name = "json"
+
+    @staticmethod
+    def loads(contents: Union[str, bytes]) -> Dict:
+        """Parses a JSON document
+
+        Args:
+            contents: JSON document
+
+        Returns:
+            parsed payload
+
+        """
+        return json.loads(contents)
+
+    @staticmethod
+    def dumps(payload: Dict) -> str:
+        """Serializes a payload into the spock JSON format (4 space indent)
+
+        Args:
+            payload: payload to serialize
+
+        Returns:
+            JSON string
+
+        """
+        return json.dumps(payload, indent=4, separators=(",", ": "))
+
+
+class OrjsonCodec(JSONCodec):
+    """orjson backed JSON codec
+
+    Parsing uses orjson (falling back to the stdlib for documents orjson rejects, e.g. NaN
+    or > 64-bit integers). Serialization stays on the stdlib as orjson only supports a 2
+    space indent and the written files must be byte-identical across codecs
+
+    Attributes:
+        name: name of the codec
+
+    """
+
+    name = "orjson"
+
+    @staticmethod
+    def loads(contents: Union[str, bytes]) -> Dict:
+        """Parses a JSON document
+
+        Args:
+            contents: JSON document
+
+        Returns:
+            parsed payload
+
+        """
+        import orjson
+
+        try:
+            return orjson.loads(contents)
+        except orjson.JSONDecodeError:
+            return json.loads(contents)
+
+
+@lru_cache(maxsize=None)
+def _has_orjson() -> bool:
+    """Checks (once) if orjson is installed"""
+    return importlib.util.find_spec("orjson") is not None
+
+
+def _get_json_codec(codec: Optional[str] = None) -> JSONCodec:
+    """Gets the JSON codec by name -- None picks orjson if installed and stdlib otherwise
+
+    Args:
+        codec: name of the codec (json or orjson) or None
+
+    Returns:
+        JSON codec class
+
+    """
+    codecs = {"json": JSONCodec, "orjson": OrjsonCodec}
+    if codec is None:
+        return OrjsonCodec if _has_orjson() else JSONCodec
+    if codec not in codecs:
+        raise ValueError(
+            f"Unknown JSON codec `{codec}` -- must be one of {list(codecs.keys())}"
+        )
+    if codec == "orjson" and not _has_orjson():
+        raise ImportError("JSON codec `orjson` requested but orjson is not installed")
+    return codecs[codec]
+
 
 class JSONHandler(Handler):
     """JSON class for loading JSON config files
 
-    Base JSON class
+    Base JSON class -- the codec is pluggable and defaults to orjson when it is installed.
+    The codec choice only changes loading as every codec writes with the stdlib
+
+    Attributes:
+        codec: JSON codec used to load and save
 
     """
 
+    def __init__(self, codec: Optional[str] = None):
+        """Init call for JSONHandler
+
+        Args:
+            codec: name of the JSON codec to use (json or orjson) -- None uses orjson if
+                installed and stdlib json otherwise
+        """
+        self.codec = _get_json_codec(codec)
+
     def _load(self, path: str) -> Dict:
         """JSON load function
 
@@ -442,8 +1024,20 @@ class JSONHandler(Handler):
             base_payload: dictionary of read file
 
         """
-        with open(path) as json_fid:
-            base_payload = json.load(json_fid)
+        with open(path, "rb") as json_fid:
+            return self._loads(json_fid.read())
+
+    def _loads(self, contents: Union[str, bytes]) -> Dict:
+        """JSON load function for the contents of a file
+
+        Args:
+            contents: contents of a JSON file
+
+        Returns:
+            base_payload: dictionary of read contents
+
+        """
+        base_payload = self.codec.loads(contents)
         return base_payload
 
     def _save(
@@ -463,10 +1057,28 @@ class JSONHandler(Handler):
 
         Returns:
         """
+        with open(path, "a") as json_fid:
+            json_fid.write(self._dumps(out_dict, info_dict, library_dict))
+        return path
+
+    def _dumps(
+        self,
+        out_dict: Dict,
+        info_dict: Optional[Dict],
+        library_dict: Optional[Dict],
+    ) -> str:
+        """Serialize function for JSON type
+
+        Args:
+            out_dict: payload to write
+            info_dict: info payload to write
+            library_dict: package info to write
+
+        Returns:
+            JSON string
+        """
         if (info_dict is not None) or (library_dict is not None):
             warn(
                 "JSON does not support comments and thus cannot save extra info to file... removing extra info"
             )
-        with open(path, "a") as json_fid:
-            json.dump(out_dict, json_fid, indent=4, separators=(",", ": "))
-        return path
+        return self.codec.dumps(out_dict)
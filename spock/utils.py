@@ -9,21 +9,32 @@ import ast
 import inspect
 import os
 import random
+import re
 import socket
 import subprocess
 import sys
 import textwrap
 from argparse import _ArgumentGroup
 from enum import EnumMeta
+from functools import lru_cache
 from math import isclose
 from pathlib import Path
 from time import localtime, strftime
-from typing import Any, Callable, Dict, List, Tuple, Type, TypeVar, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 from warnings import warn
 
 import attr
-import git
-import pkg_resources
 
 from spock.exceptions import _SpockValueError
 
@@ -564,6 +575,8 @@ def _handle_generic_type_args(val: str) -> Any:
 def get_packages() -> Dict:
     """Gets all currently installed packages and assembles a dictionary of name: version
 
+    Packages are enumerated once per process (see refresh_provenance)
+
     Notes:
         https://stackoverflow.com/a/50013400
 
@@ -571,23 +584,107 @@ def get_packages() -> Dict:
         dictionary of all currently available packages
 
     """
-    named_list = sorted([str(i.key) for i in pkg_resources.working_set])
-    return {
-        f"# {i}": str(pkg_resources.working_set.by_key[i].version) for i in named_list
-    }
+    return dict(_get_packages())
+
+
+@lru_cache(maxsize=None)
+def _get_packages() -> Tuple[Tuple[str, str], ...]:
+    """Enumerates all currently installed packages (cached)
+
+    Returns:
+        tuple of package name, version pairs
+
+    """
+    packages = {}
+    for name, version in _iter_distributions():
+        # PEP 503 normalization (same as the pkg_resources keys) -- first one on the
+        # path wins
+        key = re.sub(r"[-_.]+", "-", name).lower()
+        if key not in packages:
+            packages[key] = str(version)
+    return tuple((f"# {k}", packages[k]) for k in sorted(packages))
+
+
+def _iter_distributions() -> Iterator[Tuple[str, str]]:
+    """Iterates over the name, version of all installed distributions
+
+    Uses importlib.metadata (which is only imported when extra info is written) and
+    falls back to the importlib_metadata backport or pkg_resources for older pythons
+
+    Returns:
+        iterator of distribution name, version pairs
+
+    """
+    try:
+        from importlib import metadata
+    except ImportError:  # pragma: no cover
+        try:
+            import importlib_metadata as metadata
+        except ImportError:
+            import pkg_resources
+
+            for val in pkg_resources.working_set:
+                yield val.project_name, val.version
+            return
+    for val in metadata.distributions():
+        name, version = _read_name_version(val)
+        if name is not None:
+            yield name, version
+
+
+def _read_name_version(dist) -> Tuple[Optional[str], Optional[str]]:
+    """Reads the name and version of a distribution from the headers of its metadata file
+
+    Only scans the header lines as parsing the full metadata (e.g. dist.metadata) of
+    every installed distribution is slow
+
+    Args:
+        dist: importlib metadata distribution
+
+    Returns:
+        distribution name and version (None if missing)
+
+    """
+    text = dist.read_text("METADATA") or dist.read_text("PKG-INFO") or ""
+    headers = {}
+    for line in text.splitlines():
+        # Headers end at the first blank line
+        if not line:
+            break
+        key, _, value = line.partition(":")
+        if key in ("Name", "Version") and key not in headers:
+            headers[key] = value.strip()
+    return headers.get("Name"), headers.get("Version")
+
+
+def refresh_provenance():
+    """Clears the process level cache of the provenance info written with saved configs
+
+    The machine info, installed packages, and git info are only collected once per
+    process -- call this to collect them again on the next save (e.g. after a commit
+    or installing a package)
+
+    Returns:
+        None
+
+    """
+    _get_packages.cache_clear()
+    _get_machine_info.cache_clear()
+    _get_repo_info.cache_clear()
 
 
-def add_info() -> Dict:
+def add_info(cache_git_status: bool = False) -> Dict:
     """Adds extra information to the output dictionary
 
     Args:
+        cache_git_status: reuse the cached git status instead of checking the working tree again
 
     Returns:
         out_dict: output dictionary
     """
     out_dict = {}
     out_dict = add_generic_info(out_dict)
-    out_dict = add_repo_info(out_dict)
+    out_dict = add_repo_info(out_dict, cache_git_status=cache_git_status)
     return out_dict
 
 
@@ -606,18 +703,47 @@ def make_blank_git(out_dict: Dict) -> Dict:
     return out_dict
 
 
-def add_repo_info(out_dict: Dict) -> Dict:
+def add_repo_info(out_dict: Dict, cache_git_status: bool = False) -> Dict:
     """Adds GIT information to the output dictionary
 
+    The git info is collected once per working directory (see refresh_provenance) --
+    only the git status is checked again on each call unless cache_git_status is set
+
     Args:
         out_dict: output dictionary
+        cache_git_status: reuse the cached git status instead of checking the working tree again
 
     Returns:
         out_dict: output dictionary
     """
+    repo_info = dict(_get_repo_info(os.getcwd()))
+    if not cache_git_status and repo_info.get("# Git Status") in ("DIRTY", "CLEAN"):
+        import git
+
+        repo = git.Repo(os.getcwd(), search_parent_directories=True)
+        repo_info["# Git Status"] = _get_git_status(repo)
+        repo.close()
+    out_dict.update(repo_info)
+    return out_dict
+
+
+@lru_cache(maxsize=None)
+def _get_repo_info(cwd: str) -> Tuple[Tuple[str, Any], ...]:
+    """Collects the GIT information of the repo containing the working directory (cached)
+
+    Args:
+        cwd: current working directory
+
+    Returns:
+        tuple of git info key, value pairs
+    """
+    # GitPython is slow to import so only pull it in when writing extra info
+    import git
+
+    out_dict = {}
     try:  # pragma: no cover
         # Assume we are working out of a repo
-        repo = git.Repo(os.getcwd(), search_parent_directories=True)
+        repo = git.Repo(cwd, search_parent_directories=True)
         # Check if we are really in a detached head state as later info will fail if we are
         if minor < 7:
             head_result = subprocess.run(
@@ -626,6 +752,7 @@ def add_repo_info(out_dict: Dict) -> Dict:
                 stdin=subprocess.DEVNULL if sys.platform == "win32" else None,
                 shell=True,
                 check=False,
+                cwd=cwd,
             )
         else:
             head_result = subprocess.run(
@@ -634,6 +761,7 @@ def add_repo_info(out_dict: Dict) -> Dict:
                 stdin=subprocess.DEVNULL if sys.platform == "win32" else None,
                 shell=True,
                 check=False,
+                cwd=cwd,
             )
         if head_result.stdout.decode().rstrip("\n") == "HEAD":
             out_dict = make_blank_git(out_dict)
@@ -643,14 +771,7 @@ def add_repo_info(out_dict: Dict) -> Dict:
             out_dict.update(
                 {"# Git Date": repo.active_branch.commit.committed_datetime}
             )
-            if (
-                len(repo.untracked_files) > 0
-                or len(repo.active_branch.commit.diff(None)) > 0
-            ):
-                git_status = "DIRTY"
-            else:
-                git_status = "CLEAN"
-            out_dict.update({"# Git Status": git_status})
+            out_dict.update({"# Git Status": _get_git_status(repo)})
             out_dict.update(
                 {"# Git Origin": repo.active_branch.commit.repo.remotes.origin.url}
             )
@@ -660,36 +781,69 @@ def add_repo_info(out_dict: Dict) -> Dict:
     except git.InvalidGitRepositoryError:  # pragma: no cover
         # But it's okay if we are not
         out_dict = make_blank_git(out_dict)
-    return out_dict
+    return tuple(out_dict.items())
+
+
+def _get_git_status(repo: "git.Repo") -> str:
+    """Checks if the working tree of the repo has any changes
+
+    Args:
+        repo: git repo
+
+    Returns:
+        DIRTY or CLEAN
+    """
+    if len(repo.untracked_files) > 0 or len(repo.active_branch.commit.diff(None)) > 0:
+        return "DIRTY"
+    return "CLEAN"
 
 
 def add_generic_info(out_dict: Dict) -> Dict:
     """Adds date, fqdn information to the output dictionary
 
+    Everything but the run date and time is collected once per process (see
+    refresh_provenance)
+
     Args:
         out_dict: output dictionary
 
     Returns:
         out_dict: output dictionary
     """
-    out_dict.update({"# Machine FQDN": socket.getfqdn()})
-    out_dict.update({"# Python Executable": sys.executable})
-    out_dict.update(
-        {
-            "# Python Version": f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
-        }
-    )
-    out_dict.update({"# Python Script": os.path.realpath(sys.argv[0])})
+    machine_info = dict(_get_machine_info())
+    out_dict.update({"# Machine FQDN": machine_info["# Machine FQDN"]})
+    out_dict.update({"# Python Executable": machine_info["# Python Executable"]})
+    out_dict.update({"# Python Version": machine_info["# Python Version"]})
+    out_dict.update({"# Python Script": machine_info["# Python Script"]})
     out_dict.update({"# Run Date": strftime("%Y-%m-%d", localtime())})
     out_dict.update({"# Run Time": strftime("%H:%M:%S", localtime())})
-    # Make a best effort to determine if run in a container
-    out_dict.update({"# Run w/ Docker": str(_maybe_docker())})
-    # Make a best effort to determine if run in a container via k8s
-    out_dict.update({"# Run w/ Kubernetes": str(_maybe_k8s())})
-
+    out_dict.update({"# Run w/ Docker": machine_info["# Run w/ Docker"]})
+    out_dict.update({"# Run w/ Kubernetes": machine_info["# Run w/ Kubernetes"]})
     return out_dict
 
 
+@lru_cache(maxsize=None)
+def _get_machine_info() -> Tuple[Tuple[str, str], ...]:
+    """Collects the machine and python info (cached)
+
+    Returns:
+        tuple of info key, value pairs
+    """
+    return (
+        ("# Machine FQDN", socket.getfqdn()),
+        ("# Python Executable", sys.executable),
+        (
+            "# Python Version",
+            f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
+        ),
+        ("# Python Script", os.path.realpath(sys.argv[0])),
+        # Make a best effort to determine if run in a container
+        ("# Run w/ Docker", str(_maybe_docker())),
+        # Make a best effort to determine if run in a container via k8s
+        ("# Run w/ Kubernetes", str(_maybe_k8s())),
+    )
+
+
 def _maybe_docker(cgroup_path: str = "/proc/self/cgroup") -> bool:
     """Make a best effort to determine if run in a docker container
 
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+import sys
+
+import pytest
+
+from spock.builder import ConfigArgBuilder
+from spock.exceptions import _SpockInstantiationError, _SpockValueError
+from tests.base.attr_configs_test import *
+from tests.base.base_asserts_test import *
+
+
+class TestBatchOverrides(AllTypes):
+    """Check that an empty override builds the same Spockspace as generate"""
+
+    @staticmethod
+    @pytest.fixture
+    def arg_builder(monkeypatch):
+        with monkeypatch.context() as m:
+            m.setattr(sys, "argv", ["", "--config", "./tests/conf/yaml/test.yaml"])
+            config = ConfigArgBuilder(*all_configs, desc="Test Builder")
+            return config.generate_batch(overrides=[{}])[0]
+
+
+class TestBatch:
+    """Check the batch generation behavior"""
+
+    @staticmethod
+    @pytest.fixture
+    def builder(monkeypatch):
+        with monkeypatch.context() as m:
+            m.setattr(sys, "argv", ["", "--config", "./tests/conf/yaml/test.yaml"])
+            return ConfigArgBuilder(*all_configs, desc="Test Builder")
+
+    def test_batch_overrides(self, builder):
+        batch = builder.generate_batch(
+            overrides=[{"TypeConfig": {"float_p": float(val)}} for val in range(3)]
+        )
+        assert [val.TypeConfig.float_p for val in batch] == [0.0, 1.0, 2.0]
+        # The base payload and Spockspace are left alone
+        assert builder.generate().TypeConfig.float_p == 12.0
+        assert all(val.__key__ == builder.key for val in batch)
+
+    def test_build_leaves_payload_untouched(self, builder):
+        # General arguments are assigned to a copy of the class level arguments
+        assert "int_p" in builder._dict_args
+        assert "int_p" not in builder._dict_args["TypeConfig"]
+        assert builder.generate_batch(overrides=[{}])[0] == builder.generate()
+
+    def test_batch_payloads(self, tmp_path):
+        config = tmp_path / "nested.yaml"
+        config.write_text("NestedStuff:\n  one: 3\n  two: c\n")
+        builder = ConfigArgBuilder(NestedStuff, configs=[str(config)], no_cmd_line=True)
+        batch = builder.generate_batch(
+            payloads=[{"NestedStuff": {"one": 1, "two": "a"}}, {"one": 2, "two": "b"}]
+        )
+        assert [(val.NestedStuff.one, val.NestedStuff.two) for val in batch] == [
+            (1, "a"),
+            (2, "b"),
+        ]
+
+    def test_batch_unknown_arg(self, builder):
+        with pytest.raises(ValueError):
+            builder.generate_batch(overrides=[{"TypeConfig": {"not_a_field": 1}}])
+
+    def test_batch_instantiation_error(self, builder):
+        with pytest.raises(_SpockInstantiationError):
+            builder.generate_batch(overrides=[{"TypeConfig": {"float_p": "a"}}])
+
+    def test_batch_requires_one_input(self, builder):
+        with pytest.raises(_SpockValueError):
+            builder.generate_batch()
+        with pytest.raises(_SpockValueError):
+            builder.generate_batch(payloads=[{}], overrides=[{}])
+
+
+class TestBatchProcessPool:
+    """Check the process pool batch generation"""
+
+    @staticmethod
+    @pytest.fixture
+    def builder(monkeypatch):
+        with monkeypatch.context() as m:
+            m.setattr(sys, "argv", ["", "--config", "./tests/conf/yaml/test.yaml"])
+            return ConfigArgBuilder(*all_configs, desc="Test Builder")
+
+    def test_pool_matches_serial(self, builder):
+        overrides = [{"TypeConfig": {"float_p": float(val)}} for val in range(6)]
+        serial = builder.generate_batch(overrides=overrides)
+        pooled = builder.generate_batch(overrides=overrides, n_workers=2, chunksize=2)
+        assert [val.TypeConfig.float_p for val in pooled] == [
+            float(val) for val in range(6)
+        ]
+        for serial_val, pooled_val in zip(serial, pooled):
+            assert vars(serial_val).keys() == vars(pooled_val).keys()
+            assert serial_val.NestedStuff == pooled_val.NestedStuff
+            assert pooled_val.__salt__ == builder.salt
+
+    def test_pool_fail_fast(self, builder):
+        overrides = [{"TypeConfig": {"float_p": float(val)}} for val in range(4)]
+        overrides[1] = {"TypeConfig": {"float_p": "a"}}
+        with pytest.raises(_SpockInstantiationError):
+            builder.generate_batch(overrides=overrides, n_workers=2, chunksize=1)
+
+    def test_pool_keeps_crypto_lazy(self, builder):
+        overrides = [{"TypeConfig": {"float_p": float(val)}} for val in range(2)]
+        builder.generate_batch(overrides=overrides, n_workers=2)
+        # Nothing in the batch uses crypto so the salt and key are never created
+        assert builder._crypto.created is False
+
+    def test_has_crypto_references(self):
+        from spock.backend.batch import has_crypto_references
+
+        assert not has_crypto_references({"One": {"a": "${spock.env:HOME}", "b": 1}})
+        assert has_crypto_references({"One": {"a": ["${spock.crypto:gAAAA}"]}})
+        assert has_crypto_references({"One": {"a": ("${spock.env.crypto:HOME}",)}})
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+import sys
+
+import pytest
+
+from spock.backend.plan import BuildPlan
+from spock.builder import ConfigArgBuilder
+from tests.base.attr_configs_test import *
+from tests.base.base_asserts_test import *
+
+
+class TestBuildPlanReuse(AllTypes):
+    """Check that a cached plan builds the same Spockspace"""
+
+    @staticmethod
+    @pytest.fixture
+    def arg_builder(monkeypatch):
+        with monkeypatch.context() as m:
+            m.setattr(sys, "argv", ["", "--config", "./tests/conf/yaml/test.yaml"])
+            # Build twice -- the second build runs from the cached plan
+            ConfigArgBuilder(*all_configs, desc="Test Builder")
+            config = ConfigArgBuilder(*all_configs, desc="Test Builder")
+            return config.generate()
+
+
+class TestBuildPlanCache:
+    """Check the plan cache behavior"""
+
+    def test_plan_is_cached(self, monkeypatch):
+        with monkeypatch.context() as m:
+            m.setattr(sys, "argv", ["", "--config", "./tests/conf/yaml/test.yaml"])
+            config_1 = ConfigArgBuilder(*all_configs, desc="Test Builder")
+            config_2 = ConfigArgBuilder(*all_configs, desc="Test Builder")
+            assert config_1._builder_obj.plan is config_2._builder_obj.plan
+            assert config_1._builder_obj.graph is config_2._builder_obj.graph
+
+    def test_plan_order_and_cast_types(self):
+        plan = BuildPlan.get(tuple(all_configs), lazy=False)
+        order = plan.topological_order
+        assert set(order) == {val.__name__ for val in all_configs}
+        # Dependencies must come before the classes that reference them
+        assert order.index("SingleNestedConfig") < order.index("TypeConfig")
+        assert order.index("NestedStuff") < order.index("TypeConfig")
+        assert plan.cast_types["TypeConfig"]["int_p"] is int
+
+    def test_plan_lru_eviction(self, monkeypatch):
+        monkeypatch.setattr(BuildPlan, "_max_size", 1)
+        BuildPlan.clear_cache()
+        plan_1 = BuildPlan.get((NestedStuff,), lazy=False)
+        BuildPlan.get((NestedListStuff,), lazy=False)
+        assert len(BuildPlan._cache) == 1
+        assert BuildPlan.get((NestedStuff,), lazy=False) is not plan_1
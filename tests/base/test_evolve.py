@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import logging
 import sys
 
 import attr
@@ -170,3 +171,18 @@ class TestEvolve:
         # Evolve the class
         new_class = arg_builder.evolve(evolve_nested_stuff, evolve_type_config)
         assert isinstance(arg_builder.spockspace_2_dict(new_class), dict) is True
+
+    def test_evolve_shares_unchanged(self, arg_builder, caplog):
+        original = arg_builder.generate()
+        evolve_nested_stuff = EvolveNestedStuff(one=12345, two="abcdef")
+        with caplog.at_level(logging.DEBUG, logger="spock.builder"):
+            new_class = arg_builder.evolve(evolve_nested_stuff)
+        # The parent referencing the evolved class is re-created
+        assert new_class.EvolveNestedStuff is evolve_nested_stuff
+        assert new_class.TypeThinDefaultConfig.class_enum_def is evolve_nested_stuff
+        assert new_class.TypeThinDefaultConfig.int_p_def == 10
+        assert "Parent = TypeThinDefaultConfig" in caplog.text
+        # Unrelated instances are shared and the original Spockspace is untouched
+        assert new_class.EvolveNestedListStuff is original.EvolveNestedListStuff
+        assert original.EvolveNestedStuff.one == 10
+        assert original.TypeThinDefaultConfig.class_enum_def.one == 10
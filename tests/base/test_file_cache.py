@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from spock.builder import ConfigArgBuilder
+from spock.handlers import Handler, JSONHandler, ParsedFileCache, YAMLHandler
+from tests.base.attr_configs_test import *
+from tests.base.base_asserts_test import *
+
+
+@pytest.fixture
+def file_cache():
+    file_cache = ParsedFileCache(max_size=2)
+    Handler.set_file_cache(file_cache)
+    yield file_cache
+    Handler.set_file_cache(None)
+
+
+class TestCachedBuild(AllTypes):
+    """Check that builds served from the cache match"""
+
+    @staticmethod
+    @pytest.fixture
+    def arg_builder(monkeypatch, file_cache):
+        with monkeypatch.context() as m:
+            m.setattr(sys, "argv", ["", "--config", "./tests/conf/yaml/test.yaml"])
+            ConfigArgBuilder(*all_configs, desc="Test Builder")
+            config = ConfigArgBuilder(*all_configs, desc="Test Builder")
+            assert file_cache.hits == 1
+            return config.generate()
+
+
+class TestParsedFileCache:
+    """Check the parsed file cache behavior"""
+
+    def test_hit_returns_copy(self, file_cache):
+        first = YAMLHandler().load(Path("./tests/conf/yaml/test.yaml"))
+        first["int_p"] = -1
+        second = YAMLHandler().load(Path("./tests/conf/yaml/test.yaml"))
+        assert second["int_p"] == 10
+        assert file_cache.stats == {"hits": 1, "misses": 1, "disk_hits": 0, "size": 1}
+
+    def test_invalidate_on_change(self, file_cache, tmp_path):
+        path = tmp_path / "test.json"
+        path.write_text('{"one": 1}')
+        assert JSONHandler().load(path) == {"one": 1}
+        path.write_text('{"one": 22}')
+        assert JSONHandler().load(path) == {"one": 22}
+        assert file_cache.misses == 2
+
+    def test_hash_contents(self, tmp_path):
+        file_cache = ParsedFileCache(hash_contents=True)
+        path = tmp_path / "test.json"
+        path.write_text('{"one": 1}')
+        stat = os.stat(path)
+        file_cache.load(path, JSONHandler()._load)
+        # Same size and mtime but different contents
+        path.write_text('{"one": 2}')
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert file_cache.load(path, JSONHandler()._load) == {"one": 2}
+
+    def test_lru_eviction(self, file_cache, tmp_path):
+        for idx in range(3):
+            path = tmp_path / f"{idx}.json"
+            path.write_text(f'{{"one": {idx}}}')
+            JSONHandler().load(path)
+        assert len(file_cache) == 2
+        JSONHandler().load(tmp_path / "0.json")
+        assert file_cache.hits == 0
+
+
+class TestPersistentFileCache:
+    """Check the on-disk parsed file cache"""
+
+    def test_fresh_cache_reads_disk(self, tmp_path):
+        cache_dir = tmp_path / "cache"
+        path = tmp_path / "test.yaml"
+        path.write_text("one: 1\ntwo: 1e1\n")
+        ParsedFileCache(cache_dir=cache_dir).load(path, YAMLHandler()._load)
+        assert len(list(cache_dir.glob("*.pickle"))) == 1
+        # A new cache (e.g. a new process) should not need to parse the file
+        file_cache = ParsedFileCache(cache_dir=cache_dir)
+
+        def fail_loader(val):
+            raise AssertionError("File should not be parsed")
+
+        assert file_cache.load(path, fail_loader) == {"one": 1, "two": 10.0}
+        assert file_cache.disk_hits == 1
+
+    def test_content_change_invalidates(self, tmp_path):
+        cache_dir = tmp_path / "cache"
+        path = tmp_path / "test.yaml"
+        path.write_text("one: 1\n")
+        ParsedFileCache(cache_dir=cache_dir).load(path, YAMLHandler()._load)
+        path.write_text("one: 2\n")
+        file_cache = ParsedFileCache(cache_dir=cache_dir)
+        assert file_cache.load(path, YAMLHandler()._load) == {"one": 2}
+        assert file_cache.disk_hits == 0
+
+    def test_corrupt_entry_is_replaced(self, tmp_path):
+        cache_dir = tmp_path / "cache"
+        path = tmp_path / "test.yaml"
+        path.write_text("one: 1\n")
+        ParsedFileCache(cache_dir=cache_dir).load(path, YAMLHandler()._load)
+        entry = list(cache_dir.glob("*.pickle"))[0]
+        entry.write_bytes(b"not a pickle")
+        file_cache = ParsedFileCache(cache_dir=cache_dir)
+        assert file_cache.load(path, YAMLHandler()._load) == {"one": 1}
+        assert ParsedFileCache(cache_dir=cache_dir).load(path, None) == {"one": 1}
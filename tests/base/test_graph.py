@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+import sys
+
+import pytest
+
+from spock.exceptions import _SpockInstantiationError
+from spock.graph import Graph, MergeGraph
+from tests.base.attr_configs_test import *
+
+
+def _make_nodes(n):
+    return [type(f"Node{idx}", (), {}) for idx in range(n)]
+
+
+class TestGraphCore:
+    def test_deep_chain_no_recursion(self):
+        # Deeper than the recursion limit -- the old recursive DFS would blow up
+        nodes = _make_nodes(sys.getrecursionlimit() + 500)
+        dag = {v.__name__: set() for v in nodes}
+        for parent, child in zip(nodes[:-1], nodes[1:]):
+            dag[parent.__name__].add(child)
+        graph = MergeGraph(dag, input_classes=nodes)
+        assert graph.topological_order == [v.__name__ for v in nodes]
+
+    def test_ties_follow_node_order(self):
+        nodes = _make_nodes(6)
+        dag = {v.__name__: set() for v in nodes}
+        # Node5 must come before Node0 -- everything else keeps the input order
+        dag["Node5"].add(nodes[0])
+        graph = MergeGraph(dag, input_classes=nodes)
+        assert graph.topological_order == [
+            "Node1",
+            "Node2",
+            "Node3",
+            "Node4",
+            "Node5",
+            "Node0",
+        ]
+        assert graph.topological_index["Node0"] == 5
+
+    def test_cycle_raises(self):
+        nodes = _make_nodes(4)
+        dag = {v.__name__: set() for v in nodes}
+        dag["Node1"].add(nodes[2])
+        dag["Node2"].add(nodes[3])
+        dag["Node3"].add(nodes[1])
+        with pytest.raises(_SpockInstantiationError, match="Node1"):
+            MergeGraph(dag, input_classes=nodes)
+
+    def test_properties_memoized(self):
+        graph = Graph(input_classes=all_configs, lazy=False)
+        assert graph.node_map is graph.node_map
+        assert graph.topological_order is graph.topological_order
+        order = graph.topological_order
+        assert [order[idx] for idx in graph.topological_index.values()] == order
+        # Dependencies come before the classes that use them
+        assert order.index("NestedStuff") < order.index("TypeConfig")
+
+    def test_topological_levels(self):
+        nodes = _make_nodes(5)
+        dag = {v.__name__: set() for v in nodes}
+        # Node0 -> Node1 -> Node3 and Node0 -> Node2 -> Node3 and Node4 alone
+        dag["Node0"].update({nodes[1], nodes[2]})
+        dag["Node1"].add(nodes[3])
+        dag["Node2"].add(nodes[3])
+        graph = MergeGraph(dag, input_classes=nodes)
+        assert graph.topological_levels == [
+            ["Node0", "Node4"],
+            ["Node1", "Node2"],
+            ["Node3"],
+        ]
@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
 import sys
+import threading
 
 import pytest
 
+from spock.backend.payload import BasePayload
 from spock.builder import ConfigArgBuilder
 from spock.config import spock
 from tests.base.attr_configs_test import *
@@ -312,3 +314,173 @@ class TestTripleNestedDefaultFromConfig:
 
     def test_default_nesting(self, arg_builder):
         assert arg_builder.MakeDatasetConfig.nested_config.other_nest.something == 1
+
+
+class TestYAMLBackend:
+    def test_float_resolution(self, tmp_path):
+        from spock.handlers import YAMLHandler
+
+        path = tmp_path / "floats.yaml"
+        path.write_text("one: 1e1\ntwo: -2.5E-3\nthree: 10\n")
+        payload = YAMLHandler()._load(str(path))
+        assert payload == {"one": 10.0, "two": -0.0025, "three": 10}
+        assert isinstance(payload["one"], float)
+
+    def test_no_global_yaml_mutation(self):
+        import yaml
+
+        # Importing spock should not change the global yaml loader/dumper state
+        assert yaml.safe_load("one: 1e1") == {"one": "1e1"}
+        shared = [1, 2]
+        assert "&id" in yaml.dump({"a": shared, "b": shared})
+
+    def test_no_aliases_on_write(self, tmp_path):
+        from spock.handlers import YAMLHandler
+
+        shared = [1, 2]
+        path = tmp_path / "out.yaml"
+        YAMLHandler.write({"a": shared, "b": shared}, str(path))
+        assert "&id" not in path.read_text()
+
+
+class TestJSONCodecs:
+    @pytest.mark.parametrize("codec", ["json", "orjson"])
+    def test_codec_load_save(self, codec, tmp_path):
+        pytest.importorskip(codec)
+        from spock.handlers import JSONHandler
+
+        payload = {"one": 1, "two": [1.5, "a", True, None], "three": {"four": 1e10}}
+        path = str(tmp_path / f"{codec}.json")
+        JSONHandler(codec=codec)._save(payload, None, None, path)
+        assert JSONHandler(codec=codec)._load(path) == payload
+        ref_path = str(tmp_path / "ref.json")
+        JSONHandler(codec="json")._save(payload, None, None, ref_path)
+        assert open(path, "rb").read() == open(ref_path, "rb").read()
+
+    def test_orjson_fallback(self, tmp_path):
+        pytest.importorskip("orjson")
+        from spock.handlers import JSONHandler
+
+        path = tmp_path / "nan.json"
+        path.write_text('{"one": NaN, "two": 123456789012345678901234567890}')
+        payload = JSONHandler(codec="orjson")._load(str(path))
+        assert payload["one"] != payload["one"]
+        assert payload["two"] == 123456789012345678901234567890
+
+    def test_unknown_codec(self):
+        from spock.handlers import JSONHandler
+
+        with pytest.raises(ValueError):
+            JSONHandler(codec="not_a_codec")
+
+    @pytest.mark.parametrize("codec", ["json", "orjson"])
+    def test_builder_codec(self, codec, monkeypatch):
+        pytest.importorskip(codec)
+        from spock.handlers import JSONCodec, OrjsonCodec
+
+        used = []
+        for codec_cls in (JSONCodec, OrjsonCodec):
+            loads = codec_cls.loads
+
+            def spy(contents, name=codec_cls.name, loads=loads):
+                used.append(name)
+                return loads(contents)
+
+            monkeypatch.setattr(codec_cls, "loads", staticmethod(spy))
+        with monkeypatch.context() as m:
+            m.setattr(sys, "argv", ["", "--config", "./tests/conf/json/test.json"])
+            config = ConfigArgBuilder(
+                *all_configs, desc="Test Builder", json_codec=codec
+            ).generate()
+        assert config.TypeConfig.int_p == 10
+        assert set(used) == {codec}
+
+
+class TestConcurrentIncludes:
+    """Checks that concurrently loaded includes merge the same as sequential ones"""
+
+    @staticmethod
+    def _write_configs(tmp_path):
+        for idx in range(4):
+            (tmp_path / f"inc_{idx}.yaml").write_text(
+                f"NestedStuff:\n  one: {idx}\n  two: inc_{idx}\n"
+            )
+        (tmp_path / "root.yaml").write_text(
+            "config: [inc_3.yaml, inc_1.yaml, inc_0.yaml, inc_2.yaml]\n"
+        )
+        return str(tmp_path / "root.yaml")
+
+    @staticmethod
+    def _spy_load_threads(monkeypatch):
+        threads = []
+        load_file = BasePayload._load_file
+
+        def spy(self, path, input_classes):
+            threads.append(threading.current_thread())
+            return load_file(self, path, input_classes)
+
+        monkeypatch.setattr(BasePayload, "_load_file", spy)
+        return threads
+
+    def test_declared_order(self, tmp_path):
+        path = self._write_configs(tmp_path)
+        sequential = ConfigArgBuilder(
+            NestedStuff, configs=[path], no_cmd_line=True
+        ).generate()
+        concurrent = ConfigArgBuilder(
+            NestedStuff, configs=[path], no_cmd_line=True, include_workers=4
+        ).generate()
+        assert sequential.NestedStuff == concurrent.NestedStuff
+        assert concurrent.NestedStuff.two == "inc_2"
+
+    def test_uses_thread_pool(self, tmp_path, monkeypatch):
+        path = self._write_configs(tmp_path)
+        threads = self._spy_load_threads(monkeypatch)
+        ConfigArgBuilder(NestedStuff, configs=[path], no_cmd_line=True)
+        assert all(t is threading.main_thread() for t in threads)
+        threads.clear()
+        ConfigArgBuilder(
+            NestedStuff, configs=[path], no_cmd_line=True, include_workers=4
+        )
+        # The four sibling includes are loaded off the main thread
+        off_main = [t for t in threads if t is not threading.main_thread()]
+        assert len(off_main) == 4
+
+    def test_config_cycles(self, monkeypatch):
+        threads = self._spy_load_threads(monkeypatch)
+        with monkeypatch.context() as m:
+            m.setattr(
+                sys, "argv", ["", "--config", "./tests/conf/yaml/test_cycle.yaml"]
+            )
+            with pytest.raises(ValueError):
+                ConfigArgBuilder(*all_configs, desc="Test Builder", include_workers=4)
+        assert any(t is not threading.main_thread() for t in threads)
+
+
+class TestIncludeGraph:
+    """Checks the include graph of config files"""
+
+    def test_cycle_path(self, tmp_path):
+        (tmp_path / "a.yaml").write_text("config: [b.yaml]\n")
+        (tmp_path / "b.yaml").write_text("config: [a.yaml]\n")
+        with pytest.raises(ValueError, match="a.yaml -> .*b.yaml -> .*a.yaml"):
+            ConfigArgBuilder(
+                NestedStuff, configs=[str(tmp_path / "a.yaml")], no_cmd_line=True
+            )
+
+    def test_same_basename(self, tmp_path):
+        # Unrelated files that share a name are not a cycle
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "base.yaml").write_text(
+            "NestedStuff:\n  one: 2\n  two: b\n"
+        )
+        (tmp_path / "base.yaml").write_text("config: [sub/base.yaml]\n")
+        config = ConfigArgBuilder(
+            NestedStuff, configs=[str(tmp_path / "base.yaml")], no_cmd_line=True
+        )
+        assert config.generate().NestedStuff.one == 2
+        root = str((tmp_path / "base.yaml").resolve())
+        child = str((tmp_path / "sub" / "base.yaml").resolve())
+        assert config.include_graph.roots == [root]
+        assert config.include_graph.edges == {root: [child], child: []}
+        assert config.include_graph.children(tmp_path / "base.yaml") == [child]
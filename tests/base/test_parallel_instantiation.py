@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+import sys
+import threading
+
+import pytest
+
+from spock import spock
+from spock.builder import ConfigArgBuilder
+from spock.exceptions import _SpockInstantiationError
+from spock.utils import within
+from tests.base.attr_configs_test import *
+from tests.base.base_asserts_test import *
+
+# Both hooks have to be running at the same time to get through the barrier
+_BARRIER = threading.Barrier(2, timeout=10)
+
+
+@spock
+class BarrierOne:
+    value: int = 1
+
+    def __post_hook__(self):
+        _BARRIER.wait()
+
+
+@spock
+class BarrierTwo:
+    value: int = 2
+
+    def __post_hook__(self):
+        _BARRIER.wait()
+
+
+@spock
+class HookFailOne:
+    other: float = 0.5
+
+    def __post_hook__(self):
+        within(self.other, 0.9, 1.1, inclusive_lower=False, inclusive_upper=False)
+
+
+@spock
+class HookFailTwo:
+    other: float = 2.0
+
+    def __post_hook__(self):
+        within(self.other, 0.9, 1.1, inclusive_lower=False, inclusive_upper=False)
+
+
+class TestAllTypesParallelInstantiation(AllTypes):
+    """Check all required types work as expected when instantiated in parallel"""
+
+    @staticmethod
+    @pytest.fixture
+    def arg_builder(monkeypatch):
+        with monkeypatch.context() as m:
+            m.setattr(sys, "argv", ["", "--config", "./tests/conf/yaml/test.yaml"])
+            config = ConfigArgBuilder(
+                *all_configs, desc="Test Builder", instantiate_workers=4
+            )
+            return config.generate()
+
+
+class TestParallelInstantiation:
+    def test_matches_sequential(self, monkeypatch):
+        with monkeypatch.context() as m:
+            m.setattr(sys, "argv", ["", "--config", "./tests/conf/yaml/test.yaml"])
+            serial = ConfigArgBuilder(*all_configs, desc="Test Builder").generate()
+            parallel = ConfigArgBuilder(
+                *all_configs, desc="Test Builder", instantiate_workers=4
+            ).generate()
+        # Same classes in the same order
+        assert list(vars(serial).keys()) == list(vars(parallel).keys())
+        for k, v in vars(serial).items():
+            assert getattr(parallel, k) == v
+
+    def test_hooks_run_concurrently(self, monkeypatch):
+        with monkeypatch.context() as m:
+            m.setattr(sys, "argv", [""])
+            config = ConfigArgBuilder(
+                BarrierOne, BarrierTwo, instantiate_workers=2
+            ).generate()
+        assert config.BarrierOne.value == 1
+        assert config.BarrierTwo.value == 2
+
+    def test_errors_reported_per_class(self, monkeypatch):
+        with monkeypatch.context() as m:
+            m.setattr(sys, "argv", [""])
+            with pytest.raises(_SpockInstantiationError) as e:
+                ConfigArgBuilder(HookFailOne, HookFailTwo, instantiate_workers=2)
+        assert "`HookFailOne`" in str(e.value)
+        assert "`HookFailTwo`" in str(e.value)
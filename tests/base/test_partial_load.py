@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+import sys
+
+import pytest
+
+from spock.backend.payload import AttrPayload
+from spock.builder import ConfigArgBuilder
+from tests.base.attr_configs_test import *
+from tests.base.base_asserts_test import *
+
+
+class TestPartialLoadAllTypes(AllTypes):
+    """Check that partial loading with all classes matches a full load"""
+
+    @staticmethod
+    @pytest.fixture
+    def arg_builder(monkeypatch):
+        with monkeypatch.context() as m:
+            m.setattr(sys, "argv", ["", "--config", "./tests/conf/yaml/test.yaml"])
+            config = ConfigArgBuilder(
+                *all_configs, desc="Test Builder", partial_load=True
+            )
+            return config.generate()
+
+
+class TestPartialLoad:
+    def test_subset_of_classes(self, monkeypatch):
+        with monkeypatch.context() as m:
+            m.setattr(sys, "argv", ["", "--config", "./tests/conf/yaml/test.yaml"])
+            # A full load fails on all the sections of the other classes
+            with pytest.raises((TypeError, ValueError)):
+                ConfigArgBuilder(NestedStuff, desc="Test Builder")
+            config = ConfigArgBuilder(
+                NestedStuff, desc="Test Builder", partial_load=True
+            ).generate()
+            assert config.NestedStuff.one == 11
+            assert config.NestedStuff.two == "ciao"
+
+    def test_select_sections(self):
+        payload = {
+            "config": ["a.yaml"],
+            "NestedStuff": {"one": 1},
+            "TypeConfig": {"int_p": 1},
+            "two": "hi",
+            "int_p": 10,
+        }
+        assert AttrPayload.select_sections(payload, [NestedStuff]) == {
+            "config": ["a.yaml"],
+            "NestedStuff": {"one": 1},
+            "two": "hi",
+        }
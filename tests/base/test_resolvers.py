@@ -8,6 +8,8 @@ import pytest
 
 from spock import spock
 from spock import SpockBuilder
+from spock.backend.resolvers import CryptoResolver, EnvResolver, VarResolver, _tokenize
+from spock.backend.utils import CryptoKeys
 from spock.exceptions import (
     _SpockEnvResolverError,
     _SpockFieldHandlerError,
@@ -614,3 +616,131 @@ class TestResolvers:
         assert arg_builder_conf.EnvClass.env_float_def_opt is None
         assert arg_builder_conf.EnvClass.env_bool_def_opt is False
         assert arg_builder_conf.EnvClass.env_str_def_opt is None
+
+
+@spock
+class NoCrypto:
+    plain: int = 1
+
+
+@spock
+class EnvCrypto:
+    hidden: int = "${spock.env.crypto:HIDDEN_INT, 7}"
+
+
+class TestLazyCrypto:
+    def test_no_crypto_skips_key(self, monkeypatch, tmp_path):
+        with monkeypatch.context() as m:
+            m.setattr(sys, "argv", [""])
+            config = SpockBuilder(NoCrypto)
+            config.save(
+                file_extension=".yaml",
+                file_name="pytest.lazy",
+                user_specified_path=tmp_path,
+                extra_info=False,
+            )
+            assert config._crypto.created is False
+            assert len(os.listdir(str(tmp_path))) == 1
+
+    def test_key_created_on_access(self, monkeypatch):
+        with monkeypatch.context() as m:
+            m.setattr(sys, "argv", [""])
+            config = SpockBuilder(NoCrypto)
+            values = config.generate()
+            assert "__key__" not in vars(values)
+            assert values.__key__ == config.key
+            assert values.__salt__ == config.salt
+            assert config._crypto.created is True
+
+    def test_env_crypto_creates_key(self, monkeypatch):
+        with monkeypatch.context() as m:
+            m.setattr(sys, "argv", [""])
+            config = SpockBuilder(EnvCrypto)
+            assert config._crypto.created is True
+            assert config.generate().EnvCrypto.hidden == 7
+
+    def test_given_salt_read_at_build(self, monkeypatch):
+        with monkeypatch.context() as m:
+            m.setattr(sys, "argv", [""])
+            config = SpockBuilder(NoCrypto, salt="./tests/conf/yaml/test_salt.yaml")
+            assert config._crypto.created is True
+
+
+class TestResolverEngine:
+    def test_tokenize_segments(self):
+        template = _tokenize("a_${spock.var:One.two}_b_${spock.env.inject:ENV, 3}")
+        assert template.segments[0] == "a_"
+        assert template.segments[2] == "_b_"
+        assert [
+            (val.kind, val.annotation, val.body) for val in template.references
+        ] == [
+            ("var", "", "One.two"),
+            ("env", "inject", "ENV, 3"),
+        ]
+        assert template.full is None
+        assert _tokenize("${spock.crypto:abc=}").full.kind == "crypto"
+
+    def test_template_cached(self):
+        _tokenize.cache_clear()
+        resolver = VarResolver()
+        value = "${spock.var:One.two}_${spock.var:Three.four}"
+        for _ in range(3):
+            assert resolver.detect(value, str)
+            assert [val[0] for val in resolver.get_regex_match_reference(value)] == [
+                "One.two",
+                "Three.four",
+            ]
+        assert _tokenize.cache_info().misses == 1
+
+    def test_plain_values_pass_through(self):
+        resolver = EnvResolver()
+        assert resolver.resolve("plain_value", str) == ("plain_value", None)
+        assert resolver.resolve("${spock.var:One.two}", str) == (
+            "${spock.var:One.two}",
+            None,
+        )
+        assert resolver.resolve(10, int) == (10, None)
+        assert not VarResolver().detect("${spock.variable:One.two}", str)
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "log_dir=${spock.env:HOME}/runs",
+            "${spock.var:One.two}/${spock.env:HOME}",
+            "${spock.env:NOT_CLOSED",
+            "x${spock.crypto:abc=}",
+        ],
+    )
+    def test_partial_references_pass_through(self, value):
+        # Env and crypto references are only resolved if they are the whole value
+        assert EnvResolver().resolve(value, str) == (value, None)
+        crypto = CryptoKeys(lambda: (None, None))
+        assert CryptoResolver(crypto).resolve(value, str) == (value, None)
+        assert crypto.created is False
+
+    def test_whole_value_body(self, monkeypatch):
+        monkeypatch.delenv("NOPE", raising=False)
+        # The body runs to the final `}` when it doesn't tokenize as one reference
+        assert EnvResolver().resolve("${spock.env:NOPE, a}b}", str) == ("a}b", None)
+
+    @pytest.mark.parametrize(
+        "value", ["${spock.env:}", "${spock.env:NOPE}${spock.env:NOPE}"]
+    )
+    def test_whole_value_unset_raises(self, monkeypatch, value):
+        monkeypatch.delenv("NOPE", raising=False)
+        with pytest.raises(_SpockEnvResolverError):
+            EnvResolver().resolve(value, str)
+
+    def test_partial_reference_field(self, monkeypatch):
+        @spock
+        class PartialEnv:
+            p: str = "log_dir=${spock.env:HOME}/runs"
+
+        with monkeypatch.context() as m:
+            m.setattr(sys, "argv", [""])
+            config = SpockBuilder(PartialEnv).generate()
+        assert config.PartialEnv.p == "log_dir=${spock.env:HOME}/runs"
+
+    def test_var_default_raises(self):
+        with pytest.raises(_SpockResolverError):
+            VarResolver().get_regex_match_reference("${spock.var:One.two, 3}")
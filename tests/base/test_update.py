@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+import sys
+
+import pytest
+
+from spock import spock
+from spock.backend.builder import BaseBuilder
+from spock.backend.field_handlers import RegisterSpockCls
+from spock.builder import ConfigArgBuilder
+from spock.exceptions import _SpockValueError
+
+
+@spock
+class UpBase:
+    value: int = 1
+
+
+@spock
+class UpRef:
+    derived: int = "${spock.var:UpBase.value}"
+    label: str = "ref"
+
+
+@spock
+class UpNested:
+    base: UpBase
+    scale: float = 2.0
+
+
+@spock
+class UpOther:
+    other: int = 5
+
+
+@spock
+class UpSelf:
+    first: str = "a"
+    both: str = "${spock.var:UpSelf.first}-${spock.var:UpBase.value}"
+
+
+class TestUpdate:
+    @staticmethod
+    @pytest.fixture
+    def builder(monkeypatch):
+        with monkeypatch.context() as m:
+            m.setattr(sys, "argv", [""])
+            return ConfigArgBuilder(UpBase, UpRef, UpNested, UpOther)
+
+    @staticmethod
+    def _spy_generate(monkeypatch):
+        generated = []
+        recurse_generate = RegisterSpockCls.recurse_generate.__func__
+
+        def spy(cls, spock_cls, builder_space, crypto):
+            generated.append(spock_cls.__name__)
+            return recurse_generate(cls, spock_cls, builder_space, crypto)
+
+        monkeypatch.setattr(RegisterSpockCls, "recurse_generate", classmethod(spy))
+        return generated
+
+    def test_update_downstream(self, builder):
+        before = builder.generate()
+        after = builder.update({"UpBase.value": 10})
+        assert after.UpBase.value == 10
+        # Variable and class references are re-resolved
+        assert after.UpRef.derived == 10
+        assert after.UpNested.base.value == 10
+        # Unaffected instances are shared and the old Spockspace is untouched
+        assert after.UpOther is before.UpOther
+        assert before.UpBase.value == 1
+        assert before.UpRef.derived == 1
+        # The builder keeps the update
+        assert builder.generate() is after
+
+    def test_update_leaf(self, builder):
+        before = builder.generate()
+        after = builder.update({"UpRef.label": "new", "UpNested.scale": 4.0})
+        assert after.UpRef.label == "new"
+        assert after.UpRef.derived == 1
+        assert after.UpNested.scale == 4.0
+        assert after.UpBase is before.UpBase
+        assert after.UpOther is before.UpOther
+        assert after.UpNested.base is before.UpBase
+
+    def test_update_matches_full_build(self, builder, tmp_path):
+        after = builder.update({"UpBase.value": 3, "UpOther.other": 7})
+        config = tmp_path / "update.yaml"
+        config.write_text("UpBase:\n  value: 3\nUpOther:\n  other: 7\n")
+        full = ConfigArgBuilder(
+            UpBase, UpRef, UpNested, UpOther, configs=[str(config)], no_cmd_line=True
+        ).generate()
+        assert list(vars(after).keys()) == list(vars(full).keys())
+        for k, v in vars(full).items():
+            assert getattr(after, k) == v
+
+    def test_update_bad_keys(self, builder):
+        with pytest.raises(_SpockValueError):
+            builder.update({"NotAClass.value": 1})
+        with pytest.raises(_SpockValueError):
+            builder.update({"UpBase.not_a_field": 1})
+        with pytest.raises(_SpockValueError):
+            builder.update({"UpBase": 1})
+
+    def test_update_only_generates_changed(self, builder, monkeypatch):
+        generated = self._spy_generate(monkeypatch)
+        state = builder._build_state
+        builder.update({"UpOther.other": 6})
+        assert generated == ["UpOther"]
+        # The fields and graphs of the previous build are re-used
+        assert builder._build_state.var_graph is state.var_graph
+        assert builder._build_state.merged_graph is state.merged_graph
+        assert builder._build_state.cls_fields["UpRef"] is state.cls_fields["UpRef"]
+
+    def test_update_new_reference(self, builder, monkeypatch):
+        state = builder._build_state
+        after = builder.update(
+            {"UpOther.other": "${spock.var:UpBase.value}", "UpBase.value": 4}
+        )
+        assert builder._build_state.merged_graph is not state.merged_graph
+        assert after.UpOther.other == 4
+        after = builder.update({"UpBase.value": 8})
+        assert after.UpOther.other == 8
+        assert after.UpRef.derived == 8
+
+    def test_update_repeated(self, monkeypatch):
+        with monkeypatch.context() as m:
+            m.setattr(sys, "argv", [""])
+            builder = ConfigArgBuilder(UpBase, UpSelf)
+        assert builder.generate().UpSelf.both == "a-1"
+        # References are resolved again from the unresolved fields on each update
+        assert builder.update({"UpSelf.first": "b"}).UpSelf.both == "b-1"
+        assert builder.update({"UpBase.value": 2}).UpSelf.both == "b-2"
+
+    def test_update_instantiate_workers(self, monkeypatch):
+        affected = []
+        instantiate_levels = BaseBuilder._instantiate_levels
+
+        def spy(self, *args, **kwargs):
+            affected.append(kwargs.get("affected"))
+            return instantiate_levels(self, *args, **kwargs)
+
+        monkeypatch.setattr(BaseBuilder, "_instantiate_levels", spy)
+        with monkeypatch.context() as m:
+            m.setattr(sys, "argv", [""])
+            builder = ConfigArgBuilder(
+                UpBase, UpRef, UpNested, UpOther, instantiate_workers=2
+            )
+        after = builder.update({"UpBase.value": 10})
+        assert affected == [None, {"UpBase", "UpRef", "UpNested"}]
+        assert after.UpRef.derived == 10
+        assert after.UpNested.base is after.UpBase
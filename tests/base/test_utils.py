@@ -1,5 +1,17 @@
 # -*- coding: utf-8 -*-
+import re
+import subprocess
+import sys
+
+import git
+import pytest
+import yaml
+
+from spock.backend.utils import FieldIndex, _str_2_bool, get_field_index
+from spock import utils
+from spock.builder import ConfigArgBuilder
 from spock.config import isinstance_spock
+from spock.utils import add_generic_info, add_info, get_packages, refresh_provenance
 from tests.base.attr_configs_test import *
 
 
@@ -9,3 +21,135 @@ class TestIsInstance:
         assert isinstance_spock(TypeConfig) is True
         assert isinstance_spock(object) is False
         assert isinstance_spock(StrChoice) is False
+
+
+class TestFieldIndex:
+    def test_field_index(self):
+        index = get_field_index([NestedStuff, TypeConfig])
+        assert isinstance(index, FieldIndex)
+        assert index.class_names == {"NestedStuff", "TypeConfig"}
+        assert index.attr_field_sets["NestedStuff"] == {"one", "two"}
+        assert {"one", "two", "int_p", "float_p"} <= index.all_fields
+        assert "nested_list_p_def" not in index.all_fields
+
+    def test_field_index_cached(self):
+        assert get_field_index([NestedStuff]) is get_field_index((NestedStuff,))
+        assert get_field_index([NestedStuff]) is not get_field_index([TypeConfig])
+
+
+class TestProvenanceCache:
+    @staticmethod
+    @pytest.fixture
+    def git_repo(monkeypatch, tmp_path):
+        repo = git.Repo.init(tmp_path)
+        repo.create_remote("origin", "https://example.com/spock.git")
+        (tmp_path / "tracked.txt").write_text("a")
+        repo.index.add(["tracked.txt"])
+        repo.index.commit("init")
+        monkeypatch.chdir(tmp_path)
+        refresh_provenance()
+        yield tmp_path
+        repo.close()
+        refresh_provenance()
+
+    def test_machine_info_cached(self, monkeypatch):
+        refresh_provenance()
+        calls = []
+        monkeypatch.setattr("socket.getfqdn", lambda: calls.append(1) or "host")
+        info_1 = add_generic_info({})
+        info_2 = add_generic_info({})
+        assert len(calls) == 1
+        assert info_1["# Machine FQDN"] == info_2["# Machine FQDN"] == "host"
+        assert list(info_1.keys())[4:6] == ["# Run Date", "# Run Time"]
+        refresh_provenance()
+        add_generic_info({})
+        assert len(calls) == 2
+
+    def test_packages_cached(self):
+        assert get_packages() == get_packages()
+        assert get_packages() is not get_packages()
+
+    def test_git_status_cached(self, git_repo):
+        info = add_info()
+        assert info["# Git Status"] == "CLEAN"
+        assert info["# Git Origin"] == "https://example.com/spock.git"
+        (git_repo / "tracked.txt").write_text("b")
+        # The status is checked again unless the cached one is asked for
+        assert add_info()["# Git Status"] == "DIRTY"
+        assert add_info(cache_git_status=True)["# Git Status"] == "CLEAN"
+        refresh_provenance()
+        assert add_info(cache_git_status=True)["# Git Status"] == "DIRTY"
+
+    def test_save_git_status(self, git_repo, tmp_path_factory):
+        out = tmp_path_factory.mktemp("out")
+        (out / "conf.yaml").write_text("NestedStuff:\n  one: 1\n  two: a\n")
+        config = ConfigArgBuilder(
+            NestedStuff, configs=[str(out / "conf.yaml")], no_cmd_line=True
+        )
+        config.save(user_specified_path=out, file_name="clean")
+        (git_repo / "tracked.txt").write_text("b")
+        config.save(user_specified_path=out, file_name="dirty")
+        config.save(user_specified_path=out, file_name="cached", cache_git_status=True)
+        status = {}
+        for val in out.glob("*.spock.cfg.yaml"):
+            status[val.name.split(".")[0]] = re.search(
+                r"# Git Status: (\w+)", val.read_text()
+            ).group(1)
+        assert status == {"clean": "CLEAN", "dirty": "DIRTY", "cached": "CLEAN"}
+
+
+class TestGetPackages:
+    def test_get_packages_normalized(self):
+        packages = get_packages()
+        assert packages["# pyyaml"] == yaml.__version__
+        assert all(k == k.lower() and " " not in k[2:] for k in packages)
+        # PEP 503 -- runs of `-`, `_`, and `.` collapse into a single `-`
+        assert not any(c in k[2:] for k in packages for c in "._")
+
+    def test_get_packages_pep503(self, monkeypatch):
+        monkeypatch.setattr(
+            utils,
+            "_iter_distributions",
+            lambda: iter([("hurry.filesize", "0.9"), ("Foo__Bar", "1.0")]),
+        )
+        utils._get_packages.cache_clear()
+        try:
+            assert get_packages() == {"# hurry-filesize": "0.9", "# foo-bar": "1.0"}
+        finally:
+            utils._get_packages.cache_clear()
+
+
+class TestLazyImports:
+    def test_import_skips_heavy_dependencies(self):
+        lazy = ("cryptography.fernet", "distutils", "git", "pkg_resources", "pytomlpp")
+        out = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                f"import sys, spock; print([m for m in {lazy} if m in sys.modules])",
+            ],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        assert out.stdout.strip() == "[]"
+
+    def test_version_resolved_on_access(self, monkeypatch):
+        import spock
+        from spock import handlers
+
+        monkeypatch.delitem(vars(spock), "__version__", raising=False)
+        handlers._get_version.cache_clear()
+        monkeypatch.setattr(handlers, "get_versions", lambda: {"version": "1.2.3"})
+        try:
+            assert spock.__version__ == "1.2.3"
+            assert handlers._get_version.cache_info().currsize == 1
+        finally:
+            vars(spock).pop("__version__", None)
+            handlers._get_version.cache_clear()
+
+    def test_str_2_bool(self):
+        assert _str_2_bool("True") is True
+        assert _str_2_bool("off") is False
+        with pytest.raises(ValueError):
+            _str_2_bool("maybe")
@@ -4,8 +4,11 @@ import glob
 import os
 import re
 import sys
+import threading
+from concurrent.futures import Future
 
 import pytest
+import yaml
 
 from spock.builder import ConfigArgBuilder
 from tests.base.attr_configs_test import *
@@ -184,3 +187,48 @@ class TestJSONWriter:
             with open(fname, "r") as fin:
                 print(fin.read())
             assert len(list(tmp_path.iterdir())) == 1
+
+
+class TestNonBlockingWriter:
+    def test_non_blocking_save(self, monkeypatch, tmp_path):
+        """Test the non-blocking save writes a snapshot of the config"""
+        with monkeypatch.context() as m:
+            m.setattr(sys, "argv", ["", "--config", "./tests/conf/yaml/test.yaml"])
+            config = ConfigArgBuilder(*all_configs, desc="Test Builder")
+            # Hold the (single) writer thread so the save can't start right away
+            release = threading.Event()
+            config._get_save_executor().submit(release.wait, 5)
+            future = config.save(
+                user_specified_path=tmp_path, extra_info=False, non_blocking=True
+            )
+            assert isinstance(future, Future)
+            # Changes after the call must not leak into the saved file
+            config.generate().TypeConfig.list_p_float.append(99.0)
+            release.set()
+            assert future.result() is None
+            fname = glob.glob(f"{str(tmp_path)}/*.yaml")[0]
+            with open(fname, "r") as fid:
+                saved = yaml.safe_load(fid)
+            assert saved["TypeConfig"]["list_p_float"] == [10.0, 20.0]
+
+    def test_non_blocking_save_raises_on_result(self, monkeypatch, tmp_path):
+        """Test errors from the background save are raised by result()"""
+        with monkeypatch.context() as m:
+            m.setattr(sys, "argv", ["", "--config", "./tests/conf/yaml/test.yaml"])
+            config = ConfigArgBuilder(*all_configs, desc="Test Builder")
+            future = config.save(
+                user_specified_path=tmp_path / "missing",
+                create_save_path=False,
+                extra_info=False,
+                non_blocking=True,
+            )
+            with pytest.raises(OSError):
+                future.result()
+
+    def test_non_blocking_save_no_path(self, monkeypatch):
+        """Test a missing save path still raises on the calling thread"""
+        with monkeypatch.context() as m:
+            m.setattr(sys, "argv", ["", "--config", "./tests/conf/yaml/test.yaml"])
+            config = ConfigArgBuilder(*all_configs, desc="Test Builder")
+            with pytest.raises(ValueError):
+                config.save(non_blocking=True)
@@ -3,6 +3,7 @@ import os
 
 import boto3
 import pytest
+from botocore.config import Config
 from moto import mock_s3, mock_sts
 
 
@@ -27,3 +28,19 @@ def s3(aws_credentials):
         aws_s3_client = boto3.client("s3", region_name="us-east-1")
         aws_session = boto3.Session(region_name="us-east-1")
         yield aws_session, aws_s3_client
+
+
+@pytest.fixture(scope="function")
+def s3_plain(aws_credentials):
+    # Client that skips the streaming checksums so the mocked objects are stored as plain bodies
+    try:
+        config = Config(
+            request_checksum_calculation="when_required",
+            response_checksum_validation="when_required",
+        )
+    except TypeError:
+        config = Config()
+    with mock_s3():
+        aws_s3_client = boto3.client("s3", region_name="us-east-1", config=config)
+        aws_session = boto3.Session(region_name="us-east-1")
+        yield aws_session, aws_s3_client
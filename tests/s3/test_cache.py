@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+import os
+import sys
+
+import pytest
+
+from spock.addons.s3 import S3Config
+from spock.builder import ConfigArgBuilder
+from tests.base.attr_configs_test import *
+from tests.s3.fixtures_test import *
+
+
+@pytest.fixture
+def s3_cached(s3_plain, tmp_path):
+    aws_session, s3_client = s3_plain
+    mock_s3_bucket = "spock-test"
+    s3_client.create_bucket(Bucket=mock_s3_bucket)
+    s3_client.put_object(
+        Bucket=mock_s3_bucket,
+        Key="conf/nested.yaml",
+        Body=b"NestedStuff:\n  one: 1\n  two: a\n",
+    )
+    return aws_session, s3_client, f"s3://{mock_s3_bucket}/conf/nested.yaml", tmp_path
+
+
+def _build(monkeypatch, uri, s3_config):
+    with monkeypatch.context() as m:
+        m.setattr(sys, "argv", ["", "--config", uri])
+        return ConfigArgBuilder(
+            NestedStuff, s3_config=s3_config, desc="Test Builder"
+        ).generate()
+
+
+def _fail(*args, **kwargs):
+    raise AssertionError("S3 should not have been called")
+
+
+class TestS3Cache:
+    @pytest.mark.parametrize("in_memory", [False, True])
+    def test_cache_skips_download(self, monkeypatch, s3_cached, in_memory):
+        aws_session, s3_client, uri, tmp_path = s3_cached
+        s3_config = S3Config(
+            session=aws_session,
+            s3_session=s3_client,
+            cache_dir=str(tmp_path / "cache"),
+            show_progress=False,
+            in_memory=in_memory,
+        )
+        assert _build(monkeypatch, uri, s3_config).NestedStuff.one == 1
+        # Second build only checks the ETag
+        monkeypatch.setattr(s3_client, "download_file", _fail)
+        monkeypatch.setattr(s3_client, "get_object", _fail)
+        assert _build(monkeypatch, uri, s3_config).NestedStuff.two == "a"
+        cached = [
+            val for val in os.listdir(tmp_path / "cache") if val.endswith(".yaml")
+        ]
+        assert len(cached) == 1
+
+    def test_cache_refreshes_on_new_etag(self, monkeypatch, s3_cached):
+        aws_session, s3_client, uri, tmp_path = s3_cached
+        s3_config = S3Config(
+            session=aws_session,
+            s3_session=s3_client,
+            cache_dir=str(tmp_path / "cache"),
+            show_progress=False,
+        )
+        assert _build(monkeypatch, uri, s3_config).NestedStuff.one == 1
+        s3_client.put_object(
+            Bucket="spock-test",
+            Key="conf/nested.yaml",
+            Body=b"NestedStuff:\n  one: 2\n  two: b\n",
+        )
+        assert _build(monkeypatch, uri, s3_config).NestedStuff.one == 2
+        # The stale copy is removed
+        cached = [
+            val for val in os.listdir(tmp_path / "cache") if val.endswith(".yaml")
+        ]
+        assert len(cached) == 1
+
+    def test_cache_ttl_skips_head(self, monkeypatch, s3_cached):
+        aws_session, s3_client, uri, tmp_path = s3_cached
+        s3_config = S3Config(
+            session=aws_session,
+            s3_session=s3_client,
+            cache_dir=str(tmp_path / "cache"),
+            cache_ttl=3600,
+            show_progress=False,
+        )
+        assert _build(monkeypatch, uri, s3_config).NestedStuff.one == 1
+        monkeypatch.setattr(s3_client, "head_object", _fail)
+        monkeypatch.setattr(s3_client, "download_file", _fail)
+        assert _build(monkeypatch, uri, s3_config).NestedStuff.one == 1
+
+    def test_failed_download_leaves_no_temp(self, monkeypatch, s3_cached):
+        aws_session, s3_client, uri, tmp_path = s3_cached
+        s3_config = S3Config(
+            session=aws_session,
+            s3_session=s3_client,
+            cache_dir=str(tmp_path / "cache"),
+            show_progress=False,
+        )
+
+        def _broken(*args, **kwargs):
+            raise ValueError("Download failed")
+
+        monkeypatch.setattr(s3_client, "download_file", _broken)
+        with pytest.raises(Exception):
+            _build(monkeypatch, uri, s3_config)
+        assert os.listdir(tmp_path / "cache") == []
+
+    def test_stale_copy_already_removed(self, monkeypatch, s3_cached):
+        aws_session, s3_client, uri, tmp_path = s3_cached
+        s3_config = S3Config(
+            session=aws_session,
+            s3_session=s3_client,
+            cache_dir=str(tmp_path / "cache"),
+            show_progress=False,
+        )
+        assert _build(monkeypatch, uri, s3_config).NestedStuff.one == 1
+        s3_client.put_object(
+            Bucket="spock-test",
+            Key="conf/nested.yaml",
+            Body=b"NestedStuff:\n  one: 2\n  two: b\n",
+        )
+        # Another process sharing the cache already removed this stale copy
+        listdir = os.listdir
+
+        def _racing_listdir(path):
+            entries = listdir(path)
+            return entries + [
+                f"{val.split('-')[0]}-gone.yaml" for val in entries if "-" in val
+            ]
+
+        with monkeypatch.context() as m:
+            m.setattr("spock.addons.s3.utils.os.listdir", _racing_listdir)
+            assert _build(monkeypatch, uri, s3_config).NestedStuff.one == 2
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+import os
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+from spock.addons.s3 import S3Config
+from spock.builder import ConfigArgBuilder
+from spock.handlers import JSONHandler, YAMLHandler
+from tests.base.attr_configs_test import *
+from tests.base.base_asserts_test import *
+from tests.s3.fixtures_test import *
+
+
+def _in_memory_config(aws_session, s3_client, tmp_path):
+    # Point the temp folder at a path that doesn't exist -- any temp file write would fail
+    return S3Config(
+        session=aws_session,
+        s3_session=s3_client,
+        temp_folder=str(tmp_path / "unused"),
+        in_memory=True,
+        show_progress=False,
+    )
+
+
+class TestAllTypesFromS3InMemory(AllTypes):
+    """Check all required types work as expected when read straight from memory"""
+
+    @staticmethod
+    @pytest.fixture
+    def arg_builder(monkeypatch, s3_plain, tmp_path):
+        with monkeypatch.context() as m:
+            aws_session, s3_client = s3_plain
+            mock_s3_bucket = "spock-test"
+            mock_s3_object = "fake/test/bucket/pytest.s3load.yaml"
+            s3_client.create_bucket(Bucket=mock_s3_bucket)
+            s3_client.upload_file(
+                "./tests/conf/yaml/test.yaml", mock_s3_bucket, mock_s3_object
+            )
+            m.setattr(
+                sys, "argv", ["", "--config", f"s3://{mock_s3_bucket}/{mock_s3_object}"]
+            )
+            config = ConfigArgBuilder(
+                *all_configs,
+                s3_config=_in_memory_config(aws_session, s3_client, tmp_path),
+                desc="Test Builder",
+            )
+            return config.generate()
+
+
+class TestS3InMemory:
+    @pytest.mark.parametrize(
+        "handler,extension", [(YAMLHandler, ".yaml"), (JSONHandler, ".json")]
+    )
+    def test_in_memory_round_trip(
+        self, monkeypatch, s3_plain, tmp_path, handler, extension
+    ):
+        aws_session, s3_client = s3_plain
+        s3_config = _in_memory_config(aws_session, s3_client, tmp_path)
+        mock_s3_bucket = "spock-test"
+        s3_client.create_bucket(Bucket=mock_s3_bucket)
+        payload = {"NestedStuff": {"one": 7, "two": "memory"}}
+        handler().save(
+            out_dict=payload,
+            info_dict=None,
+            library_dict=None,
+            path=Path(f"s3://{mock_s3_bucket}/saved"),
+            name=f"pytest.s3memory{extension}",
+            s3_config=s3_config,
+        )
+        keys = [
+            val["Key"]
+            for val in s3_client.list_objects(Bucket=mock_s3_bucket)["Contents"]
+        ]
+        assert keys == [f"saved/pytest.s3memory{extension}"]
+        assert not os.path.exists(tmp_path / "unused")
+        # Load the saved config back from memory
+        with monkeypatch.context() as m:
+            m.setattr(sys, "argv", ["", "--config", f"s3://{mock_s3_bucket}/{keys[0]}"])
+            loaded = ConfigArgBuilder(
+                NestedStuff, s3_config=s3_config, desc="Test Builder"
+            ).generate()
+        assert loaded.NestedStuff.one == 7
+        assert loaded.NestedStuff.two == "memory"
+
+    def test_in_memory_crypto_contents(self, s3_plain, tmp_path):
+        aws_session, s3_client = s3_plain
+        mock_s3_bucket = "spock-test"
+        s3_client.create_bucket(Bucket=mock_s3_bucket)
+        YAMLHandler()._write_crypto(
+            value=b"secret",
+            path=Path(f"s3://{mock_s3_bucket}/saved"),
+            name="pytest.s3memory.spock.cfg.yaml",
+            crypto_name="key",
+            create_path=False,
+            s3_config=_in_memory_config(aws_session, s3_client, tmp_path),
+        )
+        body = s3_client.get_object(
+            Bucket=mock_s3_bucket, Key="saved/pytest.s3memory.spock.cfg.key.yaml"
+        )["Body"]
+        assert yaml.safe_load(body.read()) == {"key": "secret"}
+        assert not os.path.exists(tmp_path / "unused")
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+import sys
+
+import pytest
+from boto3.s3.transfer import TransferConfig
+
+from spock import spock
+from spock.addons.s3 import S3Config
+from spock.addons.s3.utils import prefetch_s3
+from spock.builder import ConfigArgBuilder
+from tests.s3.fixtures_test import *
+
+
+@spock
+class TransferFirst:
+    x: int = 0
+
+
+@spock
+class TransferSecond:
+    y: float = 0.0
+
+
+@spock
+class TransferThird:
+    z: str = "none"
+
+
+@pytest.fixture
+def s3_includes(s3_plain, tmp_path):
+    aws_session, s3_client = s3_plain
+    bucket = "spock-transfer"
+    s3_client.create_bucket(Bucket=bucket)
+    files = {
+        "a/one.yaml": "TransferFirst:\n  x: 1\n",
+        "b/one.yaml": "TransferSecond:\n  y: 2.5\n",
+        "c/three.yaml": "TransferThird:\n  z: three\n",
+        "root.yaml": (
+            f"config: [s3://{bucket}/a/one.yaml, s3://{bucket}/b/one.yaml, "
+            f"s3://{bucket}/c/three.yaml]\nTransferFirst:\n  x: 10\n"
+        ),
+    }
+    for key, val in files.items():
+        s3_client.put_object(Bucket=bucket, Key=key, Body=val.encode())
+    return aws_session, s3_client, bucket, tmp_path
+
+
+class TestS3Transfer:
+    def test_parallel_include_download(self, monkeypatch, capsys, s3_includes):
+        aws_session, s3_client, bucket, tmp_path = s3_includes
+        s3_config = S3Config(
+            session=aws_session,
+            s3_session=s3_client,
+            temp_folder=str(tmp_path),
+            transfer_config=TransferConfig(max_concurrency=2),
+            show_progress=False,
+            max_workers=4,
+        )
+        with monkeypatch.context() as m:
+            m.setattr(sys, "argv", ["", "--config", f"s3://{bucket}/root.yaml"])
+            config = ConfigArgBuilder(
+                TransferFirst,
+                TransferSecond,
+                TransferThird,
+                s3_config=s3_config,
+                desc="Test Builder",
+            ).generate()
+        assert config.TransferFirst.x == 10
+        assert config.TransferSecond.y == 2.5
+        assert config.TransferThird.z == "three"
+        # All prefetched downloads were consumed and nothing was printed
+        assert s3_config._prefetched == {}
+        assert capsys.readouterr().out == ""
+
+    def test_prefetch_unique_temp_paths(self, s3_includes):
+        aws_session, s3_client, bucket, tmp_path = s3_includes
+        s3_config = S3Config(
+            session=aws_session,
+            s3_session=s3_client,
+            temp_folder=str(tmp_path),
+            show_progress=False,
+        )
+        uris = [f"s3://{bucket}/a/one.yaml", f"s3://{bucket}/b/one.yaml"]
+        prefetch_s3(uris + uris, s3_config)
+        assert set(s3_config._prefetched) == set(uris)
+        temp_paths = [s3_config._prefetched[val] for val in uris]
+        assert len(set(temp_paths)) == 2
+        with open(temp_paths[1]) as fid:
+            assert "TransferSecond" in fid.read()
+
+    def test_prefetch_skips_failures(self, s3_includes):
+        aws_session, s3_client, bucket, tmp_path = s3_includes
+        s3_config = S3Config(
+            session=aws_session,
+            s3_session=s3_client,
+            temp_folder=str(tmp_path),
+            show_progress=False,
+        )
+        prefetch_s3(
+            [f"s3://{bucket}/a/one.yaml", f"s3://{bucket}/missing.yaml"], s3_config
+        )
+        assert list(s3_config._prefetched) == [f"s3://{bucket}/a/one.yaml"]
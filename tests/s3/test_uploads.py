@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+import threading
+from pathlib import Path
+
+import pytest
+import yaml
+
+from spock.addons.s3 import S3Config, S3UploadQueue
+from spock.exceptions import _SpockS3UploadError
+from spock.handlers import YAMLHandler
+from tests.s3.fixtures_test import *
+
+
+class TestS3UploadQueue:
+    def test_submit_does_not_block(self):
+        release = threading.Event()
+        done = []
+
+        def upload(val):
+            release.wait(timeout=5)
+            done.append(val)
+
+        queue = S3UploadQueue(max_workers=2)
+        queue.submit(upload, 1)
+        queue.submit(upload, 2)
+        assert queue.pending == 2
+        assert done == []
+        release.set()
+        queue.flush()
+        assert sorted(done) == [1, 2]
+        assert queue.pending == 0
+        queue.close()
+
+    def test_flush_raises_failures(self):
+        def upload(val):
+            if val % 2 == 1:
+                raise IOError(f"failed {val}")
+
+        with pytest.raises(_SpockS3UploadError, match="2 of 4"):
+            with S3UploadQueue() as queue:
+                for val in range(4):
+                    queue.submit(upload, val)
+        # Failures are only raised once
+        queue.flush()
+
+    @pytest.mark.parametrize("in_memory", [False, True])
+    def test_queued_saves(self, s3_plain, tmp_path, in_memory):
+        aws_session, s3_client = s3_plain
+        mock_s3_bucket = "spock-test"
+        s3_client.create_bucket(Bucket=mock_s3_bucket)
+        with S3UploadQueue(max_workers=3) as queue:
+            s3_config = S3Config(
+                session=aws_session,
+                s3_session=s3_client,
+                temp_folder=str(tmp_path),
+                show_progress=False,
+                in_memory=in_memory,
+                upload_queue=queue,
+            )
+            YAMLHandler().save(
+                out_dict={"NestedStuff": {"one": 1, "two": "a"}},
+                info_dict=None,
+                library_dict=None,
+                path=Path(f"s3://{mock_s3_bucket}/saved"),
+                name="pytest.queued.spock.cfg.yaml",
+                s3_config=s3_config,
+                salt="salty",
+                key=b"keyed",
+            )
+        keys = sorted(
+            val["Key"]
+            for val in s3_client.list_objects(Bucket=mock_s3_bucket)["Contents"]
+        )
+        assert keys == [
+            "saved/pytest.queued.spock.cfg.key.yaml",
+            "saved/pytest.queued.spock.cfg.salt.yaml",
+            "saved/pytest.queued.spock.cfg.yaml",
+        ]
+
+    @pytest.mark.parametrize("in_memory", [False, True])
+    def test_back_to_back_queued_saves(self, s3_plain, tmp_path, in_memory):
+        aws_session, s3_client = s3_plain
+        mock_s3_bucket = "spock-test"
+        s3_client.create_bucket(Bucket=mock_s3_bucket)
+        release = threading.Event()
+        with S3UploadQueue(max_workers=1) as queue:
+            # Hold the single worker so both saves are queued before any upload runs
+            queue.submit(release.wait, 5)
+            s3_config = S3Config(
+                session=aws_session,
+                s3_session=s3_client,
+                temp_folder=str(tmp_path),
+                show_progress=False,
+                in_memory=in_memory,
+                upload_queue=queue,
+            )
+            for idx in ("a", "b"):
+                YAMLHandler().save(
+                    out_dict={"NestedStuff": {"one": 1, "two": idx}},
+                    info_dict=None,
+                    library_dict=None,
+                    path=Path(f"s3://{mock_s3_bucket}/saved/{idx}"),
+                    name="pytest.queued.spock.cfg.yaml",
+                    s3_config=s3_config,
+                    salt=f"salty_{idx}",
+                    key=b"keyed",
+                )
+            release.set()
+        for idx in ("a", "b"):
+            saved = yaml.safe_load(
+                s3_client.get_object(
+                    Bucket=mock_s3_bucket,
+                    Key=f"saved/{idx}/pytest.queued.spock.cfg.yaml",
+                )["Body"].read()
+            )
+            salt = yaml.safe_load(
+                s3_client.get_object(
+                    Bucket=mock_s3_bucket,
+                    Key=f"saved/{idx}/pytest.queued.spock.cfg.salt.yaml",
+                )["Body"].read()
+            )
+            assert saved == {"NestedStuff": {"one": 1, "two": idx}}
+            assert salt == {"salt": f"salty_{idx}"}
+        # Nothing is left behind in the temp folder
+        assert list(tmp_path.iterdir()) == []
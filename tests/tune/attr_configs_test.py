@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+from spock import spock
 from spock.addons.tune import ChoiceHyperParameter, RangeHyperParameter, spockTuner
 
 
@@ -23,3 +24,8 @@ class HPTwo:
 class LogisticRegressionHP:
     c: RangeHyperParameter
     solver: ChoiceHyperParameter
+
+
+@spock
+class CryptoFixed:
+    secret: str = "${spock.env.crypto:SPOCK_TUNE_SECRET, hush}"
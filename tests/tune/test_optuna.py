@@ -202,3 +202,33 @@ class TestIrisOptuna:
         # Clean up if assert is good
         if os.path.exists(fname):
             os.remove(fname)
+
+
+class TestOptunaCryptoSample:
+    @staticmethod
+    @pytest.fixture
+    def arg_builder(monkeypatch):
+        with monkeypatch.context() as m:
+            m.setattr(sys, "argv", ["", "--config", "./tests/conf/yaml/test_hp.yaml"])
+            optuna_config = OptunaTunerConfig(
+                study_name="Crypto Tests", direction="maximize"
+            )
+            config = ConfigArgBuilder(HPOne, HPTwo, CryptoFixed).tuner(optuna_config)
+            return config
+
+    def test_sample_salt_key(self, arg_builder):
+        sample = arg_builder.sample()
+        assert sample.__salt__ == arg_builder.salt
+        assert sample.__key__ == arg_builder.key
+
+    def test_save_tuner_sample(self, arg_builder, tmp_path):
+        arg_builder.save(
+            add_tuner_sample=True,
+            user_specified_path=tmp_path,
+            file_name="crypto",
+            extra_info=False,
+        )
+        saved = os.listdir(tmp_path)
+        assert any(val.endswith(".spock.cfg.yaml") for val in saved)
+        assert any(val.endswith(".salt.yaml") for val in saved)
+        assert any(val.endswith(".key.yaml") for val in saved)
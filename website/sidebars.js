@@ -129,6 +129,11 @@ module.exports = {
                     label: 'Evolve',
                     id: 'advanced_features/Evolve'
                 },
+                {
+                    type: 'doc',
+                    label: 'Batch Generation',
+                    id: 'advanced_features/Batch-Generation'
+                },
                 {
                     type: 'doc',
                     label: 'Resolvers',